@@ -14,6 +14,7 @@
         'views/province_views.xml',
         'views/district_views.xml',
         'views/commune_views.xml',
+        'views/administrative_import_wizard_views.xml',
         'menu/menu.xml',
     ],
     "installable": True,
@@ -1,3 +1,6 @@
+from . import administrative_hierarchy
+from . import administrative_import
 from . import province
 from . import district
-from . import commune
\ No newline at end of file
+from . import commune
+from . import administrative_import_wizard
\ No newline at end of file
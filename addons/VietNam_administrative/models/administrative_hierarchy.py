@@ -0,0 +1,127 @@
+from array import array
+from odoo import models, api  # type: ignore
+
+# Own cache instead of the registry ormcache, which an addon cannot extend with a
+# cache of its own: {dbname: (signaling sequence value, index)}. Invalidating it must
+# not clear the default ormcache (xmlids, access rights...) of every worker.
+_INDEX_CACHE = {}
+INDEX_SIGNALING_SEQUENCE = "administrative_hierarchy_index_signaling"
+INDEX_PENDING_KEY = "administrative_hierarchy.pending_index"
+INDEX_VERSION_KEY = "administrative_hierarchy.index_version"
+
+
+class AdministrativeHierarchy(models.AbstractModel):
+    _name = "administrative_hierarchy"
+    _description = "In-memory commune -> district -> province index"
+
+    def init(self):
+        self.env.cr.execute(f"CREATE SEQUENCE IF NOT EXISTS {INDEX_SIGNALING_SEQUENCE}")
+
+    # Model Method
+    @api.model
+    def _get_index(self):
+        """
+        Return a (district_province, commune_district) pair of integer arrays.
+        Each array is indexed by record id and holds the parent id (0 = unknown).
+        Inactive records are included so constraints behave like the ORM lookups.
+        The signaling sequence is read once per transaction, so lookups issue no SQL;
+        a transaction that changed districts or communes uses its own index until it commits.
+        """
+        cr = self.env.cr
+        data = cr.postcommit.data
+        pending = data.get(INDEX_PENDING_KEY)
+        if pending is not None:
+            if "index" not in pending:
+                pending["index"] = self._build_index()
+            return pending["index"]
+        version = data.get(INDEX_VERSION_KEY)
+        if version is None:
+            cr.execute(f"SELECT last_value FROM {INDEX_SIGNALING_SEQUENCE}")
+            version = data[INDEX_VERSION_KEY] = cr.fetchone()[0]
+        cached = _INDEX_CACHE.get(cr.dbname)
+        if cached and cached[0] >= version:
+            return cached[1]
+        # Sequences are not transactional: this snapshot may predate the change behind the
+        # version. A new transaction reads the version first, so its snapshot includes it.
+        with self.env.registry.cursor() as build_cr:
+            build_cr.execute(f"SELECT last_value FROM {INDEX_SIGNALING_SEQUENCE}")
+            build_version = build_cr.fetchone()[0]
+            index = self.with_env(self.env(cr=build_cr))._build_index()
+        cached = _INDEX_CACHE.get(cr.dbname)
+        if not cached or cached[0] < build_version:
+            _INDEX_CACHE[cr.dbname] = (build_version, index)
+        return index
+
+    @api.model
+    def _build_index(self):
+        self.env["district"].flush_model(["province_id"])
+        self.env["commune"].flush_model(["district_id"])
+        cr = self.env.cr
+        cr.execute("SELECT id, province_id FROM district")
+        district_rows = cr.fetchall()
+        cr.execute("SELECT id, district_id FROM commune")
+        commune_rows = cr.fetchall()
+
+        def _build(rows):
+            size = max((row[0] for row in rows), default=0) + 1
+            lookup = array("i", bytes(size * array("i").itemsize))
+            for rec_id, parent_id in rows:
+                lookup[rec_id] = parent_id or 0
+            return lookup
+
+        return _build(district_rows), _build(commune_rows)
+
+    @api.model
+    def province_of_district(self, district_id):
+        """Return the province id of a district id (0 if unknown)."""
+        if not isinstance(district_id, int) or not district_id:
+            return 0
+        district_province = self._get_index()[0]
+        if district_id >= len(district_province):
+            return 0
+        return district_province[district_id]
+
+    @api.model
+    def district_of_commune(self, commune_id):
+        """Return the district id of a commune id (0 if unknown)."""
+        if not isinstance(commune_id, int) or not commune_id:
+            return 0
+        commune_district = self._get_index()[1]
+        if commune_id >= len(commune_district):
+            return 0
+        return commune_district[commune_id]
+
+    @api.model
+    def check_chain(self, province_id, district_id, commune_id):
+        """
+        Validate a province/district/commune triple against the index.
+        :return: None if consistent, "district" or "commune" naming the broken link
+        """
+        if district_id and (
+            self.province_of_district(district_id) != (province_id or 0)
+        ):
+            return "district"
+        if commune_id and self.district_of_commune(commune_id) != (district_id or 0):
+            return "commune"
+        return None
+
+    @api.model
+    def invalidate_index(self):
+        """
+        Drop the cached index; called whenever districts or communes change.
+        Other workers rebuild theirs once the change is committed: uncommitted or
+        rolled back rows never reach the shared cache.
+        """
+        cr = self.env.cr
+        pending = cr.postcommit.data.get(INDEX_PENDING_KEY)
+        if pending is not None:
+            pending.pop("index", None)
+            return
+        cr.postcommit.data[INDEX_PENDING_KEY] = {}
+        registry = self.env.registry
+
+        @cr.postcommit.add
+        def _signal():
+            _INDEX_CACHE.pop(cr.dbname, None)
+            with registry.cursor() as signal_cr:
+                signal_cr.execute(f"SELECT nextval('{INDEX_SIGNALING_SEQUENCE}')")
@@ -0,0 +1,353 @@
+import csv
+import io
+import json
+import logging
+from odoo import models, fields, api  # type: ignore
+from odoo.exceptions import UserError, ValidationError  # type: ignore
+
+_logger = logging.getLogger(__name__)
+
+GAZETTEER_LEVELS = ("province", "district", "commune")
+NAME_FORBIDDEN_CHARS = r"@#$%&*<>?/|{}[]\\!+=;:,"
+MAX_REPORTED_ERRORS = 50
+
+
+class AdministrativeImport(models.AbstractModel):
+    _name = "administrative_import"
+    _description = "Bulk loader for provinces, districts and communes"
+
+    # Helper method
+    @api.model
+    def _parse_gazetteer(self, content, file_format="csv"):
+        """
+        Parse a gazetteer into {level: {code: row}}.
+        CSV needs the columns level, code, name, parent_code and optionally merged_into.
+        JSON is either a list of such objects or {"province": [...], "district": [...], "commune": [...]}.
+        """
+        if isinstance(content, bytes):
+            content = content.decode("utf-8-sig")
+
+        if file_format == "json":
+            try:
+                data = json.loads(content)
+            except ValueError as e:
+                raise UserError(f"❌ Error: Invalid JSON gazetteer: {e}")
+            if isinstance(data, dict):
+                raw_rows = [
+                    dict(row, level=level)
+                    for level in GAZETTEER_LEVELS
+                    for row in data.get(level) or []
+                ]
+            else:
+                raw_rows = data
+        else:
+            raw_rows = list(csv.DictReader(io.StringIO(content)))
+
+        parsed = {level: {} for level in GAZETTEER_LEVELS}
+        for line_no, row in enumerate(raw_rows, start=1):
+            if not isinstance(row, dict):
+                raise UserError(f"❌ Error: Row {line_no} is not an object!")
+            level = str(row.get("level") or "").strip().lower()
+            code = str(row.get("code") or "").strip()
+            if level not in parsed:
+                raise UserError(f"❌ Error: Row {line_no} has unknown level '{level}'!")
+            if not code:
+                raise UserError(f"❌ Error: Row {line_no} has no code!")
+            if code in parsed[level]:
+                raise UserError(f"❌ Error: Duplicate {level} code '{code}'!")
+            parsed[level][code] = {
+                "line": line_no,
+                "code": code,
+                "name": str(row.get("name") or "").strip(),
+                "parent_code": str(row.get("parent_code") or "").strip() or None,
+                "merged_into": str(row.get("merged_into") or "").strip() or None,
+            }
+        return parsed
+
+    @api.model
+    def _get_reserved_words(self):
+        """Reserved words rejected in unit names; extended by dependent modules."""
+        return frozenset()
+
+    @api.model
+    def _validate_gazetteer_names(self, parsed):
+        """Check every name of the gazetteer in a single pass and report all failures at once."""
+        reserved_words = self._get_reserved_words()
+        errors = []
+        for level in GAZETTEER_LEVELS:
+            for row in parsed[level].values():
+                name = row["name"]
+                clean_name = name.lower()
+                prefix = f"{level} {row['code']} (row {row['line']})"
+                if not name:
+                    errors.append(f"{prefix}: name cannot be empty")
+                elif len(name) > 100:
+                    errors.append(f"{prefix}: name cannot exceed 100 characters")
+                elif any(char in name for char in NAME_FORBIDDEN_CHARS):
+                    errors.append(f"{prefix}: name contains special characters")
+                else:
+                    match = next((w for w in reserved_words if w in clean_name), None)
+                    if match:
+                        errors.append(f"{prefix}: name contains reserved word '{match}'")
+        if errors:
+            shown = errors[:MAX_REPORTED_ERRORS]
+            if len(errors) > MAX_REPORTED_ERRORS:
+                shown.append(f"... and {len(errors) - MAX_REPORTED_ERRORS} more")
+            raise ValidationError("❌ Error: Invalid names in gazetteer:\n" + "\n".join(shown))
+
+    @api.model
+    def _empty_report(self):
+        return {
+            level: {"created": 0, "updated": 0, "renamed": [], "merged": [], "retired": []}
+            for level in GAZETTEER_LEVELS
+        }
+
+    @api.model
+    def _upsert_provinces(self, rows, retire_missing, report):
+        """Provinces are few and carry a computed sort key, so they go through the ORM."""
+        country = self.env["res.country"].search([("code", "=", "VN")], limit=1)
+        if not country:
+            raise UserError("❌ Error: Country 'VN' not found!")
+
+        State = self.env["res.country.state"].with_context(active_test=False)
+        existing = {
+            state.code: state
+            for state in State.search([("country_id", "=", country.id)])
+        }
+        level_report = report["province"]
+
+        to_create = []
+        for code, row in rows.items():
+            state = existing.get(code)
+            active = not row["merged_into"]
+            if not state:
+                if active:
+                    to_create.append(
+                        {"country_id": country.id, "code": code, "name": row["name"]}
+                    )
+                continue
+            vals = {}
+            if state.name != row["name"]:
+                level_report["renamed"].append((code, state.name, row["name"]))
+                vals["name"] = row["name"]
+            if state.active != active:
+                vals["active"] = active
+            if not active:
+                level_report["merged"].append((code, row["name"], row["merged_into"]))
+            if vals:
+                state.write(vals)
+                level_report["updated"] += 1
+
+        if to_create:
+            for state in State.create(to_create):
+                existing[state.code] = state
+            level_report["created"] += len(to_create)
+
+        if retire_missing:
+            missing = State.browse(
+                [s.id for code, s in existing.items() if code not in rows and s.active]
+            )
+            if missing:
+                level_report["retired"] += [(s.code, s.name) for s in missing]
+                missing.write({"active": False})
+
+        return {code: state.id for code, state in existing.items()}
+
+    @api.model
+    def _existing_units(self, table):
+        """Return {code: (id, province_id)} for the units of a table."""
+        self.env.cr.execute(
+            f"SELECT code, id, province_id FROM {table} WHERE code IS NOT NULL"
+        )
+        return {
+            code: (rec_id, province_id)
+            for code, rec_id, province_id in self.env.cr.fetchall()
+        }
+
+    @api.model
+    def _copy_stage(self, records):
+        """(Re)create the staging table and COPY the given tuples into it."""
+        cr = self.env.cr
+        cr.execute("DROP TABLE IF EXISTS administrative_import_stage")
+        cr.execute(
+            """
+            CREATE TEMP TABLE administrative_import_stage (
+                code VARCHAR PRIMARY KEY,
+                name VARCHAR NOT NULL,
+                parent_id INTEGER,
+                province_id INTEGER,
+                merged_into VARCHAR
+            ) ON COMMIT DROP
+            """
+        )
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for record in records:
+            writer.writerow(["" if value is None else value for value in record])
+        buffer.seek(0)
+        cr.copy_expert(
+            "COPY administrative_import_stage (code, name, parent_id, province_id, merged_into) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+        cr.execute("ANALYZE administrative_import_stage")
+
+    @api.model
+    def _upsert_units(self, table, parent_column, records, retire_missing, level_report):
+        """
+        Set-based upsert of staged district/commune rows keyed by official code.
+        Bypasses the ORM so no chatter, tracking values or per-row constraints are produced.
+        """
+        cr = self.env.cr
+        now = fields.Datetime.now()
+        uid = self.env.uid
+        self._copy_stage(records)
+
+        # Units created before codes existed are adopted by (name, parent)
+        cr.execute(
+            f"""
+            UPDATE {table} t SET code = s.code
+              FROM administrative_import_stage s
+             WHERE t.code IS NULL
+               AND t.name = s.name
+               AND t.{parent_column} = s.parent_id
+               AND NOT EXISTS (SELECT 1 FROM {table} x WHERE x.code = s.code)
+            """
+        )
+
+        cr.execute(
+            f"""
+            SELECT t.code, t.name, s.name
+              FROM {table} t
+              JOIN administrative_import_stage s ON s.code = t.code
+             WHERE t.name <> s.name
+            """
+        )
+        level_report["renamed"] += cr.fetchall()
+
+        cr.execute(
+            """
+            SELECT s.code, s.name, s.merged_into
+              FROM administrative_import_stage s
+             WHERE s.merged_into IS NOT NULL
+            """
+        )
+        level_report["merged"] += cr.fetchall()
+
+        # Districts hang directly off a province; communes also keep a denormalized province
+        tracked = [parent_column] + (["province_id"] if parent_column != "province_id" else [])
+        staged = ["s.parent_id"] + (["s.province_id"] if parent_column != "province_id" else [])
+        cr.execute(
+            f"""
+            UPDATE {table} t
+               SET name = s.name,
+                   {", ".join(f"{col} = {val}" for col, val in zip(tracked, staged))},
+                   active = s.merged_into IS NULL,
+                   write_uid = %s,
+                   write_date = %s
+              FROM administrative_import_stage s
+             WHERE t.code = s.code
+               AND (t.name, {", ".join(f"t.{col}" for col in tracked)}, t.active)
+                   IS DISTINCT FROM
+                   (s.name, {", ".join(staged)}, s.merged_into IS NULL)
+            """,
+            (uid, now),
+        )
+        level_report["updated"] += cr.rowcount
+
+        cr.execute(
+            f"""
+            INSERT INTO {table}
+                   (code, name, {", ".join(tracked)}, active,
+                    create_uid, create_date, write_uid, write_date)
+            SELECT s.code, s.name, {", ".join(staged)}, TRUE, %s, %s, %s, %s
+              FROM administrative_import_stage s
+             WHERE s.merged_into IS NULL
+               AND NOT EXISTS (SELECT 1 FROM {table} t WHERE t.code = s.code)
+            """,
+            (uid, now, uid, now),
+        )
+        level_report["created"] += cr.rowcount
+
+        if retire_missing:
+            cr.execute(
+                f"""
+                UPDATE {table} t
+                   SET active = FALSE, write_uid = %s, write_date = %s
+                 WHERE t.active
+                   AND t.code IS NOT NULL
+                   AND NOT EXISTS (
+                       SELECT 1 FROM administrative_import_stage s WHERE s.code = t.code
+                   )
+             RETURNING t.code, t.name
+                """,
+                (uid, now),
+            )
+            level_report["retired"] += cr.fetchall()
+
+    # Model Method
+    @api.model
+    def load_gazetteer(self, content, file_format="csv", retire_missing=False):
+        """
+        Upsert provinces, districts and communes from a gazetteer in bulk.
+        :param content: CSV/JSON text or bytes
+        :param file_format: 'csv' or 'json'
+        :param retire_missing: archive coded units that are absent from the gazetteer
+        :return: report {level: {created, updated, renamed, merged, retired}}
+        """
+        self.env["district"].check_access("create")
+        self.env["commune"].check_access("create")
+
+        parsed = self._parse_gazetteer(content, file_format)
+        self._validate_gazetteer_names(parsed)
+
+        District = self.env["district"]
+        Commune = self.env["commune"]
+        District.flush_model()
+        Commune.flush_model()
+
+        report = self._empty_report()
+        province_ids = self._upsert_provinces(parsed["province"], retire_missing, report)
+
+        errors = []
+        district_records = []
+        for code, row in parsed["district"].items():
+            province_id = province_ids.get(row["parent_code"])
+            if not province_id:
+                errors.append(f"district {code}: unknown province '{row['parent_code']}'")
+                continue
+            district_records.append(
+                (code, row["name"], province_id, province_id, row["merged_into"])
+            )
+        if errors:
+            raise ValidationError("❌ Error:\n" + "\n".join(errors[:MAX_REPORTED_ERRORS]))
+        self._upsert_units(
+            "district", "province_id", district_records, retire_missing, report["district"]
+        )
+
+        districts = self._existing_units("district")
+        commune_records = []
+        for code, row in parsed["commune"].items():
+            district = districts.get(row["parent_code"])
+            if not district:
+                errors.append(f"commune {code}: unknown district '{row['parent_code']}'")
+                continue
+            commune_records.append(
+                (code, row["name"], district[0], district[1], row["merged_into"])
+            )
+        if errors:
+            raise ValidationError("❌ Error:\n" + "\n".join(errors[:MAX_REPORTED_ERRORS]))
+        self._upsert_units(
+            "commune", "district_id", commune_records, retire_missing, report["commune"]
+        )
+
+        District.invalidate_model()
+        Commune.invalidate_model()
+        self.env["administrative_hierarchy"].invalidate_index()
+
+        _logger.info(
+            "Gazetteer import: %s",
+            {level: {k: v if isinstance(v, int) else len(v) for k, v in r.items()}
+             for level, r in report.items()},
+        )
+        return report
@@ -0,0 +1,70 @@
+import base64
+from odoo import models, fields, api  # type: ignore
+from odoo.exceptions import UserError  # type: ignore
+
+
+class AdministrativeImportWizard(models.TransientModel):
+    _name = "administrative_import_wizard"
+    _description = "Wizard used to bulk import an administrative gazetteer"
+
+    # Attributes
+    file = fields.Binary(string="Gazetteer", required=True)
+    filename = fields.Char(string="File Name")
+    file_format = fields.Selection(
+        [("csv", "CSV"), ("json", "JSON")],
+        string="Format",
+        default="csv",
+        required=True,
+    )
+    retire_missing = fields.Boolean(
+        string="Archive Missing Units",
+        help="Archive coded provinces, districts and communes that are not in the file",
+    )
+    result = fields.Text(string="Result", readonly=True)
+
+    # Onchange
+    @api.onchange("filename")
+    def _onchange_filename(self):
+        if self.filename and self.filename.lower().endswith(".json"):
+            self.file_format = "json"
+        elif self.filename:
+            self.file_format = "csv"
+
+    # Action
+    def action_import(self):
+        self.ensure_one()
+        if not self.file:
+            raise UserError("❌ Error: Please upload a gazetteer file.")
+
+        report = self.env["administrative_import"].load_gazetteer(
+            base64.b64decode(self.file),
+            file_format=self.file_format,
+            retire_missing=self.retire_missing,
+        )
+        self.result = self._format_report(report)
+        return {
+            "type": "ir.actions.act_window",
+            "res_model": self._name,
+            "res_id": self.id,
+            "view_mode": "form",
+            "target": "new",
+        }
+
+    # Helper method
+    def _format_report(self, report):
+        lines = []
+        for level, level_report in report.items():
+            lines.append(
+                f"{level.capitalize()}: {level_report['created']} created, "
+                f"{level_report['updated']} updated, "
+                f"{len(level_report['renamed'])} renamed, "
+                f"{len(level_report['merged'])} merged, "
+                f"{len(level_report['retired'])} retired"
+            )
+            for code, old_name, new_name in level_report["renamed"]:
+                lines.append(f"  renamed {code}: {old_name} -> {new_name}")
+            for code, name, target in level_report["merged"]:
+                lines.append(f"  merged {code} {name} -> {target}")
+            for code, name in level_report["retired"]:
+                lines.append(f"  retired {code} {name}")
+        return "\n".join(lines)
@@ -12,6 +12,11 @@ class Commune(models.Model):
     # Attributes
     active = fields.Boolean(string="Active", default=True, tracking=True)
     name = fields.Char(string="Commune", tracking=True, required=True)
+    code = fields.Char(
+        string="Official Code",
+        tracking=True,
+        help="Code from the official gazetteer, used to match units on bulk import",
+    )
 
     # Relationship Attributes
     province_id = fields.Many2one(
@@ -36,17 +41,23 @@ class Commune(models.Model):
             "UNIQUE(name,district_id,province_id)",
             "This name already exists!",
         ),  # Ensure uniqueness
+        (
+            "commune_unique_code",
+            "UNIQUE(code)",
+            "This official code already exists!",
+        ),
     ]
 
     @api.constrains("district_id", "province_id")
     def _check_district_province(self):
+        hierarchy = self.env["administrative_hierarchy"]
         for record in self:
             if not record.province_id:
                 raise ValidationError("No province/city selected!")
             if (
                 record.district_id
-                and record.province_id
-                and record.district_id.province_id != record.province_id
+                and hierarchy.province_of_district(record.district_id.id)
+                != record.province_id.id
             ):
                 raise ValidationError(
                     f"❌ Error: District '{record.district_id.name}' does not belong to province '{record.province_id.name}'!"
@@ -56,12 +67,14 @@ class Commune(models.Model):
     @api.onchange("province_id")
     def _onchange_province_id(self):
         """Reset district when province changes and update domain"""
+        hierarchy = self.env["administrative_hierarchy"]
         for record in self:
             if record.province_id:
                 # Clear district if it doesn't belong to the new province
                 if (
                     record.district_id
-                    and record.district_id.province_id != record.province_id
+                    and hierarchy.province_of_district(record.district_id.id)
+                    != record.province_id.id
                 ):
                     record.district_id = False
                 return {
@@ -73,3 +86,21 @@ class Commune(models.Model):
                 # Clear district if province is cleared
                 record.district_id = False
                 return {"domain": {"district_id": []}}
+
+    # Model Method
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env["administrative_hierarchy"].invalidate_index()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "district_id" in vals:
+            self.env["administrative_hierarchy"].invalidate_index()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env["administrative_hierarchy"].invalidate_index()
+        return res
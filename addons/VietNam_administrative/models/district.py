@@ -12,6 +12,11 @@ class District(models.Model):
     # Attributes
     active = fields.Boolean(string="Active", default=True, tracking=True)
     name = fields.Char(string="District", tracking=True, required=True)
+    code = fields.Char(
+        string="Official Code",
+        tracking=True,
+        help="Code from the official gazetteer, used to match units on bulk import",
+    )
 
     # Relationship Attributes
     province_id = fields.Many2one(
@@ -32,4 +37,27 @@ class District(models.Model):
             "UNIQUE(name,province_id)",
             "This name already exists!",
         ),  # Ensure uniqueness
+        (
+            "district_unique_code",
+            "UNIQUE(code)",
+            "This official code already exists!",
+        ),
     ]
+
+    # Model Method
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env["administrative_hierarchy"].invalidate_index()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "province_id" in vals:
+            self.env["administrative_hierarchy"].invalidate_index()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env["administrative_hierarchy"].invalidate_index()
+        return res
@@ -1,2 +1,3 @@
 from . import models
-from . import controllers
\ No newline at end of file
+from . import controllers
+from . import cli
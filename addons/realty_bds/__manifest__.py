@@ -60,6 +60,8 @@
         "views/realty_Product_wizard_views.xml",
         "views/realty_User_Evaluation_wizard_views.xml",
         "views/realty_user_evaluation_views.xml",
+        "views/realty_signup_job_views.xml",
+        "views/realty_perf_sample_views.xml",
 				"views/hr_employee_views.xml",
 				"views/hr_employee_wizard_views.xml",
         # templates
@@ -83,6 +85,7 @@
         "data/res_users.xml",
         #"data/data_recycle.xml",  # comment this line before install module realty_bds, then uncomment it and upgrade module to have feature of auto clean orphaned attachments
         "data/permission_tracker.xml",
+        "data/ir_cron.xml",
         # security
         "security/ir.model.access.csv",
     ],
@@ -124,6 +127,7 @@
             "realty_bds/static/src/many2many_image/xml/many2many_image.xml",
             # js
             "realty_bds/static/src/many2many_image/js/constants.js",
+            "realty_bds/static/src/many2many_image/js/image_downscaler.js",
             "realty_bds/static/src/many2many_image/js/validated_file_input.js",
             "realty_bds/static/src/many2many_image/js/photo_lightbox.js",
             "realty_bds/static/src/many2many_image/js/many2many_image.js",
@@ -146,8 +150,11 @@
             # scss
             "realty_bds/static/src/realty_comment/scss/realty_comment_dialog.scss",
             # realty_notify
+            # js
+            "realty_bds/static/src/realty_notify/js/inbox_listener.js",
             # css
             "realty_bds/static/src/realty_notify/css/notify_kanban.css",
+            "realty_bds/static/src/realty_notify/css/notify_message.css",
             # moderator_guideline
             # xml
             "realty_bds/static/src/moderator_guideline/xml/moderator_guideline_info.xml",
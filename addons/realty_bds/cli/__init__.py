@@ -0,0 +1,2 @@
+from . import realty_generate
+from . import realty_load_assign
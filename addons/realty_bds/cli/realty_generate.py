@@ -0,0 +1,80 @@
+import argparse
+import logging
+import sys
+import time
+
+from odoo import api, SUPERUSER_ID  # type: ignore
+from odoo.cli import Command  # type: ignore
+from odoo.modules.registry import Registry  # type: ignore
+from odoo.tools import config  # type: ignore
+from odoo.addons.realty_bds.models.realty_data_generator import (  # type: ignore
+    GENERATOR_SKEW,
+    GENERATOR_VOLUMES,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+class RealtyGenerate(Command):
+    """Fill a realty database with synthetic data at production scale"""
+
+    name = "realty_generate"
+
+    def run(self, cmdargs):
+        parser = argparse.ArgumentParser(
+            prog=f"{sys.argv[0].split('/')[-1]} {self.name}",
+            description=self.__doc__,
+            epilog="Other arguments (-c, -d, --db_host, ...) are passed to the Odoo configuration.",
+        )
+        for key, value in GENERATOR_VOLUMES.items():
+            parser.add_argument(
+                f"--{key.replace('_', '-')}",
+                dest=key,
+                type=int,
+                default=value,
+                help=f"number of {key.replace('_', ' ')} (default {value})",
+            )
+        parser.add_argument(
+            "--scale",
+            type=float,
+            default=1.0,
+            help="multiply the listing, user, commune, attachment and comment volumes",
+        )
+        parser.add_argument(
+            "--skew",
+            type=float,
+            default=GENERATOR_SKEW,
+            help="power-law exponent of hot communes, owners and threads (1 = uniform)",
+        )
+        parser.add_argument(
+            "--reply-ratio", type=float, default=0.3, help="share of comments that are replies"
+        )
+        parser.add_argument("--prefix", default="Synthetic", help="name prefix of generated records")
+        args, odoo_args = parser.parse_known_args(cmdargs)
+
+        config.parse_config(odoo_args)
+        dbname = config["db_name"]
+        if not dbname or "," in dbname:
+            sys.exit("❌ Error: select exactly one database with -d.")
+
+        scaled = ("communes", "users", "listings", "attachments", "comments")
+        volumes = {
+            key: max(1, int(getattr(args, key) * args.scale)) if key in scaled else getattr(args, key)
+            for key in GENERATOR_VOLUMES
+        }
+        start = time.perf_counter()
+        with Registry(dbname).cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {"tracking_disable": True})
+            data = env["realty_data_generator"].generate(
+                volumes=volumes,
+                skew=args.skew,
+                reply_ratio=args.reply_ratio,
+                commit=True,
+                prefix=args.prefix,
+            )
+        _logger.info(
+            "Realty data generator: %s (%s) generated in %.1fs",
+            data["tag"],
+            volumes,
+            time.perf_counter() - start,
+        )
@@ -0,0 +1,161 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import sys
+import time
+
+from odoo import api, sql_db, SUPERUSER_ID  # type: ignore
+from odoo.cli import Command  # type: ignore
+from odoo.modules.registry import Registry  # type: ignore
+from odoo.tools import config  # type: ignore
+from odoo.addons.realty_bds.models.realty_assignment_load import (  # type: ignore
+    ASSIGNMENT_MODELS,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+def _time_advisory_locks(cr):
+    """Accumulate the time this cursor spends in pg_advisory_xact_lock (ms)."""
+    waited = [0.0]
+    execute = cr.execute
+
+    def timed_execute(query, params=None, log_exceptions=True):
+        if "pg_advisory_xact_lock" not in str(query):
+            return execute(query, params, log_exceptions)
+        start = time.perf_counter()
+        try:
+            return execute(query, params, log_exceptions)
+        finally:
+            waited[0] += (time.perf_counter() - start) * 1000
+
+    cr.execute = timed_execute
+    return waited
+
+
+def _run_job(registry, job, worker):
+    result = dict(job, worker=worker, moderator_id=None, ticket=None, lock_wait_ms=0.0, error=None)
+    start = time.perf_counter()
+    try:
+        with registry.cursor() as cr:
+            waited = _time_advisory_locks(cr)
+            env = api.Environment(cr, job["uid"], {"allowed_company_ids": [job["company_id"]]})
+            record = env[job["model"]].browse(job["res_id"])
+            getattr(record, job["action"])()
+            env.flush_all()
+            # Still holding the advisory lock: the counter is the number this call drew
+            cr.execute(
+                """
+                SELECT sum(assignment_count) FROM moderator_assignment_sequence
+                 WHERE company_id = %s AND model_name = %s
+                """,
+                (job["company_id"], job["model"]),
+            )
+            result["ticket"] = cr.fetchone()[0]
+            result["moderator_id"] = record.moderator_id.id or None
+            result["lock_wait_ms"] = waited[0]
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+    result["duration_ms"] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def _worker(dbname, worker, jobs, results, barrier):
+    registry = Registry(dbname)
+    barrier.wait()
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        results.put(_run_job(registry, job, worker))
+    results.put(None)
+
+
+class RealtyLoadAssign(Command):
+    """Fire concurrent action_send/action_resend calls and check the moderator assignment"""
+
+    name = "realty_load_assign"
+
+    def run(self, cmdargs):
+        parser = argparse.ArgumentParser(
+            prog=f"{sys.argv[0].split('/')[-1]} {self.name}",
+            description=self.__doc__,
+            epilog="Other arguments (-c, -d, --db_host, ...) are passed to the Odoo configuration.",
+        )
+        parser.add_argument("--workers", type=int, default=8, help="concurrent processes")
+        parser.add_argument("--companies", type=int, default=2)
+        parser.add_argument("--moderators", type=int, default=5, help="moderators per company")
+        parser.add_argument("--posters", type=int, default=10, help="posting agents per company")
+        parser.add_argument("--posts", type=int, default=50, help="posts per company and model")
+        parser.add_argument(
+            "--models",
+            default=",".join(ASSIGNMENT_MODELS),
+            help="comma-separated models to submit (default: all)",
+        )
+        parser.add_argument(
+            "--resend-ratio", type=float, default=0.3, help="share of rejected posts to resend"
+        )
+        parser.add_argument("--seed", type=int, default=42, help="job order shuffle seed")
+        parser.add_argument("--output", help="write the JSON report to this file")
+        args, odoo_args = parser.parse_known_args(cmdargs)
+
+        config.parse_config(odoo_args)
+        dbname = config["db_name"]
+        if not dbname or "," in dbname:
+            sys.exit("❌ Error: select exactly one database with -d.")
+
+        with Registry(dbname).cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            plan = env["realty_assignment_load"].prepare(
+                companies=args.companies,
+                moderators=args.moderators,
+                posters=args.posters,
+                posts=args.posts,
+                model_names=[m.strip() for m in args.models.split(",") if m.strip()],
+                resend_ratio=args.resend_ratio,
+                seed=args.seed,
+            )
+        # Workers are forked: none of them may inherit the parent's connections
+        Registry.delete_all()
+        sql_db.close_all()
+
+        context = multiprocessing.get_context("fork")
+        jobs, results = context.Queue(), context.Queue()
+        for job in plan["jobs"]:
+            jobs.put(job)
+        for _worker_index in range(args.workers):
+            jobs.put(None)
+        barrier = context.Barrier(args.workers + 1)
+        processes = [
+            context.Process(target=_worker, args=(dbname, index, jobs, results, barrier))
+            for index in range(args.workers)
+        ]
+        for process in processes:
+            process.start()
+        barrier.wait()
+        start = time.perf_counter()
+        collected, finished = [], 0
+        while finished < args.workers:
+            result = results.get()
+            if result is None:
+                finished += 1
+            else:
+                collected.append(result)
+        wall_seconds = time.perf_counter() - start
+        for process in processes:
+            process.join()
+
+        with Registry(dbname).cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            report = env["realty_assignment_load"].analyze(plan, collected, wall_seconds)
+        report["workers"] = args.workers
+        output = json.dumps(report, indent=2, sort_keys=True)
+        if args.output:
+            with open(args.output, "w") as file:
+                file.write(output)
+            _logger.info("Assignment load report written to %s", args.output)
+        else:
+            print(output)
+        if not report["ok"]:
+            sys.exit(1)
@@ -1,4 +1,8 @@
 from . import realtycontroller_signup
 from . import realtycontroller_hash
 from . import realtycontroller_my_profile
-from . import realtycontroller_binary
\ No newline at end of file
+from . import realtycontroller_binary
+from . import realtycontroller_upload
+from . import realtycontroller_perf
+from . import realtycontroller_card
+from . import realtycontroller_changes
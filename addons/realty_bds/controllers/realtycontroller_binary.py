@@ -8,6 +8,7 @@ from odoo.http import request  # type: ignore
 from odoo.exceptions import AccessError, UserError  # type: ignore
 from odoo.tools import str2bool  # type: ignore
 from odoo.tools.image import image_guess_size_from_field_name  # type: ignore
+from odoo.addons.realty_bds.models.realty_perf import instrument  # type: ignore
 
 _logger = logging.getLogger(__name__)
 
@@ -357,6 +358,7 @@ class BinaryController(http.Controller):
         auth="public",
         readonly=True,
     )
+    @instrument(kind="controller")
     def content_protected(
         self,
         attachment_id,
@@ -457,6 +459,7 @@ class BinaryController(http.Controller):
         auth="public",
         readonly=True,
     )
+    @instrument(kind="controller")
     def image_protected(
         self,
         xmlid=None,
@@ -562,6 +565,7 @@ class BinaryController(http.Controller):
 
 class AttachmentMetaFastpathController(http.Controller):
     @http.route("/realty/attachment/meta_fastpath", type="json", auth="user")
+    @instrument(kind="controller")
     def attachment_meta_fastpath(self, attachment_ids, model=None, field=None):
         """
         Batch-optimized fast-path-only metadata endpoint.
@@ -0,0 +1,19 @@
+# controllers/realtycontroller_card.py
+from odoo import http  # type: ignore
+from odoo.http import request  # type: ignore
+from odoo.addons.realty_bds.models.realty_perf import instrument  # type: ignore
+
+
+class RealtyCardController(http.Controller):
+    @http.route("/realty/product/cards", type="json", auth="user")
+    @instrument(kind="controller")
+    def product_cards(self, domain=None, limit=40, offset=0, order=None, with_count=False):
+        """
+        Card feed of the listing kanban: only the fields a card shows, already formatted.
+        with_count adds the number of matching listings for the pager.
+        """
+        Product = request.env["product.template"]
+        result = {"cards": Product.get_card_feed(domain, limit=limit, offset=offset, order=order)}
+        if with_count:
+            result["length"] = Product.search_count(domain or [])
+        return result
@@ -0,0 +1,44 @@
+# controllers/realtycontroller_changes.py
+import time
+
+import odoo  # type: ignore
+from odoo import http  # type: ignore
+from odoo.http import request  # type: ignore
+from odoo.tools import config  # type: ignore
+from odoo.addons.realty_bds.models.realty_change_feed import FEED_READ_LIMIT  # type: ignore
+
+FEED_MAX_WAIT = 20
+FEED_POLL_INTERVAL = 1.0
+
+
+def _feed_max_wait():
+    """
+    Longest wait a request may hold. A waiting request keeps its worker: in a prefork
+    HTTP worker (--workers > 0) that is a whole process, so the endpoint answers at once
+    and consumers poll; only the threaded or gevent server can afford to wait.
+    """
+    if config["workers"] and not odoo.evented:
+        return 0
+    return FEED_MAX_WAIT
+
+
+class RealtyChangeFeedController(http.Controller):
+    @http.route("/realty/changes", type="json", auth="user")
+    def changes(self, cursor=0, limit=FEED_READ_LIMIT, models=None, timeout=15):
+        """
+        Long poll: answer as soon as changes after cursor are published, or with an
+        empty page once timeout (seconds, at most FEED_MAX_WAIT) has elapsed.
+        Requires the threaded or gevent server to wait, prefork workers answer at once
+        (see _feed_max_wait). Consumers pass the returned cursor to the next call.
+        """
+        request.env["realty_change_feed"]._check_feed_access()
+        deadline = time.monotonic() + min(max(float(timeout or 0), 0), _feed_max_wait())
+        while True:
+            # A fresh transaction per round, so commits of other workers become visible
+            with request.env.registry.cursor() as cr:
+                result = request.env(cr=cr)["realty_change_feed"].read_changes(
+                    cursor, limit, models
+                )
+            if result["changes"] or time.monotonic() >= deadline:
+                return result
+            time.sleep(FEED_POLL_INTERVAL)
@@ -1,10 +1,12 @@
 import hashlib
 from odoo import http  # type: ignore
+from odoo.addons.realty_bds.models.realty_perf import instrument  # type: ignore
 
 
 class HashController(http.Controller):
 
     @http.route("/compute_hash_img_string", type="json", auth="user")
+    @instrument(kind="controller")
     def compute_hash(self, salt, data):
         params = http.request.env["ir.config_parameter"].sudo()
         specialSalt = params.get_param("realty_bds.specialSalt")
@@ -0,0 +1,19 @@
+# controllers/realtycontroller_perf.py
+from odoo import http  # type: ignore
+from odoo.http import request  # type: ignore
+from odoo.exceptions import AccessError  # type: ignore
+from odoo.addons.realty_bds.models.realty_perf import worker_snapshot  # type: ignore
+
+
+class RealtyPerfController(http.Controller):
+    @http.route("/realty/perf/stats", type="json", auth="user")
+    def perf_stats(self):
+        """
+        Latency, SQL and ORM cache histogram of the worker answering this request
+        (last ROLLING_MINUTES). All workers are merged in realty_perf_sample.
+        """
+        if not request.env.user.has_group("base.group_system"):
+            raise AccessError("Only administrators can read performance statistics.")
+        snapshot = worker_snapshot()
+        snapshot["calls"] = snapshot["calls"].get(request.db, {})
+        return snapshot
@@ -2,10 +2,39 @@ from odoo import http  # type: ignore
 from odoo.http import request  # type: ignore
 from odoo.addons.auth_signup.controllers.main import AuthSignupHome  # type: ignore
 import base64
+import hashlib
 import logging
+import os
+import tempfile
+from odoo.addons.realty_bds.models.realty_perf import instrument  # type: ignore
 
 _logger = logging.getLogger(__name__)
 
+# Allowed MIME types with the magic bytes their content must start with
+ALLOWED_DOCUMENT_TYPES = {
+    "image/jpeg": (b"\xff\xd8\xff",),
+    "image/png": (b"\x89PNG\r\n\x1a\n",),
+    "image/gif": (b"GIF87a", b"GIF89a"),
+    "image/webp": (b"RIFF",),
+    "image/bmp": (b"BM",),
+    "application/pdf": (b"%PDF",),
+    "application/msword": (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",),
+}
+
+# Maximum file size (10MB)
+MAX_DOCUMENT_SIZE = 10 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _magic_matches(mimetype, head):
+    """Check the first bytes of a file against the signature of its declared type."""
+    signatures = ALLOWED_DOCUMENT_TYPES.get(mimetype)
+    if not signatures:
+        return False
+    if mimetype == "image/webp" and head[8:12] != b"WEBP":
+        return False
+    return any(head.startswith(signature) for signature in signatures)
+
 
 class CustomAuthSignupHome(AuthSignupHome):
 
@@ -75,22 +104,21 @@ class CustomAuthSignupHome(AuthSignupHome):
                             {"company_id": evaluation_fields["signup_company_id"]}
                         )
 
-                    # Create user evaluation record and get the record
-                    user_eval = user.notify_signup_moderator(
-                        user_data=evaluation_fields
+                    # Evaluation, moderator notification and documents run in the background
+                    request.env["signup_job"].sudo().enqueue(
+                        user, evaluation_fields, file_data_list
                     )
 
-                    # Process and attach uploaded files to user_evaluation
-                    if file_data_list and user_eval:
-                        self._process_uploaded_files(user_eval, file_data_list)
-
             except Exception as e:
                 _logger.error("Failed to assign company to user: %s", str(e))
 
         return result
 
     def _extract_file_data(self):
-        """Extract multiple file data from request"""
+        """
+        Stream every uploaded identity document straight into the filestore.
+        Returns JSON-serializable staged file descriptors (no file content is kept in memory).
+        """
         file_data_list = []
 
         try:
@@ -101,17 +129,13 @@ class CustomAuthSignupHome(AuthSignupHome):
                 _logger.info("No files uploaded during signup")
                 return file_data_list
 
+            Attachment = request.env["ir.attachment"].sudo()
             for uploaded_file in files:
                 if uploaded_file and uploaded_file.filename:
                     try:
-                        file_content = uploaded_file.read()
-                        file_data_list.append(
-                            {
-                                "filename": uploaded_file.filename,
-                                "content": file_content,
-                                "content_type": uploaded_file.content_type,
-                            }
-                        )
+                        staged = self._stream_to_filestore(Attachment, uploaded_file)
+                        if staged:
+                            file_data_list.append(staged)
                     except Exception as e:
                         _logger.error(
                             "Error reading file %s: %s", uploaded_file.filename, str(e)
@@ -122,97 +146,90 @@ class CustomAuthSignupHome(AuthSignupHome):
 
         return file_data_list
 
-    def _process_uploaded_files(self, user_eval, file_data_list):
+    def _stream_to_filestore(self, Attachment, uploaded_file):
         """
-        Create ir.attachment records and link them to user_evaluation.
-        Odoo automatically handles filestore storage when you provide 'datas' field.
+        Copy one upload to the filestore chunk by chunk while hashing it.
+        MIME type and magic bytes are checked on the first chunk and the size
+        limit as chunks arrive, so rejected files are never read completely.
         """
-        if not user_eval or not user_eval.exists():
-            _logger.error("user_evaluation record does not exist")
-            return
-
-        if not file_data_list:
-            _logger.info("No files to process for user_evaluation %s", user_eval.id)
-            return
-
-        # Allowed MIME types
-        allowed_types = [
-            "image/jpeg",
-            "image/png",
-            "image/gif",
-            "image/webp",
-            "image/bmp",
-            "application/pdf",
-            "application/msword",
-        ]
-
-        # Maximum file size (10MB)
-        max_size = 10 * 1024 * 1024
-
-        Attachment = request.env["ir.attachment"].sudo()
-        created_attachments = []
-
-        for file_data in file_data_list:
-            try:
-                content = file_data.get("content", b"")
-                filename = file_data.get("filename", "file.bin")
-                mimetype = file_data.get("content_type", "application/octet-stream")
-
-                # Server-side validation
-                if mimetype not in allowed_types:
-                    _logger.warning(
-                        "Rejected file %s: invalid type %s", filename, mimetype
-                    )
-                    continue
-
-                # Size check
-                if len(content) > max_size:
-                    _logger.warning(
-                        "Rejected file %s: size %s exceeds limit",
-                        filename,
-                        len(content),
-                    )
-                    continue
-
-                # Convert to base64
-                b64_content = base64.b64encode(content)
-
-                # Create attachment - Odoo handles filestore automatically
-                attach = Attachment.create(
-                    {
-                        "name": filename,
-                        "type": "binary",  # This tells Odoo to store in filestore
-                        "datas": b64_content,  # Odoo automatically writes to filestore
-                        "mimetype": mimetype,
-                        "res_model": "user_evaluation",
-                        "res_id": user_eval.id,
-                        "public": False,
-                    }
-                )
-
-                created_attachments.append(attach.id)
-
-            except Exception as e:
-                _logger.exception(
-                    "Error processing file %s for user_evaluation %s: %s",
-                    file_data.get("filename", "unknown"),
-                    user_eval.id,
-                    str(e),
-                )
-
-        # Update the user_evaluation record with the attachment IDs
-        # This ensures the One2many relationship is properly established
-        if created_attachments:
-            try:
-                user_eval.write({"document_id": [(6, 0, created_attachments)]})
-            except Exception as e:
-                _logger.error(
-                    "Failed to link attachments to user_evaluation %s: %s",
-                    user_eval.id,
-                    str(e),
-                )
+        filename = uploaded_file.filename
+        mimetype = uploaded_file.content_type or "application/octet-stream"
+
+        # Server-side validation
+        if mimetype not in ALLOWED_DOCUMENT_TYPES:
+            _logger.warning("Rejected file %s: invalid type %s", filename, mimetype)
+            return None
+
+        if Attachment._storage() != "file":
+            # Database storage cannot be streamed; keep the legacy in-memory path
+            content = uploaded_file.read(MAX_DOCUMENT_SIZE + 1)
+            if len(content) > MAX_DOCUMENT_SIZE or not _magic_matches(mimetype, content):
+                _logger.warning("Rejected file %s: size or content check failed", filename)
+                return None
+            return {
+                "filename": filename,
+                "content_type": mimetype,
+                "datas": base64.b64encode(content).decode(),
+            }
+
+        stream = uploaded_file.stream
+        sha = hashlib.sha1()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(
+            prefix="signup-", dir=Attachment._full_path("")
+        )
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                while True:
+                    chunk = stream.read(UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if size == 0 and not _magic_matches(mimetype, chunk):
+                        _logger.warning(
+                            "Rejected file %s: content does not match %s",
+                            filename,
+                            mimetype,
+                        )
+                        return None
+                    size += len(chunk)
+                    if size > MAX_DOCUMENT_SIZE:
+                        _logger.warning(
+                            "Rejected file %s: size exceeds limit after %s bytes",
+                            filename,
+                            size,
+                        )
+                        return None
+                    sha.update(chunk)
+                    tmp_file.write(chunk)
+
+            if not size:
+                _logger.warning("Rejected file %s: empty file", filename)
+                return None
+
+            checksum = sha.hexdigest()
+            store_fname = f"{checksum[:2]}/{checksum}"
+            full_path = Attachment._full_path(store_fname)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            if os.path.isfile(full_path):
+                # Same content already stored: the blob is shared
+                os.unlink(tmp_path)
+            else:
+                os.replace(tmp_path, full_path)
+            # Unreferenced blobs (e.g. signup rolled back) are collected by the filestore GC
+            Attachment._mark_for_gc(store_fname)
+            return {
+                "filename": filename,
+                "content_type": mimetype,
+                "store_fname": store_fname,
+                "checksum": checksum,
+                "file_size": size,
+            }
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
 
     @http.route("/get_districts", type="json", auth="public", methods=["POST"])
+    @instrument(kind="controller")
     def get_districts(self, province_id):
         try:
             province_id = int(province_id) if province_id else False
@@ -230,6 +247,7 @@ class CustomAuthSignupHome(AuthSignupHome):
             return {"error": str(e)}
 
     @http.route("/get_communes", type="json", auth="public", methods=["POST"])
+    @instrument(kind="controller")
     def get_communes(self, district_id):
         try:
             district_id = int(district_id) if district_id else False
@@ -0,0 +1,135 @@
+# controllers/realtycontroller_upload.py
+import logging
+import time
+import unicodedata
+
+from odoo import http  # type: ignore
+from odoo.http import request  # type: ignore
+from odoo.exceptions import AccessError, UserError  # type: ignore
+from odoo.addons.realty_bds.models.ir_attachment import (  # type: ignore
+    CHUNK_MAX_BYTES,
+    REALTY_IMAGE_MODELS,
+)
+from odoo.addons.realty_bds.models.realty_perf import instrument  # type: ignore
+
+_logger = logging.getLogger(__name__)
+
+
+class RealtyUploadController(http.Controller):
+    """Content-addressed uploads for realty image galleries (same answer as /web/binary/upload_attachment)."""
+
+    def _attachment_result(self, attachment, filename):
+        return {
+            "filename": filename,
+            "mimetype": attachment.mimetype,
+            "id": attachment.id,
+            "size": attachment.file_size,
+        }
+
+    @http.route("/realty/attachment/claim", type="json", auth="user")
+    @instrument(kind="controller")
+    def claim_attachments(self, model, id, files):
+        """
+        Reuse images the server already stores, identified by the SHA-1 of their bytes.
+        Private, orphaned or unreadable images are reported missing and must be uploaded.
+        :return: {"claimed": [upload results], "missing": [checksums the client must upload]}
+        """
+        if model not in REALTY_IMAGE_MODELS:
+            return {"claimed": [], "missing": [f.get("checksum") for f in files]}
+        return request.env["ir.attachment"].realty_claim_images(files, model, int(id))
+
+    @http.route("/realty/attachment/upload", type="http", methods=["POST"], auth="user")
+    @instrument(kind="controller")
+    def upload_attachment(self, model, id, ufile=None, saved_bytes=0, **kwargs):
+        Attachment = request.env["ir.attachment"]
+        args = []
+        deduplicated = 0
+        received_bytes = 0
+        start = time.perf_counter()
+        for ufile in request.httprequest.files.getlist("ufile"):
+            filename = ufile.filename
+            if request.httprequest.user_agent.browser == "safari":
+                filename = unicodedata.normalize("NFD", filename)
+            raw = ufile.read()
+            received_bytes += len(raw)
+            try:
+                if model in REALTY_IMAGE_MODELS:
+                    attachment, reused = Attachment.realty_store_image(
+                        raw, filename, model, int(id)
+                    )
+                    deduplicated += reused
+                else:
+                    attachment = Attachment.create(
+                        {
+                            "name": filename,
+                            "raw": raw,
+                            "res_model": model,
+                            "res_id": int(id),
+                        }
+                    )
+                attachment._post_add_create()
+            except AccessError:
+                args.append(
+                    {
+                        "error": "You are not allowed to upload an attachment here.",
+                        "filename": filename,
+                    }
+                )
+            except Exception:
+                _logger.exception("Fail to upload attachment %s", filename)
+                args.append({"error": "Something horrible happened", "filename": filename})
+            else:
+                args.append(self._attachment_result(attachment, filename))
+        # Images downscaled by the browser skip the server-side resize of ir.attachment,
+        # compare the processing time with and without saved bytes to see the CPU saved
+        _logger.info(
+            "Realty upload on %s: %s files, %s bytes received, %s bytes saved by the browser, "
+            "%s reused an existing blob, %.3fs processing",
+            model,
+            len(args),
+            received_bytes,
+            saved_bytes,
+            deduplicated,
+            time.perf_counter() - start,
+        )
+        return request.make_json_response(args)
+
+    # Resumable chunked uploads
+    @http.route("/realty/attachment/chunk/status", type="json", auth="user")
+    @instrument(kind="controller")
+    def chunk_status(self, checksum):
+        """Chunks already acknowledged for a file, so the client resumes after the last one."""
+        return {
+            "chunk_size": CHUNK_MAX_BYTES,
+            "received": request.env["ir.attachment"].realty_chunk_status(checksum),
+        }
+
+    @http.route("/realty/attachment/chunk", type="http", methods=["POST"], auth="user")
+    @instrument(kind="controller")
+    def upload_chunk(self, checksum, index, chunk_checksum, chunk=None, **kwargs):
+        try:
+            index = request.env["ir.attachment"].realty_store_chunk(
+                checksum, int(index), chunk_checksum, chunk.read() if chunk else b""
+            )
+        except (UserError, ValueError) as e:
+            return request.make_json_response({"error": str(e)}, status=400)
+        return request.make_json_response({"index": index})
+
+    @http.route("/realty/attachment/chunk/finish", type="json", auth="user")
+    @instrument(kind="controller")
+    def finish_chunked_upload(self, checksum, count, filename, model, id, saved_bytes=0):
+        start = time.perf_counter()
+        attachment = request.env["ir.attachment"].realty_assemble_chunks(
+            checksum, int(count), filename, model, int(id)
+        )
+        attachment._post_add_create()
+        _logger.info(
+            "Realty chunked upload on %s: %s bytes in %s chunks, %s bytes saved by the browser, "
+            "%.3fs assembling",
+            model,
+            attachment.file_size,
+            count,
+            saved_bytes,
+            time.perf_counter() - start,
+        )
+        return self._attachment_result(attachment, filename)
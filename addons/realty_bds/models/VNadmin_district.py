@@ -9,6 +9,13 @@ _logger = logging.getLogger(__name__)
 class District(models.Model):
     _inherit = "district"
 
+    # Model Method
+    def write(self, vals):
+        res = super().write(vals)
+        if {"name"} & set(vals):
+            self.env["product_display_refresh"].enqueue(self)
+        return res
+
     # Constrain
     @api.constrains("name")
     def _check_name(self):
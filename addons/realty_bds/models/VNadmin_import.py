@@ -0,0 +1,21 @@
+from odoo import models, api  # type: ignore
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class AdministrativeImport(models.AbstractModel):
+    _inherit = "administrative_import"
+
+    # Helper method
+    @api.model
+    def _get_reserved_words(self):
+        """Apply the same reserved words as the province/district/commune _check_name."""
+        try:
+            reserved_words = self.env["policy"].get_reserved_words()
+        except KeyError:
+            reserved_words = frozenset()
+            _logger.warning(
+                "The 'policy' model is not available. No reserved words will be checked."
+            )
+        return super()._get_reserved_words() | reserved_words
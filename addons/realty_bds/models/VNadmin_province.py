@@ -15,19 +15,35 @@ class Province(models.Model):
     # Constrain
     @api.constrains("name", "region_ids")
     def _check_unique_name_per_region(self):
-        """Ensure province name is unique within each region"""
-        for record in self:
-            if record.region_ids:
-                for region in record.region_ids:
-                    # Search for other provinces with same name in this region
-                    duplicate = self.search([
-                        ('id', '!=', record.id),
-                        ('name', '=', record.name),
-                        ('region_ids', 'in', region.id)
-                    ], limit=1)
-                    
-                    if duplicate:
-                        raise ValidationError(f"❌ Error: A province with the name '{record.name}' already exists in region '{region.name}'!")
+        """
+        Ensure province name is unique within each region among active provinces
+        (one grouped query for the whole recordset)
+        """
+        if not self.ids:
+            return
+        self.flush_model(["name", "region_ids", "active"])
+        field = self._fields["region_ids"]
+        self.env.cr.execute(
+            f"""
+            SELECT rel.{field.column1}, rel.{field.column2}
+              FROM {field.relation} rel
+              JOIN {self._table} state ON state.id = rel.{field.column1}
+              JOIN {field.relation} other_rel
+                ON other_rel.{field.column2} = rel.{field.column2}
+               AND other_rel.{field.column1} <> rel.{field.column1}
+              JOIN {self._table} other ON other.id = other_rel.{field.column1}
+             WHERE rel.{field.column1} = ANY(%s)
+               AND other.name = state.name
+               AND other.active
+             LIMIT 1
+            """,
+            (self.ids,),
+        )
+        duplicate = self.env.cr.fetchone()
+        if duplicate:
+            record = self.browse(duplicate[0])
+            region = self.env["region"].browse(duplicate[1])
+            raise ValidationError(f"❌ Error: A province with the name '{record.name}' already exists in region '{region.name}'!")
 
     @api.constrains("name")
     def _check_name(self):
@@ -50,3 +66,14 @@ class Province(models.Model):
             match = next((w for w in reserved_words if w in clean_name), None)
             if match:
                 raise ValidationError(f"❌ Error: Name contains reserved word: '{match}'!")
+
+    def init(self):
+        super().init()
+        # Supports the name join of _check_unique_name_per_region; the relation table
+        # already has a (state, region) primary key and a (region, state) index.
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS res_country_state_name_idx
+            ON res_country_state (name)
+            """
+        )
@@ -0,0 +1,373 @@
+from odoo import models, api  # type: ignore
+from odoo.exceptions import AccessError, UserError  # type: ignore
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# model -> list of (province_field, district_field, commune_field) address triples
+ADDRESS_FIELD_SETS = {
+    "product.template": [("province_id", "district_id", "commune_id")],
+    "res.partner": [
+        ("province_id", "district_id", "commune_id"),
+        ("province_resident_id", "district_resident_id", "commune_resident_id"),
+    ],
+    "res.company": [("province_id", "district_id", "commune_id")],
+    "urgent_buying": [(None, "district_id", None)],
+    "user_evaluation": [
+        ("province_id", "district_id", "commune_id"),
+        ("province_resident_id", "district_resident_id", "commune_resident_id"),
+    ],
+}
+
+LISTING_NAME_CHUNK_SIZE = 500
+
+
+class AdministrativeReorganisation(models.AbstractModel):
+    _name = "administrative_reorganisation"
+    _description = "Re-point records after districts/communes are merged"
+
+    # Helper method
+    @api.model
+    def _check_reorganisation_access(self):
+        if not (self.env.is_superuser() or self.env.user.has_group("base.group_system")):
+            raise AccessError(
+                "You don't have the necessary permissions to reorganise administrative units."
+            )
+
+    @api.model
+    def _normalize_mapping(self, model_name, mapping):
+        """Validate an {old_id: new_id} mapping and return it with int keys/values."""
+        mapping = {int(old): int(new) for old, new in (mapping or {}).items() if old}
+        if not mapping:
+            return mapping
+        if any(old == new for old, new in mapping.items()):
+            raise UserError("❌ Error: A unit cannot be merged into itself!")
+        chained = set(mapping) & set(mapping.values())
+        if chained:
+            raise UserError(
+                f"❌ Error: {model_name} {sorted(chained)} are both merged and merge targets!"
+            )
+        Model = self.env[model_name].with_context(active_test=False)
+        known = set(Model.browse(set(mapping) | set(mapping.values())).exists().ids)
+        missing = (set(mapping) | set(mapping.values())) - known
+        if missing:
+            raise UserError(f"❌ Error: Unknown {model_name} ids {sorted(missing)}!")
+        return mapping
+
+    @api.model
+    def _stage_mapping(self, district_map, commune_map):
+        cr = self.env.cr
+        cr.execute("DROP TABLE IF EXISTS administrative_reorg_map")
+        cr.execute(
+            """
+            CREATE TEMP TABLE administrative_reorg_map (
+                level VARCHAR NOT NULL,
+                old_id INTEGER NOT NULL,
+                new_id INTEGER NOT NULL,
+                PRIMARY KEY (level, old_id)
+            ) ON COMMIT DROP
+            """
+        )
+        for level, mapping in (("district", district_map), ("commune", commune_map)):
+            if mapping:
+                cr.execute(
+                    """
+                    INSERT INTO administrative_reorg_map (level, old_id, new_id)
+                    SELECT %s, unnest(%s::int[]), unnest(%s::int[])
+                    """,
+                    (level, list(mapping), list(mapping.values())),
+                )
+
+    @api.model
+    def _iter_address_columns(self):
+        """Yield (model_name, table, province_col, district_col, commune_col) for installed models."""
+        for model_name, field_sets in ADDRESS_FIELD_SETS.items():
+            Model = self.env.get(model_name)
+            if Model is None or Model._abstract:
+                continue
+            for province_col, district_col, commune_col in field_sets:
+                yield model_name, Model._table, province_col, district_col, commune_col
+
+    @api.model
+    def _count_affected(self):
+        """Return {model: {field: rows}} referencing a merged unit."""
+        cr = self.env.cr
+        counts = {}
+        for model_name, table, _province_col, district_col, commune_col in (
+            self._iter_address_columns()
+        ):
+            model_counts = counts.setdefault(model_name, {})
+            for level, column in (("district", district_col), ("commune", commune_col)):
+                if not column:
+                    continue
+                cr.execute(
+                    f"""
+                    SELECT count(*) FROM {table} t
+                      JOIN administrative_reorg_map m
+                        ON m.level = %s AND m.old_id = t.{column}
+                    """,
+                    (level,),
+                )
+                model_counts[column] = cr.fetchone()[0]
+        cr.execute(
+            """
+            SELECT count(*) FROM commune c
+              JOIN administrative_reorg_map m
+                ON m.level = 'district' AND m.old_id = c.district_id
+             WHERE NOT EXISTS (
+                   SELECT 1 FROM administrative_reorg_map x
+                    WHERE x.level = 'commune' AND x.old_id = c.id
+             )
+            """
+        )
+        counts["commune"] = {"district_id": cr.fetchone()[0]}
+        return counts
+
+    @api.model
+    def _find_commune_collisions(self):
+        """
+        Surviving communes of a merged district whose name is already taken in the new one,
+        by one of its communes or by another commune moving in: UNIQUE(name, district_id,
+        province_id) would reject the move.
+        :return: [(commune_id, name, new_district_id, homonym it should be merged into)]
+        """
+        cr = self.env.cr
+        cr.execute(
+            """
+            WITH candidates AS (
+                SELECT c.id, c.name, m.new_id AS district_id, 1 AS moving
+                  FROM commune c
+                  JOIN administrative_reorg_map m
+                    ON m.level = 'district' AND m.old_id = c.district_id
+                 WHERE NOT EXISTS (
+                       SELECT 1 FROM administrative_reorg_map x
+                        WHERE x.level = 'commune' AND x.old_id = c.id
+                 )
+                 UNION ALL
+                SELECT c.id, c.name, c.district_id, 0
+                  FROM commune c
+                 WHERE c.district_id IN (
+                       SELECT new_id FROM administrative_reorg_map WHERE level = 'district'
+                 )
+            ), ranked AS (
+                -- Keep a commune already in the district, preferably one not merged away
+                SELECT k.id, k.name, k.district_id, k.moving,
+                       first_value(k.id) OVER (
+                           PARTITION BY k.name, k.district_id
+                           ORDER BY k.moving, x.old_id IS NOT NULL, k.id
+                       ) AS survivor_id
+                  FROM candidates k
+                  LEFT JOIN administrative_reorg_map x
+                    ON x.level = 'commune' AND x.old_id = k.id
+            )
+            SELECT r.id, r.name, r.district_id, COALESCE(x.new_id, r.survivor_id)
+              FROM ranked r
+              LEFT JOIN administrative_reorg_map x
+                ON x.level = 'commune' AND x.old_id = r.survivor_id
+             WHERE r.moving = 1 AND r.id <> r.survivor_id
+             ORDER BY r.id
+            """
+        )
+        return cr.fetchall()
+
+    @api.model
+    def _merge_commune_homonyms(self, collisions):
+        """Add the colliding communes to the commune map, merged into their homonym."""
+        unresolved = [
+            commune_id for commune_id, _name, _district, into in collisions if into == commune_id
+        ]
+        if unresolved:
+            raise UserError(
+                f"❌ Error: Communes {unresolved} would collide with a commune merged into them, "
+                "rename them before reorganising!"
+            )
+        old_ids = [commune_id for commune_id, _name, _district, _into in collisions]
+        into_ids = [into for _commune_id, _name, _district, into in collisions]
+        cr = self.env.cr
+        # Communes already merged into a colliding one follow it to its homonym
+        cr.execute(
+            """
+            UPDATE administrative_reorg_map m SET new_id = v.into_id
+              FROM unnest(%s::int[], %s::int[]) AS v(old_id, into_id)
+             WHERE m.level = 'commune' AND m.new_id = v.old_id
+            """,
+            (old_ids, into_ids),
+        )
+        cr.execute(
+            """
+            INSERT INTO administrative_reorg_map (level, old_id, new_id)
+            SELECT 'commune', unnest(%s::int[]), unnest(%s::int[])
+            """,
+            (old_ids, into_ids),
+        )
+
+    @api.model
+    def _repoint_references(self):
+        """Rewrite every address triple in set-based statements; returns touched listing ids."""
+        cr = self.env.cr
+        listing_ids = set()
+        for model_name, table, province_col, district_col, commune_col in (
+            self._iter_address_columns()
+        ):
+            returning = "RETURNING t.id" if model_name == "product.template" else ""
+            if district_col:
+                assignments = [f"{district_col} = m.new_id"]
+                if province_col:
+                    assignments.append(f"{province_col} = d.province_id")
+                cr.execute(
+                    f"""
+                    UPDATE {table} t SET {", ".join(assignments)}
+                      FROM administrative_reorg_map m
+                      JOIN district d ON d.id = m.new_id
+                     WHERE m.level = 'district' AND t.{district_col} = m.old_id
+                    {returning}
+                    """
+                )
+                if returning:
+                    listing_ids.update(row[0] for row in cr.fetchall())
+            if commune_col:
+                assignments = [f"{commune_col} = m.new_id"]
+                if district_col:
+                    assignments.append(f"{district_col} = c.district_id")
+                if province_col:
+                    assignments.append(f"{province_col} = c.province_id")
+                cr.execute(
+                    f"""
+                    UPDATE {table} t SET {", ".join(assignments)}
+                      FROM administrative_reorg_map m
+                      JOIN commune c ON c.id = m.new_id
+                     WHERE m.level = 'commune' AND t.{commune_col} = m.old_id
+                    {returning}
+                    """
+                )
+                if returning:
+                    listing_ids.update(row[0] for row in cr.fetchall())
+        return listing_ids
+
+    @api.model
+    def _retire_merged_units(self):
+        cr = self.env.cr
+        # Surviving communes of a merged district follow it into the new district
+        cr.execute(
+            """
+            UPDATE commune c SET district_id = m.new_id, province_id = d.province_id
+              FROM administrative_reorg_map m
+              JOIN district d ON d.id = m.new_id
+             WHERE m.level = 'district' AND c.district_id = m.old_id
+               AND NOT EXISTS (
+                   SELECT 1 FROM administrative_reorg_map x
+                    WHERE x.level = 'commune' AND x.old_id = c.id
+               )
+            """
+        )
+        for table in ("district", "commune"):
+            cr.execute(
+                f"""
+                UPDATE {table} t SET active = FALSE
+                  FROM administrative_reorg_map m
+                 WHERE m.level = %s AND t.id = m.old_id
+                """,
+                (table,),
+            )
+
+    @api.model
+    def _rebuild_listing_names(self, listing_ids):
+        """Recompute stored product.template names and addresses in bounded chunks."""
+        ids = sorted(listing_ids)
+        Product = self.env["product.template"].sudo().with_context(active_test=False)
+        renamed = 0
+        for start in range(0, len(ids), LISTING_NAME_CHUNK_SIZE):
+            chunk = Product.browse(ids[start:start + LISTING_NAME_CHUNK_SIZE])
+            renamed += chunk._rebuild_address_name()
+            chunk._refresh_display_fields(["address"])
+            chunk.flush_model()
+            self.env.invalidate_all()
+            _logger.info(
+                "Administrative reorganisation: rebuilt listing names %s/%s",
+                min(start + LISTING_NAME_CHUNK_SIZE, len(ids)),
+                len(ids),
+            )
+        return renamed
+
+    # Model Method
+    @api.model
+    def reorganise(self, district_map=None, commune_map=None, dry_run=False, merge_homonyms=False):
+        """
+        Merge districts/communes and re-point every record referencing them.
+        :param district_map: {old_district_id: new_district_id}
+        :param commune_map: {old_commune_id: new_commune_id}
+        :param dry_run: only report the affected rows and the commune name collisions
+        :param merge_homonyms: merge a moving commune into the commune of the same name in its
+            new district; otherwise such collisions must be listed in commune_map
+        :return: {"rows": {model: {field: count}}, "commune_collisions": [...],
+            "listings_renamed": int, "dry_run": bool}
+        """
+        self._check_reorganisation_access()
+        district_map = self._normalize_mapping("district", district_map)
+        commune_map = self._normalize_mapping("commune", commune_map)
+        if not (district_map or commune_map):
+            raise UserError("❌ Error: Nothing to reorganise!")
+
+        self.env.flush_all()
+        self._stage_mapping(district_map, commune_map)
+        collisions = self._find_commune_collisions()
+        if collisions and merge_homonyms:
+            self._merge_commune_homonyms(collisions)
+        report = {
+            "rows": self._count_affected(),
+            "commune_collisions": [
+                {
+                    "commune_id": commune_id,
+                    "name": name,
+                    "district_id": district_id,
+                    "homonym_id": into,
+                    "merged": merge_homonyms,
+                }
+                for commune_id, name, district_id, into in collisions
+            ],
+            "listings_renamed": 0,
+            "dry_run": dry_run,
+        }
+        if dry_run:
+            return report
+        if collisions and not merge_homonyms:
+            raise UserError(
+                "❌ Error: Communes "
+                f"{sorted(commune_id for commune_id, _name, _district, _into in collisions)} "
+                "have the same name as a commune of their new district, merge them in "
+                "commune_map or pass merge_homonyms!"
+            )
+
+        listing_ids = self._repoint_references()
+        self._retire_merged_units()
+        self.env.invalidate_all()
+        self.env["administrative_hierarchy"].invalidate_index()
+        report["listings_renamed"] = self._rebuild_listing_names(listing_ids)
+        _logger.info("Administrative reorganisation done: %s", report)
+        return report
+
+    @api.model
+    def reorganise_from_codes(
+        self, district_codes=None, commune_codes=None, dry_run=False, merge_homonyms=False
+    ):
+        """Same as reorganise() but keyed by official codes, e.g. the 'merged' gazetteer rows."""
+
+        def _to_ids(table, codes):
+            if not codes:
+                return {}
+            self.env.cr.execute(
+                f"SELECT code, id FROM {table} WHERE code = ANY(%s)",
+                (list(set(codes) | set(codes.values())),),
+            )
+            ids = dict(self.env.cr.fetchall())
+            missing = [c for pair in codes.items() for c in pair if c not in ids]
+            if missing:
+                raise UserError(f"❌ Error: Unknown {table} codes {sorted(set(missing))}!")
+            return {ids[old]: ids[new] for old, new in codes.items()}
+
+        return self.reorganise(
+            district_map=_to_ids("district", district_codes),
+            commune_map=_to_ids("commune", commune_codes),
+            dry_run=dry_run,
+            merge_homonyms=merge_homonyms,
+        )
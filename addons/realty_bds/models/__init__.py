@@ -1,4 +1,5 @@
 from . import realty_permission_tracker
+from . import realty_perf
 from . import realty_policy
 from . import realty_Real_Estate_status
 from . import realty_Real_Estate_type
@@ -13,6 +14,8 @@ from . import realty_region
 from . import VNadmin_province
 from . import VNadmin_district
 from . import VNadmin_commune
+from . import VNadmin_import
+from . import VNadmin_reorganisation
 from . import res_users
 from . import res_partner
 from . import realty_create_user_wizard
@@ -20,15 +23,21 @@ from . import realty_assign_employee_wizard
 from . import hr_job
 from . import hr_job_wizard
 from . import hr_department
+from . import realty_termination
 from . import hr_employee
 from . import hr_employee_wizard
 from . import res_company
+from . import res_currency
 from . import ir_filters
 from . import product_template
+from . import realty_product_display_refresh
+from . import realty_change_feed
 from . import mail_tracking_value
+from . import mail_message
 from . import realty_Report_client_feedback
 from . import realty_Report_owner_feedback
 from . import realty_Real_Estate_report
+from . import realty_Notify_template
 from . import realty_notify
 from . import realty_Notify_moderator_assignment_sequence
 from . import realty_Notify_guideline
@@ -41,7 +50,12 @@ from . import realty_Notify_remove_reason
 from . import realty_Notify_wizard
 from . import realty_comment_wizard
 from . import realty_Notify_comment
+from . import realty_Notify_digest
+from . import realty_Notify_fanout
 from . import ir_attachment
 from . import realty_product_wizard
 from . import realty_user_evaluation
-from . import realty_user_evaluation_wizard
\ No newline at end of file
+from . import realty_user_evaluation_wizard
+from . import realty_signup_job
+from . import realty_data_generator
+from . import realty_assignment_load
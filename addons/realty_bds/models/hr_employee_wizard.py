@@ -13,5 +13,6 @@ class HrEmployeeWizard(models.TransientModel):
     # Action
     def action_confirm(self):
         self.ensure_one()
+        self.employee_id._check_termination_access()
         self.employee_id.terminate_employee()
         return {"type": "ir.actions.act_window_close"}
@@ -22,15 +22,19 @@ class JobTitle(models.Model):
 
     # Model Method
     def write(self, vals):
+        Users = self.env["res.users"]
+        # Remember the effective groups so only the difference is applied to users
+        old_group_ids_by_job = {}
+        if "implied_ids" in vals:
+            old_group_ids_by_job = {job.id: Users._get_job_group_ids(job.id) for job in self}
         # Call the parent write method to update the record
         res = super(JobTitle, self).write(vals)
         # Check if implied_ids is being updated
         if "implied_ids" in vals:
-            # Find all users associated with this job title
-            users = self.env["res.users"].search([("hr_job_id", "in", self.ids)])
-            if users:
-                # Sync groups for all affected users
-                users._sync_groups_from_job_title()
+            self.flush_recordset(["implied_ids"])
+            self.env.registry.clear_cache("groups")
+            # Sync groups for all users of these jobs with one set-based diff
+            Users.sudo()._apply_job_group_diff(old_group_ids_by_job)
         return res
 
     # Constrains
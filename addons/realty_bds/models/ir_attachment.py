@@ -1,5 +1,36 @@
 from odoo import models, fields, api  # type: ignore
-from odoo.exceptions import AccessError  # type: ignore
+from odoo.exceptions import AccessError, UserError  # type: ignore
+from odoo.tools.mimetypes import guess_mimetype  # type: ignore
+from datetime import timedelta
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+import time
+
+_logger = logging.getLogger(__name__)
+
+# Models with realty image galleries: garbage collected and deduplicated
+REALTY_IMAGE_MODELS = (
+    "product.template",
+    "product_report",
+    "congratulation",
+    "notification",
+    "guideline",
+)
+# Sources an upload may share its blob with: product reports and private images never are
+REALTY_DEDUP_MODELS = tuple(model for model in REALTY_IMAGE_MODELS if model != "product_report")
+DEDUP_CANDIDATES = 10
+GC_BATCH_SIZE = 1000
+GC_RETENTION_DAYS = 30
+
+# Resumable uploads: chunks wait in <filestore>/realty_upload/<uid>_<sha1 of the file>/
+CHUNK_MAX_BYTES = 1024 * 1024
+UPLOAD_MAX_CHUNKS = 64
+UPLOAD_MAX_PENDING = 20
+UPLOAD_RETENTION_HOURS = 24
 
 
 class IrAttachment(models.Model):
@@ -15,6 +46,33 @@ class IrAttachment(models.Model):
         help="-1: Draft record, 0: Orphaned, >0: Original record ID",
     )
 
+    # content address of realty images (deduplication)
+    realty_source_checksum = fields.Char(
+        string="Uploaded Checksum",
+        readonly=True,
+        index="btree_not_null",
+        help="SHA-1 of the uploaded bytes, before Odoo resized the image",
+    )
+
+    def init(self):
+        super().init()
+        # Partial indexes for the realty garbage collector: unsaved uploads and orphans
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS ir_attachment_realty_unsaved_idx
+            ON ir_attachment (orphaned_from_res_id, create_date)
+            WHERE orphaned_from_res_id = -1 AND res_model IN %s
+            """,
+            (REALTY_IMAGE_MODELS,),
+        )
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS ir_attachment_realty_orphaned_idx
+            ON ir_attachment (orphaned_date)
+            WHERE orphaned_date IS NOT NULL
+            """
+        )
+
     @api.model
     def mark_orphaned(self, ids, from_model=None, from_res_id=None):
         """
@@ -26,39 +84,72 @@ class IrAttachment(models.Model):
         """
         if not ids:
             return True
+        return self._mark_orphaned_many(
+            {att_id: from_res_id or 0 for att_id in ids}, from_model
+        )
 
-        attachments = self.browse(ids)
-        current_uid = self.env.uid
+    @api.model
+    def mark_records_orphaned(self, records, field_names):
+        """
+        Mark the attachments of many records as orphaned at once, e.g. in a bulk unlink.
+        :param records: records being deleted
+        :param field_names: attachment fields of the records (e.g., ['img_ids'])
+        :return: True on success
+        """
+        res_id_by_attachment = {}
+        for record in records:
+            for field_name in field_names:
+                for att_id in record[field_name].ids:
+                    res_id_by_attachment[att_id] = record.id
+        if not res_id_by_attachment:
+            return True
+        return self._mark_orphaned_many(res_id_by_attachment, records._name)
 
-        writable_attachments = self.env["ir.attachment"]
-        creator_attachments = self.env["ir.attachment"]
+    @api.model
+    def _mark_orphaned_many(self, res_id_by_attachment, from_model=None):
+        """
+        Check access for the whole set in one pass, then orphan it in a single UPDATE.
+        :param res_id_by_attachment: {attachment_id: original record id}
+        """
+        attachments = self.browse(list(res_id_by_attachment)).exists()
+        if not attachments:
+            return True
 
-        for att in attachments:
-            try:
-                att.check_access("write")
-                writable_attachments += att
-            except AccessError:
-                if att.create_uid.id == current_uid:
-                    creator_attachments += att
-                else:
-                    raise AccessError(
-                        "You are not allowed to mark attachment %s as orphaned.", att.id
-                    )
-
-        orphan_vals = {
-            "orphaned_date": fields.Datetime.now(),
-            "orphaned_from_model": from_model or "",
-            "orphaned_from_res_id": from_res_id or 0,
-            "res_id": 0,
-            "res_model": "",
-        }
-
-        if writable_attachments:
-            writable_attachments.write(orphan_vals)
-
-        if creator_attachments:
-            creator_attachments.sudo().write(orphan_vals)
+        # Writable through record rules, otherwise the creator may still orphan their own upload
+        allowed = attachments._filtered_access("write")
+        denied = attachments - allowed
+        if denied:
+            current_uid = self.env.uid
+            denied = denied.sudo().filtered(lambda att: att.create_uid.id != current_uid)
+            if denied:
+                raise AccessError(
+                    "You are not allowed to mark attachment %s as orphaned." % denied[0].id
+                )
 
+        self.flush_model()
+        self.env.cr.execute(
+            """
+            UPDATE ir_attachment a
+               SET orphaned_date = %s,
+                   orphaned_from_model = %s,
+                   orphaned_from_res_id = v.res_id,
+                   res_id = 0,
+                   res_model = '',
+                   write_uid = %s,
+                   write_date = %s
+              FROM unnest(%s::int[], %s::int[]) AS v(id, res_id)
+             WHERE a.id = v.id
+            """,
+            (
+                fields.Datetime.now(),
+                from_model or "",
+                self.env.uid,
+                fields.Datetime.now(),
+                attachments.ids,
+                [res_id_by_attachment[att_id] for att_id in attachments.ids],
+            ),
+        )
+        attachments.invalidate_recordset()
         return True
 
     @api.model
@@ -78,3 +169,455 @@ class IrAttachment(models.Model):
         attachments = self.sudo().browse(valid_ids)
         if attachments:
             attachments.write({"orphaned_from_res_id": 0})
+
+    @api.model
+    def attach_signup_documents(self, user_eval, file_data_list):
+        """
+        Create attachments for identity documents staged at signup and link them to user_evaluation.
+        Streamed files are already in the filestore, so only their metadata is written.
+        :param user_eval: user_evaluation record
+        :param file_data_list: descriptors returned by the signup controller
+        :return: created attachments
+        """
+        Attachment = self.sudo()
+        if not user_eval or not user_eval.exists() or not file_data_list:
+            return Attachment
+
+        vals_list = []
+        for file_data in file_data_list:
+            vals = {
+                "name": file_data.get("filename", "file.bin"),
+                "type": "binary",
+                "mimetype": file_data.get("content_type", "application/octet-stream"),
+                "res_model": "user_evaluation",
+                "res_id": user_eval.id,
+                "public": False,
+            }
+            if "datas" in file_data:
+                # Database storage fallback
+                vals["datas"] = file_data["datas"]
+            vals_list.append(vals)
+        attachments = Attachment.create(vals_list)
+
+        stored_files = [
+            (attach.id, file_data)
+            for attach, file_data in zip(attachments, file_data_list)
+            if "store_fname" in file_data
+        ]
+        if stored_files:
+            # create()/write() drop store_fname, checksum and file_size, so link the blobs directly
+            self.env.cr.execute(
+                """
+                UPDATE ir_attachment a
+                   SET store_fname = v.store_fname,
+                       checksum = v.checksum,
+                       file_size = v.file_size
+                  FROM unnest(%s::int[], %s::varchar[], %s::varchar[], %s::int[])
+                       AS v(id, store_fname, checksum, file_size)
+                 WHERE a.id = v.id
+                """,
+                (
+                    [att_id for att_id, _data in stored_files],
+                    [data["store_fname"] for _att_id, data in stored_files],
+                    [data["checksum"] for _att_id, data in stored_files],
+                    [data["file_size"] for _att_id, data in stored_files],
+                ),
+            )
+            Attachment.browse([att_id for att_id, _data in stored_files]).invalidate_recordset(
+                ["store_fname", "checksum", "file_size", "raw", "datas"]
+            )
+
+        # Link through the One2many so the relationship is properly established
+        user_eval.sudo().write({"document_id": [(6, 0, attachments.ids)]})
+        _logger.info(
+            "Attached %s signup documents to user_evaluation %s", len(attachments), user_eval.id
+        )
+        return attachments
+
+    # Deduplication
+    @api.model
+    def _realty_find_duplicate(self, checksum):
+        """
+        Find a stored realty image with exactly these bytes that the current user may read.
+        Private images, unsaved uploads and orphans are never reused: knowing a checksum
+        (exposed by image URLs) must not give access to them.
+        """
+        private_field = self.env["product.template"]._fields["private_img_ids"]
+        self.flush_model()
+        self.env["product.template"].flush_model(["private_img_ids"])
+        self.env.cr.execute(
+            f"""
+            SELECT a.id FROM ir_attachment a
+             WHERE a.store_fname IS NOT NULL
+               AND a.type = 'binary'
+               AND a.res_model IN %s
+               AND a.res_id > 0
+               AND a.orphaned_date IS NULL
+               AND a.orphaned_from_res_id <> -1
+               AND (a.realty_source_checksum = %s OR a.checksum = %s)
+               AND NOT EXISTS (
+                   SELECT 1 FROM "{private_field.relation}" p
+                    WHERE p."{private_field.column2}" = a.id
+               )
+             ORDER BY a.id DESC
+             LIMIT %s
+            """,
+            (REALTY_DEDUP_MODELS, checksum, checksum, DEDUP_CANDIDATES),
+        )
+        for candidate in self.browse([row[0] for row in self.env.cr.fetchall()]):
+            try:
+                candidate.check_access("read")
+            except AccessError:
+                continue
+            return candidate.sudo()
+        return self.sudo().browse()
+
+    @api.model
+    def _realty_clone_blob(self, source, name, res_model, res_id):
+        """
+        Create an attachment sharing the already processed blob of source:
+        no upload, no resize, same checksum for the browser and thumbnail caches.
+        """
+        attachment = self.create(
+            {
+                "name": name,
+                "type": "binary",
+                "mimetype": source.mimetype,
+                "res_model": res_model,
+                "res_id": res_id,
+            }
+        )
+        self.flush_model()
+        self.env.cr.execute(
+            """
+            UPDATE ir_attachment a
+               SET store_fname = s.store_fname,
+                   checksum = s.checksum,
+                   file_size = s.file_size,
+                   mimetype = s.mimetype,
+                   realty_source_checksum = s.realty_source_checksum
+              FROM ir_attachment s
+             WHERE a.id = %s AND s.id = %s
+            """,
+            (attachment.id, source.id),
+        )
+        attachment.invalidate_recordset()
+        return attachment
+
+    @api.model
+    def realty_store_image(self, raw, name, res_model, res_id):
+        """
+        Content-addressed upload of a realty image.
+        :return: (attachment, deduplicated)
+        """
+        return self._realty_store_image(
+            self._compute_checksum(raw), lambda: raw, name, res_model, res_id
+        )
+
+    @api.model
+    def _realty_store_image(self, checksum, read_raw, name, res_model, res_id):
+        """
+        :param read_raw: callable returning the bytes, only called when no duplicate exists
+        :return: (attachment, deduplicated)
+        """
+        duplicate = self._realty_find_duplicate(checksum)
+        if duplicate:
+            return self._realty_clone_blob(duplicate, name, res_model, res_id), True
+
+        attachment = self.create(
+            {"name": name, "raw": read_raw(), "res_model": res_model, "res_id": res_id}
+        )
+        attachment.sudo().write({"realty_source_checksum": checksum})
+        return attachment, False
+
+    @api.model
+    def realty_claim_images(self, files, res_model, res_id):
+        """
+        Create attachments for images the server already holds, so their upload is skipped.
+        Only images the user can already read are claimed, see _realty_find_duplicate.
+        :param files: list of {"checksum": sha1 hex of the file, "filename": str}
+        :return: {"claimed": [upload results], "missing": [checksums to upload]}
+        """
+        claimed, missing = [], []
+        for file in files:
+            checksum = str(file.get("checksum") or "").lower()
+            duplicate = (
+                self._realty_find_duplicate(checksum)
+                if re.fullmatch(r"[0-9a-f]{40}", checksum)
+                else None
+            )
+            if not duplicate:
+                missing.append(checksum)
+                continue
+            attachment = self._realty_clone_blob(
+                duplicate, file.get("filename") or duplicate.name, res_model, res_id
+            )
+            claimed.append(
+                {
+                    "filename": attachment.name,
+                    "mimetype": attachment.mimetype,
+                    "id": attachment.id,
+                    "size": attachment.file_size,
+                    "checksum": checksum,
+                }
+            )
+        return {"claimed": claimed, "missing": missing}
+
+    # Chunked uploads
+    @api.model
+    def _realty_upload_root(self):
+        return os.path.join(self._filestore(), "realty_upload")
+
+    @api.model
+    def _realty_chunk_dir(self, checksum):
+        if not re.fullmatch(r"[0-9a-f]{40}", checksum or ""):
+            raise UserError("❌ Error: Invalid upload checksum!")
+        return os.path.join(self._realty_upload_root(), f"{self.env.uid}_{checksum}")
+
+    @api.model
+    def realty_chunk_status(self, checksum):
+        """Indexes of the chunks already received for the file with this SHA-1."""
+        path = self._realty_chunk_dir(checksum)
+        if not os.path.isdir(path):
+            return []
+        return sorted(
+            int(name.split("_")[0]) for name in os.listdir(path) if not name.endswith(".tmp")
+        )
+
+    @api.model
+    def realty_store_chunk(self, checksum, index, chunk_checksum, data):
+        """
+        Keep one chunk of a resumable upload. A chunk is only acknowledged once
+        its bytes match chunk_checksum, and it is renamed into place atomically.
+        """
+        if not 0 <= index < UPLOAD_MAX_CHUNKS:
+            raise UserError(f"❌ Error: An upload may not exceed {UPLOAD_MAX_CHUNKS} chunks!")
+        if len(data) > CHUNK_MAX_BYTES:
+            raise UserError("❌ Error: Upload chunk is too large!")
+        if hashlib.sha1(data).hexdigest() != chunk_checksum:
+            raise UserError("❌ Error: Upload chunk is corrupted, please resend it!")
+
+        path = self._realty_chunk_dir(checksum)
+        if not os.path.isdir(path):
+            root = self._realty_upload_root()
+            prefix = f"{self.env.uid}_"
+            pending = os.listdir(root) if os.path.isdir(root) else []
+            if sum(name.startswith(prefix) for name in pending) >= UPLOAD_MAX_PENDING:
+                raise UserError("❌ Error: Too many unfinished uploads, please try again later!")
+            os.makedirs(path, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=path, suffix=".tmp")
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_path, os.path.join(path, f"{index:05d}_{chunk_checksum}"))
+        # The directory mtime tells the GC the upload is still alive
+        os.utime(path)
+        return index
+
+    @api.model
+    def realty_assemble_chunks(self, checksum, count, name, res_model, res_id):
+        """
+        Join the chunks of a finished upload into one attachment.
+        Chunks are streamed into a single file while hashing, never held in memory together.
+        Realty images go through realty_store_image, so duplicates reuse their blob and
+        are never read; other files are moved into the filestore as they are.
+        """
+        if not 0 < count <= UPLOAD_MAX_CHUNKS:
+            raise UserError(f"❌ Error: An upload may not exceed {UPLOAD_MAX_CHUNKS} chunks!")
+        path = self._realty_chunk_dir(checksum)
+        chunks = {}
+        if os.path.isdir(path):
+            for fname in os.listdir(path):
+                if not fname.endswith(".tmp"):
+                    chunks[int(fname.split("_")[0])] = os.path.join(path, fname)
+        missing = [index for index in range(count) if index not in chunks]
+        if missing:
+            raise UserError(f"❌ Error: Upload is missing chunks {missing}!")
+
+        sha = hashlib.sha1()
+        size = 0
+        head = b""
+        # In the chunk directory: same filesystem as the filestore, removed with it
+        fd, tmp_path = tempfile.mkstemp(dir=path, suffix=".tmp")
+        with os.fdopen(fd, "wb") as assembled:
+            for index in range(count):
+                with open(chunks[index], "rb") as chunk:
+                    data = chunk.read()
+                head = head or data[:1024]
+                size += len(data)
+                sha.update(data)
+                assembled.write(data)
+        if sha.hexdigest() != checksum:
+            shutil.rmtree(path, ignore_errors=True)
+            raise UserError("❌ Error: Uploaded file is corrupted, please upload it again!")
+
+        def read_raw():
+            with open(tmp_path, "rb") as assembled:
+                return assembled.read()
+
+        try:
+            if res_model in REALTY_IMAGE_MODELS:
+                # Images are decoded for the resize anyway, so only new ones are read
+                attachment, _reused = self._realty_store_image(
+                    checksum, read_raw, name, res_model, res_id
+                )
+            elif self._storage() != "file":
+                attachment = self.create(
+                    {"name": name, "raw": read_raw(), "res_model": res_model, "res_id": res_id}
+                )
+            else:
+                attachment = self._realty_adopt_file(
+                    tmp_path, checksum, size, guess_mimetype(head), name, res_model, res_id
+                )
+        finally:
+            shutil.rmtree(path, ignore_errors=True)
+        return attachment
+
+    @api.model
+    def _realty_adopt_file(self, tmp_path, checksum, size, mimetype, name, res_model, res_id):
+        """Create an attachment whose blob is tmp_path, moved into the filestore."""
+        store_fname = f"{checksum[:2]}/{checksum}"
+        full_path = self._full_path(store_fname)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        if os.path.isfile(full_path):
+            # Same content already stored: the blob is shared
+            os.unlink(tmp_path)
+        else:
+            os.replace(tmp_path, full_path)
+        # Unreferenced blobs (e.g. upload rolled back) are collected by the filestore GC
+        self._mark_for_gc(store_fname)
+        attachment = self.create(
+            {
+                "name": name,
+                "type": "binary",
+                "mimetype": mimetype,
+                "res_model": res_model,
+                "res_id": res_id,
+            }
+        )
+        # create()/write() drop store_fname, checksum and file_size, so link the blob directly
+        self.flush_model()
+        self.env.cr.execute(
+            """
+            UPDATE ir_attachment
+               SET store_fname = %s, checksum = %s, file_size = %s
+             WHERE id = %s
+            """,
+            (store_fname, checksum, size, attachment.id),
+        )
+        attachment.invalidate_recordset()
+        return attachment
+
+    @api.model
+    def _gc_realty_upload_chunks(self, retention_hours=UPLOAD_RETENTION_HOURS):
+        """Remove chunk directories of uploads abandoned for retention_hours."""
+        root = self._realty_upload_root()
+        if not os.path.isdir(root):
+            return 0
+        cutoff = time.time() - retention_hours * 3600
+        removed = 0
+        for name in os.listdir(root):
+            path = os.path.join(root, name)
+            if os.path.isdir(path) and os.path.getmtime(path) < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        if removed:
+            _logger.info("Realty upload GC: removed %s abandoned uploads", removed)
+        return removed
+
+    # Garbage collection
+    @api.model
+    def _gc_realty_attachments(
+        self, batch_size=GC_BATCH_SIZE, retention_days=GC_RETENTION_DAYS, collect_files=True
+    ):
+        """
+        Delete orphaned and never-saved realty images in bounded batches.
+        Every batch is committed, so an interrupted run keeps its progress, then the
+        standard filestore GC removes the blobs no attachment references any more.
+        Replaces the per-model data_recycle attachment rules.
+        :param collect_files: run the filestore GC after each batch; without it the blobs
+            are only marked and wait for its daily run
+        :return: {model: {"count": int, "bytes": int}} reclaimed (marked without collect_files)
+        """
+        cr = self.env.cr
+        cutoff = fields.Datetime.now() - timedelta(days=retention_days)
+        report = {}
+        self._gc_realty_upload_chunks()
+        self.flush_model()
+        while True:
+            # The LOCK must be the first statement of its transaction (REPEATABLE READ):
+            # otherwise the reference check below uses a snapshot older than the lock
+            # and misses attachments committed in between, e.g. by _realty_clone_blob.
+            cr.commit()
+            cr.execute("SET LOCAL lock_timeout TO '10s'")
+            # Same lock as the standard filestore GC: no upload may reuse a blob we are releasing
+            cr.execute("LOCK ir_attachment IN SHARE MODE")
+            cr.execute(
+                """
+                SELECT id FROM ir_attachment
+                 WHERE orphaned_date IS NOT NULL
+                   AND orphaned_date < %s
+                   AND orphaned_from_model IN %s
+                   AND mimetype LIKE 'image/%%'
+                 UNION ALL
+                SELECT id FROM ir_attachment
+                 WHERE orphaned_from_res_id = -1
+                   AND res_model IN %s
+                   AND create_date < %s
+                   AND mimetype LIKE 'image/%%'
+                 LIMIT %s
+                """,
+                (cutoff, REALTY_IMAGE_MODELS, REALTY_IMAGE_MODELS, cutoff, batch_size),
+            )
+            ids = [row[0] for row in cr.fetchall()]
+            if not ids:
+                break
+            self._gc_delete_batch(ids, report)
+            cr.commit()
+            if collect_files:
+                # Takes the same lock in its own transaction and checks the references again
+                self._gc_file_store()
+            _logger.info("Realty attachment GC: %s", report)
+        cr.commit()
+        return report
+
+    @api.model
+    def _gc_delete_batch(self, ids, report):
+        """
+        Delete attachment rows and mark the blobs no other attachment references for the
+        filestore GC. Called with ir_attachment locked; nothing is unlinked here, so a
+        batch that fails to commit leaves every blob in place.
+        """
+        cr = self.env.cr
+        cr.execute(
+            """
+            DELETE FROM ir_attachment
+             WHERE id = ANY(%s)
+            RETURNING COALESCE(NULLIF(orphaned_from_model, ''), res_model),
+                      store_fname, COALESCE(file_size, 0)
+            """,
+            (ids,),
+        )
+        rows = cr.fetchall()
+        self.invalidate_model()
+
+        fnames = {fname for _model, fname, _size in rows if fname}
+        if fnames:
+            cr.execute(
+                "SELECT store_fname FROM ir_attachment WHERE store_fname = ANY(%s)",
+                (list(fnames),),
+            )
+            fnames -= {row[0] for row in cr.fetchall()}
+
+        reclaimed = set()
+        for model, fname, size in rows:
+            model_report = report.setdefault(model or "", {"count": 0, "bytes": 0})
+            model_report["count"] += 1
+            # Blobs shared with a surviving attachment are not reclaimed, shared ones count once
+            if fname in fnames and fname not in reclaimed:
+                reclaimed.add(fname)
+                model_report["bytes"] += size
+
+        for fname in fnames:
+            # Removed by _gc_file_store once the batch is committed
+            self._mark_for_gc(fname)
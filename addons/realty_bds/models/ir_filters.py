@@ -2,6 +2,7 @@ from odoo import models, api  # type: ignore
 from odoo.exceptions import ValidationError  # type: ignore
 from odoo.http import request  # type: ignore
 from odoo.tools.safe_eval import safe_eval  # type: ignore
+from .realty_perf import instrument
 
 
 class IrFilters(models.Model):
@@ -9,6 +10,7 @@ class IrFilters(models.Model):
 
     # Model Method
     @api.model
+    @instrument()
     def save_or_override_filter(self, filter_data):
         name = filter_data["name"]
         model_id = filter_data["model_id"]
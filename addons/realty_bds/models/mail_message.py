@@ -0,0 +1,15 @@
+from odoo import fields, models  # type: ignore
+
+
+class MailMessage(models.Model):
+    _inherit = "mail.message"
+
+    # Attributes
+    realty_template = fields.Char(
+        string="Notification Template",
+        help="Key of the realty notification template that rendered the body",
+    )
+    realty_payload = fields.Json(
+        string="Notification Payload",
+        help="Structured data of the realty notification, kept next to the short body",
+    )
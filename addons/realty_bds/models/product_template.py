@@ -1,10 +1,53 @@
 from odoo import models, fields, api  # type: ignore
 from odoo.exceptions import ValidationError, UserError, AccessError  # type: ignore
 from odoo.http import request  # type: ignore
+from odoo.tools.lru import LRU  # type: ignore
 import logging
+from .realty_perf import instrument
 
 _logger = logging.getLogger(__name__)
 
+CARD_FEED_MAX_LIMIT = 200
+# (dbname, lang, listing id) -> (card_date, card); card_date covers the listing and its owner
+_CARD_CACHE = LRU(20000)
+
+# Stored display fields, recomputed in background batches when a record they show changes
+DISPLAY_FIELDS = (
+    "absolute_price",
+    "address",
+    "attributes",
+    "display_price",
+    "price_per_sqm",
+    "price_per_sqm_value",
+)
+
+_CARD_JOINS = """
+      FROM product_template pt
+      LEFT JOIN res_users u ON u.id = pt.create_uid
+      LEFT JOIN res_partner p ON p.id = u.partner_id
+     WHERE pt.id = ANY(%(ids)s)
+"""
+
+_CARD_STAMP_SQL = "SELECT pt.id, GREATEST(pt.write_date, p.write_date)" + _CARD_JOINS
+
+_CARD_SQL = (
+    """
+    SELECT pt.id,
+           COALESCE(pt.name->>%(lang)s, pt.name->>'en_US') AS name,
+           pt.address,
+           pt.attributes,
+           pt.price_per_sqm,
+           pt.display_price,
+           pt.presentation_image_id,
+           pt.approval,
+           pt.create_uid AS owner_id,
+           p.name AS owner_name,
+           to_char(pt.create_date, 'YYYY-MM-DD HH24:MI:SS') AS create_date,
+           to_char(pt.write_date, 'YYYY-MM-DD HH24:MI:SS') AS write_date
+"""
+    + _CARD_JOINS
+)
+
 
 class ProductTemplate(models.Model):
     _inherit = "product.template"
@@ -117,26 +160,34 @@ class ProductTemplate(models.Model):
     )
 
     # Compute Attributes
+    # Names, multipliers and currency formats they show are refreshed by product_display_refresh
     attributes = fields.Char(
-        compute="_compute_attributes", store=False, string="Attributes"
+        compute="_compute_attributes", store=True, string="Attributes"
     )
     price_per_sqm = fields.Char(
-        compute="_compute_price_per_sqm", store=False, string="Million/m²"
+        compute="_compute_price_per_sqm", store=True, string="Million/m²"
+    )
+    price_per_sqm_value = fields.Float(
+        compute="_compute_price_per_sqm",
+        store=True,
+        index=True,
+        digits=(16, 3),
+        string="Million/m² (Value)",
     )
     display_price = fields.Char(
-        compute="_compute_display_price", store=False, string="Price"
+        compute="_compute_display_price", store=True, string="Price"
     )
     absolute_price = fields.Float(
         compute="_compute_absolute_price", store=True, string="Product True Price"
     )
-    address = fields.Char(compute="_compute_address", store=False, string="Address")
+    address = fields.Char(compute="_compute_address", store=True, string="Address")
 
     @api.depends("house_number", "street", "commune_id", "district_id")
     def _compute_address(self):
         for rec in self:
             rec.address = f"{rec.house_number or ''} {rec.street or ''} {rec.commune_id.name or ''} {rec.district_id.name or ''}"
 
-    @api.depends("list_price", "unit_price_id.multiplier")
+    @api.depends("list_price", "unit_price_id")
     def _compute_absolute_price(self):
         for rec in self:
             rec.absolute_price = (rec.list_price or 0.0) * (
@@ -168,7 +219,7 @@ class ProductTemplate(models.Model):
                     parts.append(str(value))
             rec.attributes = " ".join(parts)
 
-    @api.depends("list_price", "real_estate_area")
+    @api.depends("list_price", "real_estate_area", "unit_price_id")
     def _compute_price_per_sqm(self):
         for rec in self:
             multiplier = (
@@ -182,13 +233,15 @@ class ProductTemplate(models.Model):
                 ) / rec.real_estate_area
                 # Format: remove .0 if integer, otherwise keep 3 decimals max
                 rec.price_per_sqm = f"{round(value, 3):.3f}".rstrip("0").rstrip(".")
+                rec.price_per_sqm_value = value
             else:
                 rec.price_per_sqm = "0"
+                rec.price_per_sqm_value = 0
 
-    @api.depends("list_price", "currency_id", "unit_price_id")
+    @api.depends("list_price", "currency_id", "unit_price_id", "company_id")
     def _compute_display_price(self):
         for rec in self:
-            currency = rec.currency_id or rec.env.company.currency_id
+            currency = rec.currency_id or rec.company_id.currency_id or rec.env.company.currency_id
             raw_amount = rec.list_price or 0.0
             if raw_amount % 1:
                 amount = f"{round(raw_amount, 3):.3f}".rstrip("0").rstrip(".")
@@ -200,10 +253,12 @@ class ProductTemplate(models.Model):
                 else "-"
             )
             symbol = currency.symbol or "-"
+            # res.currency.position is "before"/"after": the former "Before Amount"/"After Amount"
+            # test never matched, so stored prices of existing listings gain their symbol on upgrade
             position = currency.position or ""
-            if position == "Before Amount":
+            if position == "before":
                 rec.display_price = f"{symbol} {amount} {unit_name}"
-            elif position == "After Amount":
+            elif position == "after":
                 rec.display_price = f"{amount} {unit_name} {symbol}"
             else:
                 rec.display_price = f"{amount} {unit_name}"
@@ -403,6 +458,7 @@ class ProductTemplate(models.Model):
             if self.company_id != self.env.user.company_id and self.company_id.id != 1:
                 raise AccessError(f"You can only {action} posts from your own company.")
 
+    @instrument()
     def _assign_moderator(self):
         """Assign a moderator using round-robin distribution"""
         company_id = self.env.company.id
@@ -512,6 +568,35 @@ class ProductTemplate(models.Model):
                 )
         return " ".join(parts)
 
+    def _refresh_display_fields(self, fnames=DISPLAY_FIELDS):
+        """Recompute and store the given display fields of these listings now."""
+        for fname in fnames:
+            self.env.add_to_compute(self._fields[fname], self)
+        self.flush_recordset(list(fnames))
+        self.env["realty_change_feed"]._log_changes(self, "write", fnames)
+
+    def _rebuild_address_name(self):
+        """Recompute the stored name from the current address fields; returns how many changed."""
+        renamed = 0
+        for rec in self:
+            name = rec._build_address_name(
+                rec.house_number,
+                rec.street,
+                rec.commune_id.id,
+                rec.district_id.id,
+                rec.real_estate_area,
+                rec.usable_area,
+                rec.number_of_floors,
+                rec.frontage,
+                rec.list_price,
+                rec.unit_price_id.id,
+            )
+            if name != rec.name:
+                # bypass write(), which forbids direct modification of 'name'
+                super(ProductTemplate, rec).write({"name": name})
+                renamed += 1
+        return renamed
+
     # Model Method
     @api.model_create_multi
     def create(self, vals_list):
@@ -533,6 +618,8 @@ class ProductTemplate(models.Model):
             )
             vals["company_id"] = self.env.company.id
         records = super().create(vals_list)
+        for record, vals in zip(records, vals_list):
+            self.env["realty_change_feed"]._log_changes(record, "create", vals)
         for record in records:
             try:
                 all_attachments = record.img_ids | record.private_img_ids
@@ -580,17 +667,17 @@ class ProductTemplate(models.Model):
                 vals.get("unit_price_id"),
             )
 
-        return super().write(vals)
+        res = super().write(vals)
+        self.env["realty_change_feed"]._log_changes(self, "write", vals)
+        return res
+
+    def unlink(self):
+        self.env["realty_change_feed"]._log_changes(self, "unlink")
+        return super().unlink()
 
     @api.ondelete(at_uninstall=False)
     def _unlink_product_attachments(self):
-        IrAttachment = self.env["ir.attachment"]
-
-        for product in self:
-            all_attachments = product.img_ids | product.private_img_ids
-            if all_attachments:
-                attachment_ids = all_attachments.ids
-                IrAttachment.mark_orphaned(attachment_ids, self._name, product.id)
+        self.env["ir.attachment"].mark_records_orphaned(self, ["img_ids", "private_img_ids"])
 
     @api.model
     def set_presentation_image(self, ids, attachment_id):
@@ -598,6 +685,39 @@ class ProductTemplate(models.Model):
         records.write({"presentation_image_id": attachment_id})
         return True
 
+    @api.model
+    @instrument()
+    def get_card_feed(self, domain=None, limit=40, offset=0, order=None):
+        """
+        Kanban card payload of the listings matching domain, read in one query from the
+        stored display fields. Cards are cached until the listing or its owner is written.
+        :return: list of card dicts, in the requested order
+        """
+        limit = min(limit or CARD_FEED_MAX_LIMIT, CARD_FEED_MAX_LIMIT)
+        ids = list(self._search(domain or [], offset=offset, limit=limit, order=order))
+        if not ids:
+            return []
+        self.env.flush_all()
+        cr = self.env.cr
+        params = {"ids": ids}
+        cr.execute(_CARD_STAMP_SQL, params)
+        stamps = dict(cr.fetchall())
+
+        dbname, lang = cr.dbname, self.env.lang or "en_US"
+        cards, missing = {}, []
+        for listing_id in ids:
+            cached = _CARD_CACHE.get((dbname, lang, listing_id))
+            if cached and cached[0] == stamps.get(listing_id):
+                cards[listing_id] = cached[1]
+            else:
+                missing.append(listing_id)
+        if missing:
+            cr.execute(_CARD_SQL, dict(params, ids=missing, lang=lang))
+            for card in cr.dictfetchall():
+                cards[card["id"]] = card
+                _CARD_CACHE[(dbname, lang, card["id"])] = (stamps.get(card["id"]), card)
+        return [dict(cards[listing_id]) for listing_id in ids if listing_id in cards]
+
     # Constraints
     @api.constrains("list_price")
     def _check_price_multiplier(self):
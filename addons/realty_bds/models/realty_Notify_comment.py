@@ -1,13 +1,13 @@
 from odoo import models, fields, api  # type: ignore
 from odoo.exceptions import ValidationError, AccessError, UserError  # type: ignore
 from odoo.http import request  # type: ignore
-from markupsafe import Markup  # type: ignore
 import datetime
 import logging
 import re
 import html
 import unicodedata
 from typing import Optional
+from .realty_perf import instrument
 
 _logger = logging.getLogger(__name__)
 
@@ -99,6 +99,7 @@ class RealtyComment(models.Model):
 
     # Actions
     @api.model
+    @instrument()
     def action_toggle_like(self, comment_id):
         rec = self.sudo().browse(int(comment_id))
         rec.ensure_one()
@@ -287,47 +288,24 @@ class RealtyComment(models.Model):
         if not (res_model and res_id):
             return
         rec = self.env[res_model].sudo().browse(int(res_id))
-        # Build styled HTML body
-        html_body = f"""
-            <div style="font-family: Arial, sans-serif; padding: 15px; background-color: #f9f9f9; border-left: 4px solid #ff6b6b;">
-                <h3 style="color: #333; margin-top: 0;">Comment Removed</h3>
-                <p style="color: #555;">
-                    <strong>Moderator {html.escape(moderator_name)}</strong> has removed your comment.
-                </p>
-                <p style="color: #555; margin-bottom: 10px;">
-                    This comment was removed from
-                    <strong>{html.escape(str(res_model))}</strong>
-                    posted by
-                    <strong>{html.escape(str(rec.create_uid.name or ""))}</strong>.
-                </p>
-                <div style="background: white; padding: 10px; margin: 10px 0; border-radius: 4px;">
-                    <strong>Comment:</strong>
-                    <blockquote style="margin: 10px 0; padding: 10px; background: #f5f5f5; border-left: 3px solid #ddd;">
-                        {html.escape(content or "")}
-                    </blockquote>
-                </div>
-                <p style="color: #555;">
-                    <strong>Reason:</strong> <em>{html.escape(reason or "No reason provided")}</em>
-                </p>
-                <p style="font-size: 0.9em; color: #666; margin-bottom: 0;">
-                    If you disagree with this action, please reply or contact the moderator for more details.
-                </p>
-            </div>
-        """
+        NotifyTemplate = self.env["notify_template"]
+        payload = {
+            "moderator": moderator_name,
+            "model": str(res_model),
+            "owner": str(rec.create_uid.name or ""),
+            "content": content or "",
+            "reason": reason or "No reason provided",
+            "res_id": int(res_id),
+        }
 
         msg = None
 
         # Try to post to the record's chatter
 
         try:
-            rec = self.env[res_model].sudo().browse(int(res_id))
             if rec.exists():
                 try:
-                    msg = rec.sudo().message_post(
-                        body=Markup(html_body),
-                        subject="Comment Removal Notification",
-                        subtype_xmlid="mail.mt_note",
-                    )
+                    msg = NotifyTemplate.post(rec, "comment_removed", payload)
                 except Exception as e:
                     _logger.warning("message_post failed: %s", e)
                     msg = None
@@ -336,14 +314,13 @@ class RealtyComment(models.Model):
 
         # Fallback: create mail.message directly
         if not msg:
-            msg_vals = {
-                "model": res_model or self._name,
-                "res_id": int(res_id) if res_id else False,
-                "body": Markup(html_body),
-                "subject": "Comment Removal Notification",
-                "message_type": "notification",
-                "partner_ids": [(4, target_partner_id)],
-            }
+            msg_vals = dict(
+                NotifyTemplate.message_values("comment_removed", payload),
+                model=res_model or self._name,
+                res_id=int(res_id) if res_id else False,
+                message_type="notification",
+                partner_ids=[(4, target_partner_id)],
+            )
 
             try:
                 msg = self.env["mail.message"].sudo().create(msg_vals)
@@ -353,17 +330,11 @@ class RealtyComment(models.Model):
 
         # Ensure notification exists and is unread
         if msg and msg.exists():
-            self.env["mail.notification"].sudo().create(
-                {
-                    "res_partner_id": target_partner_id,
-                    "notification_type": "inbox",
-                    "mail_message_id": msg.id,
-                    "is_read": False,
-                }
-            )
+            self.env["notify_digest"].deliver(msg, [target_partner_id])
 
     # Model Method
     @api.model
+    @instrument()
     def get_top_level_page(self, res_model, res_id, limit=10, offset=0):
         """Return a page of top-level comments (with total_count for paging)."""
         try:
@@ -495,6 +466,7 @@ class RealtyComment(models.Model):
         recs = super().create([vals])
         if not recs:
             return recs
+        self.env["realty_change_feed"]._log_changes(recs, "create", vals)
         rec = recs[0]
         post.compute_comment_count(True)
         # Prepare payloads: create payload + optional parent_update (coalesced)
@@ -543,12 +515,15 @@ class RealtyComment(models.Model):
     def write(self, vals):
         self.ensure_one()
         if self.env.context.get("skip_custom_realty_write_logic"):
-            return super(RealtyComment, self).write(vals)
+            result = super(RealtyComment, self).write(vals)
+            self.env["realty_change_feed"]._log_changes(self, "write", vals)
+            return result
         content_only = set(vals.keys()) == {"content"} and "content" in vals
         if not content_only:
             raise UserError("Only content field can be updated.")
         vals["content"] = self._sanitize_content(vals.get("content"))
         result = super(RealtyComment, self).write(vals)
+        self.env["realty_change_feed"]._log_changes(self, "write", vals)
 
         if result:
             rec = self.browse(self.id)  # reload to get updated values
@@ -578,6 +553,7 @@ class RealtyComment(models.Model):
     def unlink(self, reason=None):
         if self.env.context.get("skip_realty_delete_custom"):
             # Delete in bulk only happen if user delete the post
+            self.env["realty_change_feed"]._log_changes(self, "unlink")
             return super(RealtyComment, self).unlink()
         self.ensure_one()
         is_owner = self.create_uid.id == self.env.uid
@@ -611,6 +587,7 @@ class RealtyComment(models.Model):
             )
         deleted_id = self.id
         content = self.content
+        self.env["realty_change_feed"]._log_changes(self, "unlink")
         result = super(RealtyComment, self).unlink()
         if result:
             delete_payload = {
@@ -0,0 +1,166 @@
+from odoo import models, fields, api  # type: ignore
+from markupsafe import Markup  # type: ignore
+import logging
+
+_logger = logging.getLogger(__name__)
+
+DIGEST_MODES = ("hourly", "daily")
+DIGEST_PARTNER_BATCH_SIZE = 200
+DIGEST_MAX_ITEMS = 50
+
+
+class NotifyDigest(models.Model):
+    _name = "notify_digest"
+    _description = "Notification waiting to be rolled up into a partner digest"
+    _order = "id asc"
+    _log_access = False
+
+    # Attributes
+    event_date = fields.Datetime(
+        string="Event Date", default=fields.Datetime.now, required=True
+    )
+
+    # Relationship Attributes
+    partner_id = fields.Many2one(
+        "res.partner", string="Partner", required=True, index=True, ondelete="cascade"
+    )
+    message_id = fields.Many2one(
+        "mail.message", string="Message", required=True, ondelete="cascade"
+    )
+
+    _sql_constraints = [
+        (
+            "partner_message_unique",
+            "unique(partner_id, message_id)",
+            "This message is already waiting in the partner's digest!",
+        ),
+    ]
+
+    # Model Method
+    @api.model
+    def stage_digest_partners(self, message, partner_ids):
+        """
+        Buffer the message for partners in digest mode.
+        :return: ids of the partners that still want an immediate notification
+        """
+        if not partner_ids:
+            return []
+        cr = self.env.cr
+        self.env["res.partner"].flush_model(["notification_digest"])
+        cr.execute(
+            """
+            SELECT id FROM res_partner
+             WHERE id = ANY(%s) AND notification_digest = ANY(%s)
+            """,
+            (list(partner_ids), list(DIGEST_MODES)),
+        )
+        digest_ids = {row[0] for row in cr.fetchall()}
+        if digest_ids:
+            cr.execute(
+                """
+                INSERT INTO notify_digest (partner_id, message_id, event_date)
+                SELECT p.id, %s, now() AT TIME ZONE 'UTC'
+                  FROM unnest(%s::int[]) AS p(id)
+                ON CONFLICT (partner_id, message_id) DO NOTHING
+                """,
+                (message.id, list(digest_ids)),
+            )
+        return [pid for pid in partner_ids if pid not in digest_ids]
+
+    @api.model
+    def deliver(self, message, partner_ids):
+        """Notify partners of a message: inbox now, or through their digest."""
+        immediate_ids = self.stage_digest_partners(message, partner_ids)
+        if immediate_ids:
+            self.env["mail.notification"].sudo().create(
+                [
+                    {
+                        "res_partner_id": partner_id,
+                        "notification_type": "inbox",
+                        "mail_message_id": message.id,
+                        "is_read": False,
+                    }
+                    for partner_id in immediate_ids
+                ]
+            )
+        return immediate_ids
+
+    @api.model
+    def _cron_send_digests(self):
+        """
+        Roll staged notifications up into one inbox message per partner.
+        Hourly partners are flushed every run; daily partners once their oldest item is a day old.
+        Partners who left digest mode are flushed too.
+        """
+        cr = self.env.cr
+        self.flush_model()
+        cr.execute(
+            """
+            SELECT d.partner_id
+              FROM notify_digest d
+              JOIN res_partner p ON p.id = d.partner_id
+             GROUP BY d.partner_id, p.notification_digest
+            HAVING p.notification_digest IS DISTINCT FROM 'daily'
+                OR min(d.event_date) <= (now() AT TIME ZONE 'UTC') - interval '1 day'
+            """
+        )
+        partner_ids = [row[0] for row in cr.fetchall()]
+        for start in range(0, len(partner_ids), DIGEST_PARTNER_BATCH_SIZE):
+            batch = partner_ids[start:start + DIGEST_PARTNER_BATCH_SIZE]
+            self._send_digests(batch)
+            cr.commit()
+            _logger.info(
+                "Notification digests sent %s/%s",
+                min(start + DIGEST_PARTNER_BATCH_SIZE, len(partner_ids)),
+                len(partner_ids),
+            )
+
+    # Helper method
+    @api.model
+    def _send_digests(self, partner_ids):
+        items = self.sudo().search([("partner_id", "in", partner_ids)], order="id")
+        NotifyTemplate = self.env["notify_template"]
+        Message = self.env["mail.message"].sudo()
+        notif_vals = []
+        for partner, partner_items in items.grouped("partner_id").items():
+            lines = [
+                NotifyTemplate.render_summary(
+                    item.message_id.realty_template, item.message_id.realty_payload
+                )
+                or item.message_id.subject
+                or item.message_id.record_name
+                or ""
+                for item in partner_items[:DIGEST_MAX_ITEMS]
+            ]
+            if len(partner_items) > DIGEST_MAX_ITEMS:
+                lines.append(f"... and {len(partner_items) - DIGEST_MAX_ITEMS} more")
+            payload = {
+                "count": len(partner_items),
+                "since": fields.Datetime.to_string(partner_items[0].event_date),
+                "items": Markup("").join(Markup("<li>{}</li>").format(line) for line in lines),
+                "message_ids": partner_items.message_id.ids,
+            }
+            values = NotifyTemplate.message_values("digest", payload)
+            # The payload must stay JSON: keep the message ids, not the rendered list
+            values["realty_payload"] = {
+                key: value for key, value in payload.items() if key != "items"
+            }
+            msg = Message.create(
+                dict(
+                    values,
+                    model="res.partner",
+                    res_id=partner.id,
+                    message_type="notification",
+                )
+            )
+            notif_vals.append(
+                {
+                    "res_partner_id": partner.id,
+                    "notification_type": "inbox",
+                    "mail_message_id": msg.id,
+                    "is_read": False,
+                }
+            )
+        if notif_vals:
+            self.env["mail.notification"].sudo().create(notif_vals)
+        items.unlink()
@@ -0,0 +1,213 @@
+from odoo import models, fields, api  # type: ignore
+from odoo.exceptions import AccessError  # type: ignore
+import logging
+import time
+
+_logger = logging.getLogger(__name__)
+
+FANOUT_BATCH_SIZE = 5000
+BENCHMARK_SIZES = (10000, 50000, 100000)
+
+
+class _BenchmarkRollback(Exception):
+    """Raised to roll back the savepoint holding benchmark data."""
+
+
+class NotifyFanout(models.Model):
+    _name = "notify_fanout"
+    _description = "Approval event delivered to the author's subscribers in background batches"
+    _order = "id asc"
+
+    # Attributes
+    res_model = fields.Char(string="Model", required=True)
+    res_id = fields.Integer(string="Record ID", required=True)
+    state = fields.Selection(
+        [
+            ("pending", "Pending"),
+            ("done", "Done"),
+        ],
+        string="Status",
+        default="pending",
+        required=True,
+        index=True,
+    )
+    last_partner_id = fields.Integer(
+        string="Cursor", default=0, help="Highest subscriber id already processed"
+    )
+    notified_count = fields.Integer(string="Notified", default=0)
+
+    # Relationship Attributes
+    message_id = fields.Many2one(
+        "mail.message", string="Message", required=True, ondelete="cascade"
+    )
+    author_partner_id = fields.Many2one(
+        "res.partner", string="Author", required=True, ondelete="cascade"
+    )
+
+    # Model Method
+    @api.model
+    def enqueue(self, message, author_partner):
+        """Record an approval event and wake up the fan-out worker."""
+        event = self.sudo().create(
+            {
+                "res_model": message.model,
+                "res_id": message.res_id,
+                "message_id": message.id,
+                "author_partner_id": author_partner.id,
+            }
+        )
+        cron = self.env.ref("realty_bds.ir_cron_notify_fanout", raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+        return event
+
+    @api.model
+    def _cron_process_fanouts(self, batch_size=FANOUT_BATCH_SIZE):
+        """Deliver pending events batch by batch, committing after each batch."""
+        for event in self.sudo().search([("state", "=", "pending")]):
+            while event.state == "pending":
+                event._deliver_batch(batch_size)
+                self.env.cr.commit()
+
+    # Helper method
+    def _deliver_batch(self, batch_size=FANOUT_BATCH_SIZE):
+        """
+        Insert inbox notifications for the next batch of subscribers (by partner id).
+        Partners already notified of the message are skipped.
+        :return: number of notifications inserted
+        """
+        self.ensure_one()
+        cr = self.env.cr
+        self.env["res.partner"].flush_model(["subscriber_partner_ids"])
+        self.env["mail.notification"].flush_model()
+        cr.execute(
+            """
+            SELECT subscribed_partner_id
+              FROM partner_subscribe_rel
+             WHERE partner_id = %s
+               AND subscribed_partner_id > %s
+               AND subscribed_partner_id <> %s
+             ORDER BY subscribed_partner_id
+             LIMIT %s
+            """,
+            (
+                self.author_partner_id.id,
+                self.last_partner_id,
+                self.author_partner_id.id,
+                batch_size,
+            ),
+        )
+        partner_ids = [row[0] for row in cr.fetchall()]
+        if not partner_ids:
+            self.write({"state": "done"})
+            return 0
+
+        # Partners in digest mode get the message in their next digest instead
+        immediate_ids = self.env["notify_digest"].stage_digest_partners(
+            self.message_id, partner_ids
+        )
+        cr.execute(
+            """
+            INSERT INTO mail_notification
+                   (mail_message_id, res_partner_id, author_id,
+                    notification_type, notification_status, is_read)
+            SELECT m.id, p.id, m.author_id, 'inbox', 'sent', FALSE
+              FROM unnest(%s::int[]) AS p(id), mail_message m
+             WHERE m.id = %s
+               AND NOT EXISTS (
+                   SELECT 1 FROM mail_notification n
+                    WHERE n.mail_message_id = m.id AND n.res_partner_id = p.id
+             )
+            RETURNING res_partner_id
+            """,
+            (immediate_ids, self.message_id.id),
+        )
+        notified_ids = [row[0] for row in cr.fetchall()]
+        self.env["mail.notification"].invalidate_model()
+        self.message_id.invalidate_recordset()
+
+        # One ping per partner so open inboxes refresh (realty_notify/js/inbox_listener.js).
+        # Bus rows are queued until commit, a savepoint rollback keeps them: no benchmark pings
+        if notified_ids and not self.env.context.get("notify_fanout_benchmark"):
+            payload = {"message_id": self.message_id.id, "model": self.res_model}
+            self.env["bus.bus"]._sendmany(
+                [
+                    (partner, "realty_notify/inbox", payload)
+                    for partner in self.env["res.partner"].browse(notified_ids)
+                ]
+            )
+
+        self.write(
+            {
+                "last_partner_id": partner_ids[-1],
+                "notified_count": self.notified_count
+                + len(notified_ids)
+                + len(partner_ids)
+                - len(immediate_ids),
+                "state": "done" if len(partner_ids) < batch_size else "pending",
+            }
+        )
+        return len(notified_ids)
+
+    # Benchmark
+    @api.model
+    def benchmark(self, sizes=BENCHMARK_SIZES, batch_size=FANOUT_BATCH_SIZE):
+        """
+        Time the delivery of one approval to 10k/50k/100k subscribers.
+        Synthetic partners are inserted in a savepoint that is rolled back afterwards.
+        Run from an Odoo shell: env["notify_fanout"].benchmark()
+        :return: {size: {"seconds": float, "notified": int}}
+        """
+        if not self.env.is_superuser() and not self.env.user.has_group("base.group_system"):
+            raise AccessError("Only administrators can run the fan-out benchmark.")
+
+        cr = self.env.cr
+        results = {}
+        for size in sizes:
+            try:
+                with cr.savepoint():
+                    author = self.env["res.partner"].sudo().create(
+                        {"name": f"Fan-out benchmark author {size}"}
+                    )
+                    cr.execute(
+                        """
+                        WITH subscribers AS (
+                            INSERT INTO res_partner (name, active, type, create_date, write_date)
+                            SELECT 'Fan-out subscriber ' || g, TRUE, 'contact',
+                                   now() AT TIME ZONE 'UTC', now() AT TIME ZONE 'UTC'
+                              FROM generate_series(1, %s) AS g
+                            RETURNING id
+                        )
+                        INSERT INTO partner_subscribe_rel (partner_id, subscribed_partner_id)
+                        SELECT %s, id FROM subscribers
+                        """,
+                        (size, author.id),
+                    )
+                    message = self.env["mail.message"].sudo().create(
+                        {
+                            "model": "res.partner",
+                            "res_id": author.id,
+                            "body": "Fan-out benchmark",
+                            "message_type": "notification",
+                        }
+                    )
+                    event = self.sudo().with_context(notify_fanout_benchmark=True).create(
+                        {
+                            "res_model": "res.partner",
+                            "res_id": author.id,
+                            "message_id": message.id,
+                            "author_partner_id": author.id,
+                        }
+                    )
+                    start = time.perf_counter()
+                    while event.state == "pending":
+                        event._deliver_batch(batch_size)
+                    results[size] = {
+                        "seconds": round(time.perf_counter() - start, 3),
+                        "notified": event.notified_count,
+                    }
+                    _logger.info("Fan-out benchmark %s subscribers: %s", size, results[size])
+                    raise _BenchmarkRollback()
+            except _BenchmarkRollback:
+                self.env.invalidate_all()
+        return results
@@ -0,0 +1,111 @@
+from odoo import models, api  # type: ignore
+from odoo.exceptions import UserError  # type: ignore
+from markupsafe import Markup  # type: ignore
+
+# Precompiled notification templates: Markup.format() escapes every value.
+# Bodies stay short; styling lives in static/src/realty_notify/css/notify_message.css
+# and the full event data is stored as a structured payload on the message.
+NOTIFICATION_TEMPLATES = {
+    "new_post": {
+        "subject": "New post",
+        "body": Markup(
+            '<div class="o_realty_notice o_realty_notice_post">'
+            "<p>📢 <strong>{author}</strong> has shared a new post in <strong>{model}</strong>:</p>"
+            '<p class="o_realty_notice_title">{title}</p>'
+            "</div>"
+        ),
+        "summary": "{author} shared a new post: {title}",
+    },
+    "comment_removed": {
+        "subject": "Comment Removal Notification",
+        "body": Markup(
+            '<div class="o_realty_notice o_realty_notice_removed">'
+            "<p><strong>Moderator {moderator}</strong> has removed your comment on "
+            "<strong>{model}</strong> posted by <strong>{owner}</strong>.</p>"
+            "<blockquote>{content}</blockquote>"
+            "<p><strong>Reason:</strong> <em>{reason}</em></p>"
+            "</div>"
+        ),
+        "summary": "Moderator {moderator} removed your comment on {model}",
+    },
+    "user_signup": {
+        "subject": "New user signup",
+        "body": Markup(
+            '<div class="o_realty_notice o_realty_notice_signup">'
+            "<p>🎉 <strong>{name}</strong> has just created an account.</p>"
+            "<p><strong>Email:</strong> {email}</p>"
+            "</div>"
+        ),
+        "summary": "{name} has just created an account ({email})",
+    },
+    "digest": {
+        "subject": "Notification digest",
+        "body": Markup(
+            '<div class="o_realty_notice o_realty_notice_digest">'
+            "<p>🗂 <strong>{count}</strong> notifications since {since}</p>"
+            "<ul>{items}</ul>"
+            "</div>"
+        ),
+    },
+}
+
+
+class NotifyTemplate(models.AbstractModel):
+    _name = "notify_template"
+    _description = "Shared templates for realty notification messages"
+
+    # Model Method
+    @api.model
+    def render(self, template_key, payload):
+        """
+        Render a notification once per event.
+        :param template_key: key of NOTIFICATION_TEMPLATES
+        :param payload: dict of template values (plain, JSON-serializable)
+        :return: (subject, body Markup)
+        """
+        template = NOTIFICATION_TEMPLATES.get(template_key)
+        if not template:
+            raise UserError(f"❌ Error: Unknown notification template '{template_key}'!")
+        values = {key: "" if value is None else value for key, value in payload.items()}
+        return template["subject"], template["body"].format(**values)
+
+    @api.model
+    def render_summary(self, template_key, payload):
+        """One-line plain text summary of a notification, used by digests (None if unknown)."""
+        template = NOTIFICATION_TEMPLATES.get(template_key or "")
+        if not template or "summary" not in template or not isinstance(payload, dict):
+            return None
+        values = {key: "" if value is None else value for key, value in payload.items()}
+        try:
+            return template["summary"].format(**values)
+        except (KeyError, IndexError):
+            return None
+
+    @api.model
+    def message_values(self, template_key, payload):
+        """Values for a mail.message holding the short body and its structured payload."""
+        subject, body = self.render(template_key, payload)
+        return {
+            "subject": subject,
+            "body": body,
+            "realty_template": template_key,
+            "realty_payload": payload,
+        }
+
+    @api.model
+    def post(self, record, template_key, payload, subtype_xmlid="mail.mt_note"):
+        """message_post a rendered template on record and tag the message with its payload."""
+        values = self.message_values(template_key, payload)
+        msg = record.sudo().message_post(
+            body=values["body"],
+            subject=values["subject"],
+            subtype_xmlid=subtype_xmlid,
+        )
+        if msg:
+            msg.sudo().write(
+                {
+                    "realty_template": values["realty_template"],
+                    "realty_payload": values["realty_payload"],
+                }
+            )
+        return msg
@@ -1,5 +1,6 @@
 from odoo import models, fields, api  # type: ignore
 from odoo.exceptions import AccessError, UserError  # type: ignore
+from .realty_perf import instrument
 
 
 class UrgentBuying(models.Model):
@@ -52,6 +53,7 @@ class UrgentBuying(models.Model):
             post.like_count = len(post.like_user_ids)
 
     # Action
+    @instrument()
     def action_toggle_like(self):
         """Add/remove current user from like_user_ids"""
         if not self or not self.exists():
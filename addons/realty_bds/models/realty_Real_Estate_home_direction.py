@@ -38,6 +38,12 @@ class HomeDirection(models.Model):
             vals["company_id"] = self.env.company.id
         return super().create(vals_list)
 
+    def write(self, vals):
+        res = super().write(vals)
+        if {"name"} & set(vals):
+            self.env["product_display_refresh"].enqueue(self)
+        return res
+
     # Constrain
     _sql_constraints = [
         (
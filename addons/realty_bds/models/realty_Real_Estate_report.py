@@ -186,13 +186,7 @@ class ProductReport(models.Model):
 
     @api.ondelete(at_uninstall=False)
     def _unlink_report_attachments(self):
-        IrAttachment = self.env["ir.attachment"]
-
-        for report in self:
-            all_attachments = report.img_ids
-            if all_attachments:
-                attachment_ids = all_attachments.ids
-                IrAttachment.mark_orphaned(attachment_ids, self._name, report.id)
+        self.env["ir.attachment"].mark_records_orphaned(self, ["img_ids"])
 
     # Constrain
     _sql_constraints = [
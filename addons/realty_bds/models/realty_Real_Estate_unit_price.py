@@ -33,6 +33,12 @@ class UnitPrice(models.Model):
             vals["company_id"] = self.env.company.id
         return super().create(vals_list)
 
+    def write(self, vals):
+        res = super().write(vals)
+        if {"name", "multiplier"} & set(vals):
+            self.env["product_display_refresh"].enqueue(self)
+        return res
+
     # Constrain
     _sql_constraints = [
         (
@@ -0,0 +1,308 @@
+from odoo import models, api  # type: ignore
+from odoo.exceptions import AccessError, UserError  # type: ignore
+from collections import Counter, defaultdict
+import logging
+import random
+
+from .realty_data_generator import GENERATOR_VOLUMES, clone_rows
+
+_logger = logging.getLogger(__name__)
+
+ASSIGNMENT_MODELS = (
+    "product.template",
+    "notification",
+    "congratulation",
+    "guideline",
+    "urgent_buying",
+)
+
+
+def _percentile(values, ratio):
+    ordered = sorted(values)
+    if not ordered:
+        return 0
+    return ordered[min(len(ordered) - 1, int(round(ratio * (len(ordered) - 1))))]
+
+
+def _distribution(values):
+    return {
+        "p50": round(_percentile(values, 0.5), 3),
+        "p95": round(_percentile(values, 0.95), 3),
+        "p99": round(_percentile(values, 0.99), 3),
+        "max": round(max(values), 3) if values else 0,
+    }
+
+
+class RealtyAssignmentLoad(models.AbstractModel):
+    _name = "realty_assignment_load"
+    _description = "Fixtures and checks of the moderator assignment load harness"
+
+    # Model Method
+    @api.model
+    def prepare(
+        self,
+        companies=2,
+        moderators=5,
+        posters=10,
+        posts=50,
+        model_names=ASSIGNMENT_MODELS,
+        resend_ratio=0.3,
+        prefix="Load",
+        seed=42,
+    ):
+        """
+        Create companies with moderators and posters, and posts waiting to be sent (draft)
+        or resent (rejected), for every model using the round-robin moderator assignment.
+        :param posts: posts per company and model
+        :return: plan with the shuffled jobs and the sequence state before the run
+        """
+        if not self.env.is_superuser():
+            raise AccessError("The assignment load harness runs as superuser only.")
+        unknown = set(model_names) - set(ASSIGNMENT_MODELS)
+        if unknown:
+            raise UserError(f"❌ Error: No moderator assignment on {', '.join(sorted(unknown))}.")
+        env = self.env
+        data = env["realty_data_generator"].generate(
+            volumes={key: 1 for key in GENERATOR_VOLUMES}, prefix=prefix
+        )
+        tag = data["tag"]
+        groups = {
+            model: env["permission_tracker"]._get_permission_groups(model)
+            for model in model_names
+        }
+        company_ids = (
+            env["res.company"]
+            .create([{"name": f"{tag} Company {i}"} for i in range(1, companies + 1)])
+            .ids
+        )
+        moderator_group_ids = [env.ref(groups[m]["moderator_group"]).id for m in model_names]
+        user_group_ids = [env.ref(groups[m]["user_group"]).id for m in model_names]
+        moderator_ids, poster_ids = {}, {}
+        for company_id in company_ids:
+            moderator_ids[company_id] = self._create_users(
+                tag, company_id, "moderator", moderators, moderator_group_ids
+            )
+            poster_ids[company_id] = self._create_users(
+                tag, company_id, "poster", posters, user_group_ids
+            )
+        env.flush_all()
+
+        jobs = []
+        for model in model_names:
+            template = self._post_template(model, data, company_ids[0])
+            for company_id in company_ids:
+                post_ids = self._clone_posts(
+                    template, tag, company_id, poster_ids[company_id], posts, resend_ratio
+                )
+                self.env.cr.execute(
+                    f'SELECT id, approval, create_uid FROM "{template._table}" WHERE id = ANY(%s)',
+                    (post_ids,),
+                )
+                jobs += [
+                    {
+                        "model": model,
+                        "res_id": res_id,
+                        "action": "action_resend" if approval == "rejected" else "action_send",
+                        "uid": uid,
+                        "company_id": company_id,
+                        "key": f"{company_id}/{model}",
+                    }
+                    for res_id, approval, uid in self.env.cr.fetchall()
+                ]
+        random.Random(seed).shuffle(jobs)
+        _logger.info(
+            "Assignment load: %s jobs over %s companies and %s models",
+            len(jobs),
+            len(company_ids),
+            len(model_names),
+        )
+        return {
+            "tag": tag,
+            "jobs": jobs,
+            "baseline": self._sequence_counts(company_ids, model_names),
+            "moderators": {
+                f"{company_id}/{model}": moderator_ids[company_id]
+                for company_id in company_ids
+                for model in model_names
+            },
+            "company_ids": company_ids,
+            "model_names": list(model_names),
+        }
+
+    @api.model
+    def analyze(self, plan, results, wall_seconds):
+        """
+        Check the committed assignments against the plan: every assignment must get
+        its own sequence number (no duplicates, no gaps), match the stored moderator and
+        keep the round-robin balanced between the moderators of its company.
+        :param results: one dict per job, as returned by the harness workers
+        :return: JSON-serializable report
+        """
+        final = self._sequence_counts(plan["company_ids"], plan["model_names"])
+        stored = self._stored_moderators(results)
+        by_key = defaultdict(list)
+        for result in results:
+            by_key[result["key"]].append(result)
+
+        report_keys = {}
+        healthy = True
+        for key, key_results in sorted(by_key.items()):
+            done = [r for r in key_results if not r["error"]]
+            tickets = Counter(r["ticket"] for r in done if r["ticket"])
+            before, after = plan["baseline"].get(key, 0), final.get(key, 0)
+            per_moderator = Counter(r["moderator_id"] for r in done if r["moderator_id"])
+            counts = [per_moderator.get(uid, 0) for uid in plan["moderators"][key]]
+            checks = {
+                "duplicate_tickets": sorted(t for t, n in tickets.items() if n > 1),
+                "skipped_tickets": sorted(set(range(before + 1, after + 1)) - set(tickets)),
+                "lost_updates": len(done) - (after - before),
+                "unassigned": [r["res_id"] for r in done if not r["moderator_id"]],
+                "stored_mismatch": [
+                    r["res_id"]
+                    for r in done
+                    if stored.get((r["model"], r["res_id"])) != r["moderator_id"]
+                ],
+                "fairness_spread": (max(counts) - min(counts)) if counts else 0,
+            }
+            key_ok = (
+                not checks["duplicate_tickets"]
+                and not checks["skipped_tickets"]
+                and not checks["lost_updates"]
+                and not checks["unassigned"]
+                and not checks["stored_mismatch"]
+                and checks["fairness_spread"] <= 1
+            )
+            healthy = healthy and key_ok
+            report_keys[key] = dict(
+                checks,
+                ok=key_ok,
+                jobs=len(key_results),
+                assigned=len(done),
+                errors=len(key_results) - len(done),
+                assignments_per_moderator=dict(per_moderator),
+                lock_wait_ms=_distribution([r["lock_wait_ms"] for r in done]),
+                duration_ms=_distribution([r["duration_ms"] for r in done]),
+            )
+
+        done = [r for r in results if not r["error"]]
+        errors = Counter(
+            f"{r['model']}.{r['action']}: {r['error']}" for r in results if r["error"]
+        )
+        per_worker = Counter(r["worker"] for r in done)
+        return {
+            "tag": plan["tag"],
+            "ok": healthy,
+            "jobs": len(results),
+            "assigned": len(done),
+            "wall_seconds": round(wall_seconds, 3),
+            "throughput_per_second": round(len(done) / wall_seconds, 2) if wall_seconds else 0,
+            "worker_throughput_per_second": {
+                str(worker): round(count / wall_seconds, 2) if wall_seconds else 0
+                for worker, count in sorted(per_worker.items())
+            },
+            "lock_wait_ms": _distribution([r["lock_wait_ms"] for r in done]),
+            "lock_wait_share": round(
+                sum(r["lock_wait_ms"] for r in done) / (sum(r["duration_ms"] for r in done) or 1), 3
+            ),
+            "duration_ms": _distribution([r["duration_ms"] for r in done]),
+            "errors": dict(errors.most_common(20)),
+            "keys": report_keys,
+        }
+
+    # Helper method
+    def _create_users(self, tag, company_id, role, count, group_ids):
+        cr = self.env.cr
+        self.env["res.partner"].flush_model(["citizen_id"])
+        cr.execute(
+            "SELECT coalesce(max(citizen_id::bigint), 0) FROM res_partner WHERE citizen_id ~ '^[0-9]{12}$'"
+        )
+        citizen_base = max(cr.fetchone()[0], 100000000000)
+        slug = tag.lower().replace(" ", "_")
+        users = self.env["res.users"].with_context(no_reset_password=True).provision_users(
+            [
+                {
+                    "name": f"{tag} {role} {company_id}-{i}",
+                    "login": f"{slug}_{role}_{company_id}_{i}",
+                    "citizen_id": str(citizen_base + i),
+                    "company_id": company_id,
+                    "company_ids": [(6, 0, [company_id])],
+                    "groups_id": [(4, group_id) for group_id in group_ids],
+                }
+                for i in range(1, count + 1)
+            ]
+        )
+        return users.ids
+
+    def _post_template(self, model, data, company_id):
+        if model == "product.template":
+            return data["listing"]
+        vals = {"name": f"{data['tag']} {model}", "content": "Assignment load"}
+        if model == "urgent_buying":
+            reason = self.env["reasons_buy"].sudo().create({"name": f"{data['tag']} reason"})
+            vals.update(
+                demand="Assignment load",
+                area="100",
+                finance="5",
+                region_id=data["region"].id,
+                district_id=data["district"].id,
+                reason_buy_id=reason.id,
+            )
+        record = self.env[model].sudo().with_company(company_id).create(vals)
+        record.flush_recordset()
+        return record
+
+    def _clone_posts(self, template, tag, company_id, poster_ids, count, resend_ratio):
+        """Posts of one company owned by its posters; every resend_ratio-th one was rejected."""
+        name = "%(tag)s || ' ' || %(model)s || ' ' || %(company_id)s || '-' || s.g"
+        if template._fields["name"].translate:
+            name = f"jsonb_build_object('en_US', {name})"
+        rejected = "floor(s.g * %(resend_ratio)s) <> floor((s.g - 1) * %(resend_ratio)s)"
+        return clone_rows(
+            self.env.cr,
+            template._table,
+            template.id,
+            count,
+            overrides={
+                "name": name,
+                "company_id": "%(company_id)s",
+                "create_uid": "(%(poster_ids)s::int[])[1 + s.g %% %(n_posters)s]",
+                "approval": f"CASE WHEN {rejected} THEN 'rejected' ELSE 'draft' END",
+                "edit_counter": f"CASE WHEN {rejected} THEN 1 ELSE -1 END",
+                "reason": f"CASE WHEN {rejected} THEN 'Assignment load' END",
+                "moderator_id": "NULL",
+            },
+            params={
+                "tag": tag,
+                "model": template._name,
+                "company_id": company_id,
+                "poster_ids": poster_ids,
+                "n_posters": len(poster_ids),
+                "resend_ratio": resend_ratio,
+            },
+        )
+
+    def _sequence_counts(self, company_ids, model_names):
+        self.env["moderator_assignment_sequence"].flush_model()
+        self.env.cr.execute(
+            """
+            SELECT company_id, model_name, sum(assignment_count)
+              FROM moderator_assignment_sequence
+             WHERE company_id = ANY(%s) AND model_name = ANY(%s)
+             GROUP BY company_id, model_name
+            """,
+            (company_ids, list(model_names)),
+        )
+        return {f"{company_id}/{model}": count for company_id, model, count in self.env.cr.fetchall()}
+
+    def _stored_moderators(self, results):
+        stored = {}
+        ids_by_model = defaultdict(list)
+        for result in results:
+            ids_by_model[result["model"]].append(result["res_id"])
+        for model, ids in ids_by_model.items():
+            self.env.cr.execute(
+                f'SELECT id, moderator_id FROM "{self.env[model]._table}" WHERE id = ANY(%s)',
+                (ids,),
+            )
+            stored.update(((model, res_id), uid) for res_id, uid in self.env.cr.fetchall())
+        return stored
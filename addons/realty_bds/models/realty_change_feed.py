@@ -0,0 +1,178 @@
+from odoo import models, fields, api  # type: ignore
+from odoo.exceptions import AccessError  # type: ignore
+import json
+import logging
+
+_logger = logging.getLogger(__name__)
+
+FEED_PUBLISH_BATCH = 5000
+FEED_READ_LIMIT = 1000
+FEED_RETENTION_DAYS = 30
+# pg_try_advisory_xact_lock key of the single publisher
+FEED_PUBLISH_LOCK = 0x7265616C
+
+
+class RealtyChangeFeed(models.Model):
+    _name = "realty_change_feed"
+    _description = "Append-only change feed of listings, notify posts and comments"
+    _order = "id desc"
+    _log_access = False
+
+    # Attributes
+    model = fields.Char(string="Model", required=True, index=True)
+    res_id = fields.Integer(string="Record ID", required=True)
+    op = fields.Selection(
+        [
+            ("create", "Create"),
+            ("write", "Write"),
+            ("unlink", "Unlink"),
+        ],
+        string="Operation",
+        required=True,
+    )
+    changed_fields = fields.Json(string="Changed Fields")
+    seq = fields.Integer(
+        string="Position",
+        readonly=True,
+        help="Feed cursor, assigned once every earlier transaction has finished",
+    )
+    logged_at = fields.Datetime(string="Logged At", required=True)
+
+    def init(self):
+        cr = self.env.cr
+        # Transaction of the change: a 64-bit txid the ORM has no field type for
+        cr.execute(
+            """
+            ALTER TABLE realty_change_feed
+              ADD COLUMN IF NOT EXISTS txid bigint NOT NULL DEFAULT txid_current()
+            """
+        )
+        cr.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS realty_change_feed_seq_idx
+                ON realty_change_feed (seq) WHERE seq IS NOT NULL
+            """
+        )
+        cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS realty_change_feed_unpublished_idx
+                ON realty_change_feed (txid, id) WHERE seq IS NULL
+            """
+        )
+
+    # Model Method
+    @api.model
+    def _log_changes(self, records, op, fnames=None):
+        """
+        Append one row per record, in the caller's transaction: a rolled back change
+        leaves no trace in the feed.
+        """
+        ids = [record_id for record_id in records.ids if isinstance(record_id, int)]
+        if not ids:
+            return
+        self.env.cr.execute(
+            """
+            INSERT INTO realty_change_feed (model, res_id, op, changed_fields, logged_at)
+            SELECT %s, r.id, %s, %s::jsonb, now() AT TIME ZONE 'UTC'
+              FROM unnest(%s::int[]) AS r(id)
+            """,
+            (records._name, op, json.dumps(sorted(fnames)) if fnames else None, ids),
+        )
+
+    @api.model
+    def read_changes(self, cursor=0, limit=FEED_READ_LIMIT, model_names=None):
+        """
+        Changes after cursor, in feed order.
+        :param cursor: last position the consumer processed (0 to start from the oldest kept)
+        :param model_names: only return changes of these models
+        :return: {"cursor": next cursor, "changes": [...], "more": bool}
+        """
+        self._check_feed_access()
+        self._publish()
+        limit = max(1, min(int(limit or FEED_READ_LIMIT), FEED_READ_LIMIT))
+        model_filter = "AND model = ANY(%(models)s)" if model_names else ""
+        cr = self.env.cr
+        cr.execute(
+            f"""
+            SELECT seq, model, res_id, op, changed_fields,
+                   to_char(logged_at, 'YYYY-MM-DD HH24:MI:SS')
+              FROM realty_change_feed
+             WHERE seq > %(cursor)s {model_filter}
+             ORDER BY seq
+             LIMIT %(limit)s
+            """,
+            {"cursor": int(cursor or 0), "models": list(model_names or []), "limit": limit + 1},
+        )
+        rows = cr.fetchall()
+        changes = [
+            {
+                "seq": seq,
+                "model": model,
+                "res_id": res_id,
+                "op": op,
+                "fields": changed_fields,
+                "at": logged_at,
+            }
+            for seq, model, res_id, op, changed_fields, logged_at in rows[:limit]
+        ]
+        if changes:
+            next_cursor = changes[-1]["seq"]
+        else:
+            # Nothing matched: skip past what the filter left out
+            cr.execute("SELECT COALESCE(max(seq), 0) FROM realty_change_feed")
+            next_cursor = max(int(cursor or 0), cr.fetchone()[0])
+        return {"cursor": next_cursor, "changes": changes, "more": len(rows) > limit}
+
+    @api.model
+    def _cron_gc_feed(self, retention_days=FEED_RETENTION_DAYS):
+        self._publish()
+        self.env.cr.execute(
+            """
+            DELETE FROM realty_change_feed
+             WHERE seq IS NOT NULL
+               AND logged_at < (now() AT TIME ZONE 'UTC') - %s * interval '1 day'
+            """,
+            (retention_days,),
+        )
+        _logger.info("Realty change feed: %s old changes removed", self.env.cr.rowcount)
+
+    # Helper method
+    @api.model
+    def _check_feed_access(self):
+        if not (self.env.is_superuser() or self.env.user.has_group("base.group_system")):
+            raise AccessError("Only administrators can read the change feed.")
+
+    @api.model
+    def _publish(self, batch_size=FEED_PUBLISH_BATCH):
+        """
+        Give feed positions to the changes of finished transactions. Ids are allocated
+        at insert time, so a committed id can still be overtaken by a smaller one from a
+        longer transaction; positions follow (txid, id) and are only handed out below the
+        oldest running transaction, so a consumer never sees a position appear behind it.
+        :return: number of changes published
+        """
+        cr = self.env.cr
+        cr.execute("SELECT pg_try_advisory_xact_lock(%s)", (FEED_PUBLISH_LOCK,))
+        if not cr.fetchone()[0]:
+            # Another transaction is publishing; its positions show up once it commits
+            return 0
+        cr.execute(
+            """
+            WITH base AS (
+                SELECT COALESCE(max(seq), 0) AS seq FROM realty_change_feed
+            ), ready AS (
+                SELECT id, row_number() OVER (ORDER BY txid, id) AS n
+                  FROM realty_change_feed
+                 WHERE seq IS NULL
+                   AND txid < txid_snapshot_xmin(txid_current_snapshot())
+                 ORDER BY txid, id
+                 LIMIT %s
+            )
+            UPDATE realty_change_feed f
+               SET seq = base.seq + ready.n
+              FROM ready, base
+             WHERE f.id = ready.id
+            """,
+            (batch_size,),
+        )
+        return cr.rowcount
@@ -0,0 +1,511 @@
+from odoo import models, api  # type: ignore
+from odoo.exceptions import AccessError  # type: ignore
+import base64
+import logging
+import time
+import uuid
+
+_logger = logging.getLogger(__name__)
+
+# Default cardinalities of a production-sized database
+GENERATOR_VOLUMES = {
+    "communes": 10000,
+    "users": 50000,
+    "listings": 200000,
+    "attachments": 500000,
+    "comments": 1000000,
+    "types": 8,
+    "statuses": 4,
+    "land_titles": 4,
+    "features": 12,
+}
+GENERATOR_SKEW = 2.0
+COMMUNES_PER_DISTRICT = 100
+FEATURES_PER_LISTING = 3
+GENERATOR_MODERATORS = 20
+DISPLAY_CHUNK_SIZE = 5000
+
+PIXEL_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+
+def clone_rows(cr, table, source_id, count, overrides=None, series=None, params=None):
+    """
+    INSERT count copies of row source_id of table in one statement.
+    Columns keep the source value unless overridden by an SQL expression, which may use
+    s.g (1..count), s.new_id and the extra series columns. Named params only (%(name)s).
+    :return: ids of the new rows, in series order
+    """
+    cr.execute(
+        """
+        SELECT column_name FROM information_schema.columns
+         WHERE table_schema = current_schema() AND table_name = %s AND column_name <> 'id'
+         ORDER BY ordinal_position
+        """,
+        (table,),
+    )
+    columns = [row[0] for row in cr.fetchall()]
+    overrides = overrides or {}
+    series_sql = "".join(f", {expr} AS {name}" for name, expr in (series or {}).items())
+    cr.execute(
+        f"""
+        INSERT INTO "{table}" (id, {", ".join(f'"{column}"' for column in columns)})
+        SELECT s.new_id, {", ".join(overrides.get(column, f'src."{column}"') for column in columns)}
+          FROM (SELECT g, nextval('{table}_id_seq') AS new_id{series_sql}
+                  FROM generate_series(1, %(count)s) AS g) AS s,
+               "{table}" AS src
+         WHERE src.id = %(source_id)s
+         ORDER BY s.g
+        RETURNING id
+        """,
+        dict(params or {}, count=count, source_id=source_id),
+    )
+    return [row[0] for row in cr.fetchall()]
+
+
+def skewed_index(size_param, skew_param="skew"):
+    """SQL for an index in 1..size where low indexes are hot (power-law skew, 1 = uniform)."""
+    return f"(1 + floor(%({size_param})s * power(random(), %({skew_param})s)))::int"
+
+
+class RealtyDataGenerator(models.AbstractModel):
+    _name = "realty_data_generator"
+    _description = "Synthetic realty data at production scale"
+
+    # Model Method
+    @api.model
+    def generate(self, volumes=None, skew=GENERATOR_SKEW, reply_ratio=0.3, commit=False, prefix="Synthetic"):
+        """
+        Bulk-create a consistent realty dataset. One record of each kind goes through the ORM
+        (defaults, constraints, overrides); the volume is cloned from it with set-based INSERTs.
+        :param volumes: cardinalities overriding GENERATOR_VOLUMES
+        :param skew: power-law exponent for hot communes, owners, listings and threads (1 = uniform)
+        :param reply_ratio: share of comments that are replies
+        :param commit: commit after every step (command line runs)
+        :return: dict of the generated records and ids
+        """
+        if not self.env.is_superuser() and not self.env.user.has_group("base.group_system"):
+            raise AccessError("Only administrators can generate synthetic data.")
+        volumes = dict(GENERATOR_VOLUMES, **(volumes or {}))
+        data = {
+            "volumes": volumes,
+            "tag": f"{prefix} {uuid.uuid4().hex[:6]}",
+            "skew": skew,
+            "reply_ratio": reply_ratio,
+        }
+        steps = [
+            self._generate_catalog,
+            self._generate_users,
+            self._generate_communes,
+            self._generate_listings,
+            self._generate_attachments,
+            self._generate_comments,
+        ]
+        for step in steps:
+            start = time.perf_counter()
+            step(data)
+            self.env.flush_all()
+            if commit:
+                self.env.cr.commit()
+            _logger.info(
+                "Realty data generator: %s done in %.1fs", step.__name__, time.perf_counter() - start
+            )
+        self.env.invalidate_all()
+        self.env.cr.execute("ANALYZE")
+        return data
+
+    # Helper method
+    def _clone_names(self, record, count, data):
+        """count copies of a small catalog record, named after the generator run."""
+        if count <= 1:
+            return record.ids
+        return record.ids + clone_rows(
+            self.env.cr,
+            record._table,
+            record.id,
+            count - 1,
+            overrides={"name": "%(tag)s || ' ' || %(label)s || ' ' || s.g"},
+            params={"tag": data["tag"], "label": record._name},
+        )
+
+    def _generate_catalog(self, data):
+        env = self.env
+        tag = data["tag"]
+        volumes = data["volumes"]
+        province = env["res.country.state"].create(
+            {"name": f"{tag} Province", "code": tag[-6:].upper(), "country_id": env.ref("base.vn").id}
+        )
+        data["province"] = province
+        data["district"] = env["district"].create(
+            {"name": f"{tag} District", "province_id": province.id}
+        )
+        data["commune"] = env["commune"].create(
+            {
+                "name": f"{tag} Commune",
+                "province_id": province.id,
+                "district_id": data["district"].id,
+            }
+        )
+        data["region"] = env["region"].create(
+            {"name": f"{tag} Region", "province_ids": [(6, 0, province.ids)]}
+        )
+        direction_group = env["group_home_direction"].create({"name": f"{tag} Directions"})
+        data["home_direction"] = env["home_direction"].create(
+            {"name": f"{tag} Direction", "group_id": direction_group.id}
+        )
+        data["unit_price"] = env["unit_price"].search([], limit=1) or env["unit_price"].create(
+            {"name": f"{tag} Billion", "multiplier": 1000000000}
+        )
+        for key, model in (
+            ("types", "type"),
+            ("statuses", "status"),
+            ("land_titles", "land_title"),
+            ("features", "feature"),
+        ):
+            first = env[model].create({"name": f"{tag} {model}"})
+            data[f"{model}_ids"] = self._clone_names(first, volumes[key], data)
+
+    def _generate_users(self, data):
+        env = self.env
+        cr = env.cr
+        tag = data["tag"]
+        slug = tag.lower().replace(" ", "_")
+        company = env.company
+        # The ORM-created owner is also the template of the bulk population
+        owner = env["res.users"].create(
+            {
+                "name": f"{tag} Owner",
+                "login": f"{slug}_owner",
+                "citizen_id": f"9{uuid.uuid4().int % 10 ** 11:011d}",
+                "company_id": company.id,
+                "company_ids": [(6, 0, company.ids)],
+                "groups_id": [(6, 0, [env.ref("realty_bds.access_group_full_product").id])],
+            }
+        )
+        data["owner"] = owner
+        count = max(1, data["volumes"]["users"])
+        cr.execute("SELECT coalesce(max(citizen_id::bigint), 0) FROM res_partner WHERE citizen_id ~ '^[0-9]{12}$'")
+        citizen_base = max(cr.fetchone()[0], 100000000000)
+        partner_ids = clone_rows(
+            cr,
+            "res_partner",
+            owner.partner_id.id,
+            count,
+            overrides={
+                "name": "%(tag)s || ' user ' || s.g",
+                "complete_name": "%(tag)s || ' user ' || s.g",
+                "email": "%(slug)s || '_' || s.g || '@example.com'",
+                "citizen_id": "(%(citizen_base)s + s.g)::text",
+            },
+            params={"tag": tag, "slug": slug, "citizen_base": citizen_base},
+        )
+        data["user_ids"] = clone_rows(
+            cr,
+            "res_users",
+            owner.id,
+            count,
+            overrides={
+                "login": "%(slug)s || '_' || s.g",
+                "partner_id": "(%(partner_ids)s::int[])[s.g]",
+            },
+            params={"slug": slug, "partner_ids": partner_ids},
+        )
+        groups_field = env["res.users"]._fields["groups_id"]
+        moderator_group = env.ref("realty_bds.access_group_mod_product")
+        cr.execute(
+            f"""
+            INSERT INTO "{groups_field.relation}" ("{groups_field.column1}", "{groups_field.column2}")
+            SELECT u.id, g.id FROM unnest(%s::int[]) AS u(id), unnest(%s::int[]) AS g(id)
+            UNION ALL
+            SELECT u.id, %s FROM unnest(%s::int[]) AS u(id)
+            ON CONFLICT DO NOTHING
+            """,
+            (
+                data["user_ids"],
+                owner.groups_id.ids,
+                moderator_group.id,
+                data["user_ids"][:GENERATOR_MODERATORS],
+            ),
+        )
+        # Allowed companies, which must contain company_id: same as the owner
+        companies_field = env["res.users"]._fields["company_ids"]
+        cr.execute(
+            f"""
+            INSERT INTO "{companies_field.relation}" ("{companies_field.column1}", "{companies_field.column2}")
+            SELECT u.id, c.id FROM unnest(%s::int[]) AS u(id), unnest(%s::int[]) AS c(id)
+            ON CONFLICT DO NOTHING
+            """,
+            (data["user_ids"], owner.company_ids.ids),
+        )
+
+        # Every user went through an approved signup evaluation
+        evaluation = env["user_evaluation"].sudo().create(
+            {"user_id": owner.id, "email": owner.login, "state": "approved"}
+        )
+        env.flush_all()
+        clone_rows(
+            cr,
+            "user_evaluation",
+            evaluation.id,
+            count,
+            overrides={
+                "user_id": "(%(user_ids)s::int[])[s.g]",
+                "email": "%(slug)s || '_' || s.g",
+                "citizen_id": "(%(citizen_base)s + s.g)::text",
+                "moderator_id": "(%(user_ids)s::int[])[1 + s.g %% %(moderators)s]",
+            },
+            params={
+                "user_ids": data["user_ids"],
+                "slug": slug,
+                "citizen_base": citizen_base,
+                "moderators": min(GENERATOR_MODERATORS, count),
+            },
+        )
+
+    def _generate_communes(self, data):
+        cr = self.env.cr
+        count = max(1, data["volumes"]["communes"])
+        n_districts = max(1, count // COMMUNES_PER_DISTRICT)
+        data["district_ids"] = clone_rows(
+            cr,
+            "district",
+            data["district"].id,
+            n_districts,
+            overrides={"name": "%(tag)s || ' district ' || s.g"},
+            params={"tag": data["tag"]},
+        )
+        data["commune_ids"] = clone_rows(
+            cr,
+            "commune",
+            data["commune"].id,
+            count,
+            overrides={
+                "name": "%(tag)s || ' commune ' || s.g",
+                "district_id": "(%(district_ids)s::int[])[1 + (s.g - 1) %% %(n_districts)s]",
+            },
+            params={
+                "tag": data["tag"],
+                "district_ids": data["district_ids"],
+                "n_districts": n_districts,
+            },
+        )
+        cr.execute("SELECT id, district_id FROM commune WHERE id = ANY(%s)", (data["commune_ids"],))
+        district_of = dict(cr.fetchall())
+        data["commune_district_ids"] = [district_of[commune_id] for commune_id in data["commune_ids"]]
+
+    def _generate_listings(self, data):
+        env = self.env
+        cr = env.cr
+        owner = data["owner"]
+        image = env["ir.attachment"].with_user(owner).create(
+            {"name": "synthetic.png", "raw": PIXEL_PNG, "res_model": "product.template", "res_id": 0}
+        )
+        data["image"] = image
+        listing = (
+            env["product.template"]
+            .with_user(owner)
+            .create(
+                {
+                    "house_number": "1",
+                    "street": f"{data['tag']} Street",
+                    "real_estate_area": 100,
+                    "usable_area": 80,
+                    "number_of_floors": 3,
+                    "frontage": 5,
+                    "list_price": 5,
+                    "region_id": data["region"].id,
+                    "province_id": data["province"].id,
+                    "district_id": data["district"].id,
+                    "commune_id": data["commune"].id,
+                    "type_id": data["type_ids"][0],
+                    "status_id": data["status_ids"][0],
+                    "land_title_id": data["land_title_ids"][0],
+                    "feature_ids": [(6, 0, data["feature_ids"][:1])],
+                    "home_direction_id": data["home_direction"].id,
+                    "unit_price_id": data["unit_price"].id,
+                    "img_ids": [(6, 0, image.ids)],
+                    "private_img_ids": [(6, 0, image.ids)],
+                }
+            )
+        )
+        data["listing"] = listing
+        env.flush_all()
+        listing_ids = clone_rows(
+            cr,
+            "product_template",
+            listing.id,
+            max(0, data["volumes"]["listings"] - 1),
+            overrides={
+                "name": "jsonb_build_object('en_US', %(tag)s || ' listing ' || s.g)",
+                "street": "%(tag)s || ' street ' || (s.g %% 500)",
+                "commune_id": "(%(commune_ids)s::int[])[s.c]",
+                "district_id": "(%(commune_district_ids)s::int[])[s.c]",
+                "type_id": "(%(type_ids)s::int[])[1 + s.g %% %(n_types)s]",
+                "status_id": "(%(status_ids)s::int[])[1 + s.g %% %(n_statuses)s]",
+                "land_title_id": "(%(land_title_ids)s::int[])[1 + s.g %% %(n_land_titles)s]",
+                "list_price": "round((1 + random() * 50)::numeric, 2)",
+                "real_estate_area": "round((30 + random() * 300)::numeric, 1)",
+                "usable_area": "round((20 + random() * 200)::numeric, 1)",
+                "approval": "(ARRAY['approved', 'approved', 'approved', 'pending', 'draft'])[1 + s.g %% 5]",
+                "create_uid": "(%(user_ids)s::int[])[s.u]",
+                "create_date": "now() - (s.g || ' minutes')::interval",
+            },
+            series={"c": skewed_index("n_communes"), "u": skewed_index("n_users")},
+            params={
+                "tag": data["tag"],
+                "commune_ids": data["commune_ids"],
+                "commune_district_ids": data["commune_district_ids"],
+                "type_ids": data["type_ids"],
+                "n_types": len(data["type_ids"]),
+                "status_ids": data["status_ids"],
+                "n_statuses": len(data["status_ids"]),
+                "land_title_ids": data["land_title_ids"],
+                "n_land_titles": len(data["land_title_ids"]),
+                "user_ids": data["user_ids"],
+                "n_communes": len(data["commune_ids"]),
+                "n_users": len(data["user_ids"]),
+                "skew": data["skew"],
+            },
+        )
+        data["listing_ids"] = listing_ids
+        # Every template needs its variant, or it is missing from product.product reads
+        data["variant_ids"] = clone_rows(
+            cr,
+            "product_product",
+            listing.product_variant_id.id,
+            len(listing_ids),
+            overrides={"product_tmpl_id": "(%(listing_ids)s::int[])[s.g]"},
+            params={"listing_ids": listing_ids},
+        )
+        # Cloned rows carry the template's stored display fields
+        Product = env["product.template"].sudo()
+        for start in range(0, len(listing_ids), DISPLAY_CHUNK_SIZE):
+            Product.browse(listing_ids[start:start + DISPLAY_CHUNK_SIZE])._refresh_display_fields()
+            env.invalidate_all()
+        features = env["product.template"]._fields["feature_ids"]
+        cr.execute(
+            f"""
+            INSERT INTO "{features.relation}" ("{features.column1}", "{features.column2}")
+            SELECT DISTINCT l.id, (%s::int[])[1 + (l.id + k) %% %s]
+              FROM unnest(%s::int[]) AS l(id), generate_series(1, %s) AS k
+            ON CONFLICT DO NOTHING
+            """,
+            (
+                data["feature_ids"],
+                len(data["feature_ids"]),
+                listing_ids,
+                min(FEATURES_PER_LISTING, len(data["feature_ids"])),
+            ),
+        )
+
+    def _generate_attachments(self, data):
+        """Images sharing one blob; hot listings get more, 5% already orphaned for the GC."""
+        cr = self.env.cr
+        listing_ids = [data["listing"].id] + data["listing_ids"]
+        data["attachment_ids"] = clone_rows(
+            cr,
+            "ir_attachment",
+            data["image"].id,
+            data["volumes"]["attachments"],
+            overrides={
+                "name": "'synthetic_' || s.g || '.png'",
+                "res_model": "CASE WHEN s.g %% 20 = 0 THEN '' ELSE src.res_model END",
+                "res_id": "(%(listing_ids)s::int[])[s.l]",
+                "orphaned_from_res_id": "0",
+                "orphaned_date": "CASE WHEN s.g %% 20 = 0 THEN now() - interval '60 days' END",
+                "orphaned_from_model": "CASE WHEN s.g %% 20 = 0 THEN 'product.template' END",
+            },
+            series={"l": skewed_index("n_listings")},
+            params={
+                "listing_ids": listing_ids,
+                "n_listings": len(listing_ids),
+                "skew": data["skew"],
+            },
+        )
+        images = self.env["product.template"]._fields["img_ids"]
+        cr.execute(
+            f"""
+            INSERT INTO "{images.relation}" ("{images.column1}", "{images.column2}")
+            SELECT res_id, id FROM ir_attachment
+             WHERE id = ANY(%s) AND orphaned_date IS NULL
+            ON CONFLICT DO NOTHING
+            """,
+            (data["attachment_ids"],),
+        )
+
+    def _generate_comments(self, data):
+        """Top-level comments on skewed listings, replies on skewed threads."""
+        env = self.env
+        cr = env.cr
+        listing_ids = [data["listing"].id] + data["listing_ids"]
+        comment = env["realty_comment"].sudo().create(
+            {
+                "content": f"{data['tag']} comment",
+                "res_model": "product.template",
+                "res_id": data["listing"].id,
+            }
+        )
+        env.flush_all()
+        total = data["volumes"]["comments"]
+        n_top = max(1, int(total * (1 - data["reply_ratio"])))
+        common = {
+            "child_count": "0",
+            "like_count": "0",
+            "create_uid": "(%(user_ids)s::int[])[1 + s.g %% %(n_users)s]",
+            "create_date": "now() - (s.g || ' minutes')::interval",
+        }
+        data["top_comment_ids"] = clone_rows(
+            cr,
+            "realty_comment",
+            comment.id,
+            n_top,
+            overrides=dict(
+                common,
+                content="'Synthetic comment ' || s.g",
+                res_id="(%(listing_ids)s::int[])[s.l]",
+                parent_id="NULL",
+                parent_path="s.new_id || '/'",
+                comment_level="0",
+            ),
+            series={"l": skewed_index("n_listings")},
+            params={
+                "listing_ids": listing_ids,
+                "n_listings": len(listing_ids),
+                "user_ids": data["user_ids"],
+                "n_users": len(data["user_ids"]),
+                "skew": data["skew"] + 1,
+            },
+        )
+        if total > n_top:
+            clone_rows(
+                cr,
+                "realty_comment",
+                comment.id,
+                total - n_top,
+                overrides=dict(
+                    common,
+                    content="'Synthetic reply ' || s.g",
+                    res_id="(SELECT t.res_id FROM realty_comment t WHERE t.id = s.parent)",
+                    parent_id="s.parent",
+                    parent_path="s.parent || '/' || s.new_id || '/'",
+                    comment_level="1",
+                ),
+                series={"parent": f"(%(top_ids)s::int[])[{skewed_index('n_top')}]"},
+                params={
+                    "top_ids": data["top_comment_ids"],
+                    "n_top": n_top,
+                    "user_ids": data["user_ids"],
+                    "n_users": len(data["user_ids"]),
+                    "skew": data["skew"] + 1,
+                },
+            )
+            cr.execute(
+                """
+                UPDATE realty_comment c SET child_count = r.n
+                  FROM (SELECT parent_id, count(*) AS n FROM realty_comment
+                         WHERE parent_id = ANY(%s) GROUP BY parent_id) r
+                 WHERE c.id = r.parent_id
+                """,
+                (data["top_comment_ids"],),
+            )
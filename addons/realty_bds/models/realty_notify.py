@@ -1,9 +1,8 @@
 from odoo import models, fields, api  # type: ignore
 from odoo.exceptions import ValidationError, UserError, AccessError  # type: ignore
 from odoo.http import request  # type: ignore
-from markupsafe import Markup  # type: ignore
-import html
 import logging
+from .realty_perf import instrument
 
 _logger = logging.getLogger(__name__)
 
@@ -193,61 +192,35 @@ class Notify(models.AbstractModel):
     def _notify_subscribers(self):
         self.ensure_one()
         author_partner = self.create_uid.partner_id
-        # find partners who subscribed to the author
-        subscribers = author_partner.subscriber_partner_ids - author_partner
-        if not subscribers:
-            return
-        body_html = f"""
-            <div style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; text-align: center; color: white;">
-                    <h2 style="margin: 0; font-size: 24px;">📢 New Post Notification</h2>
-                </div>
-                
-                <div style="padding: 25px; background: #f9f9f9;">
-                    <div style="background: white; border-radius: 8px; padding: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-                        <p style="font-size: 16px; margin-bottom: 15px;">
-                            <strong>{html.escape(author_partner.name)}</strong> has shared a new post in <strong>{self._name}</strong>.
-                        </p>
-                        
-                        <div style="border-left: 4px solid #667eea; padding-left: 15px; margin: 20px 0; background: #f8f9fa; padding: 15px;">
-                            <h3 style="margin-top: 0; color: #2c3e50; font-size: 18px;">
-                                {html.escape(self.name)}
-                            </h3>
-                        </div>
-                        
-                        <div style="margin-top: 25px; padding-top: 15px; border-top: 1px solid #eee;">
-                            <p style="font-size: 14px; color: #666;">
-                                💡 <em>This notification was sent because you are subscribed to {html.escape(author_partner.name)}'s updates.</em>
-                            </p>
-                        </div>
-                    </div>
-                </div>
-            </div>
+        # check for subscribers without loading them all, the fan-out reads them in batches
+        self.env["res.partner"].flush_model(["subscriber_partner_ids"])
+        self.env.cr.execute(
             """
+            SELECT 1 FROM partner_subscribe_rel
+             WHERE partner_id = %s AND subscribed_partner_id <> %s
+             LIMIT 1
+            """,
+            (author_partner.id, author_partner.id),
+        )
+        if not self.env.cr.fetchone():
+            return
         # Post a mail.message first (use sudo to avoid rights issues)
-        msg = self.sudo().message_post(
-            body=Markup(body_html),
-            subject="New post",
+        msg = self.env["notify_template"].post(
+            self,
+            "new_post",
+            {
+                "author": author_partner.name,
+                "model": self._name,
+                "title": self.name,
+                "res_id": self.id,
+            },
             subtype_xmlid="mail.mt_comment",
         )
 
-        # Create mail.notification entries explicitly
-        notif_model = self.env["mail.notification"].sudo()
-        notif_vals = []
-        for partner in subscribers:
-            if partner.id == author_partner.id:
-                continue
-            notif_vals.append(
-                {
-                    "res_partner_id": partner.id,
-                    "notification_type": "inbox",  # makes it appear in Discuss -> Inbox
-                    "mail_message_id": msg.id,
-                    "is_read": False,
-                }
-            )
-        if notif_vals:
-            notif_model.create(notif_vals)
+        # Inbox notifications are inserted in background batches
+        self.env["notify_fanout"].enqueue(msg, author_partner)
 
+    @instrument()
     def _assign_moderator(self):
         """Assign a moderator using round-robin distribution"""
         company_id = self.env.company.id
@@ -353,6 +326,7 @@ class Notify(models.AbstractModel):
 
         # Create the single record
         records = super().create([vals])
+        self.env["realty_change_feed"]._log_changes(records, "create", vals)
         for record in records:
             try:
                 all_attachments = record.img_ids
@@ -368,6 +342,11 @@ class Notify(models.AbstractModel):
                 )
         return records
 
+    def write(self, vals):
+        res = super().write(vals)
+        self.env["realty_change_feed"]._log_changes(self, "write", vals)
+        return res
+
     def unlink(self):
         # collect attachments before deleting (so we know which records were involved)
         self.ensure_one()
@@ -375,6 +354,7 @@ class Notify(models.AbstractModel):
         res_model = self._name
 
         # delete the records (this removes the M2M relation rows)
+        self.env["realty_change_feed"]._log_changes(self, "unlink")
         res = super().unlink()
 
         # clear all comment of this post
@@ -407,13 +387,7 @@ class Notify(models.AbstractModel):
 
     @api.ondelete(at_uninstall=False)
     def _unlink_post_attachments(self):
-        IrAttachment = self.env["ir.attachment"]
-
-        for post in self:
-            all_attachments = post.img_ids
-            if all_attachments:
-                attachment_ids = all_attachments.ids
-                IrAttachment.mark_orphaned(attachment_ids, self._name, post.id)
+        self.env["ir.attachment"].mark_records_orphaned(self, ["img_ids"])
 
     # Constrains
     @api.constrains("name", "content")
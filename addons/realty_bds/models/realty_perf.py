@@ -0,0 +1,307 @@
+from odoo import models, fields, api  # type: ignore
+from odoo.modules.registry import Registry  # type: ignore
+from collections import deque
+import functools
+import json
+import logging
+import os
+import threading
+import time
+
+try:
+    from odoo.tools.cache import STAT as ORMCACHE_STAT  # type: ignore
+except ImportError:
+    ORMCACHE_STAT = None
+
+_logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+ROLLING_MINUTES = 15
+PERF_RETENTION_DAYS = 14
+FLUSH_INTERVAL = 60
+
+# Per-worker rolling histogram: one slot per minute, (minute, {(dbname, name): stats})
+_SLOTS = deque(maxlen=ROLLING_MINUTES)
+# Completed slots the worker has not written to realty_perf_sample yet
+_UNFLUSHED = []
+_LOCK = threading.Lock()
+# Pid of the process running the flusher thread (threads do not survive a fork)
+_FLUSHER_PID = [None]
+
+
+def _new_stats(kind):
+    return {
+        "kind": kind,
+        "count": 0,
+        "wall_total": 0.0,
+        "wall_max": 0.0,
+        "sql_count": 0,
+        "sql_time": 0.0,
+        "cache_misses": 0,
+        "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+    }
+
+
+def _merge_stats(into, stats):
+    into["count"] += stats["count"]
+    into["wall_total"] += stats["wall_total"]
+    into["wall_max"] = max(into["wall_max"], stats["wall_max"])
+    into["sql_count"] += stats["sql_count"]
+    into["sql_time"] += stats["sql_time"]
+    into["cache_misses"] += stats["cache_misses"]
+    into["buckets"] = [a + b for a, b in zip(into["buckets"], stats["buckets"])]
+
+
+def _cache_misses():
+    if ORMCACHE_STAT is None:
+        return 0
+    return sum(counter.miss for counter in list(ORMCACHE_STAT.values()))
+
+
+def _percentile(buckets, ratio):
+    """Upper bound (ms) of the bucket holding the given ratio of the calls."""
+    total = sum(buckets)
+    if not total:
+        return 0
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS_MS + (None,), buckets):
+        seen += count
+        if seen >= total * ratio:
+            return bound if bound is not None else f">{LATENCY_BUCKETS_MS[-1]}"
+    return None
+
+
+def _rotate(minute):
+    """Open the slot of minute, queuing the previous one for the flusher. Call under _LOCK."""
+    if not _SLOTS or _SLOTS[-1][0] != minute:
+        if _SLOTS and _SLOTS[-1][1]:
+            _UNFLUSHED.append(_SLOTS[-1])
+        _SLOTS.append((minute, {}))
+
+
+def _record(dbname, name, kind, wall, sql_count, sql_time, cache_misses):
+    minute = int(time.time() // 60)
+    with _LOCK:
+        _rotate(minute)
+        stats = _SLOTS[-1][1].setdefault((dbname, name), _new_stats(kind))
+        stats["count"] += 1
+        stats["wall_total"] += wall
+        stats["wall_max"] = max(stats["wall_max"], wall)
+        stats["sql_count"] += sql_count
+        stats["sql_time"] += sql_time
+        stats["cache_misses"] += cache_misses
+        index = next(
+            (i for i, bound in enumerate(LATENCY_BUCKETS_MS) if wall <= bound),
+            len(LATENCY_BUCKETS_MS),
+        )
+        stats["buckets"][index] += 1
+
+
+def _flush_completed_slots():
+    """Write finished minutes of this worker to realty_perf_sample, in their own transaction."""
+    with _LOCK:
+        _rotate(int(time.time() // 60))
+        slots = _UNFLUSHED[:]
+        _UNFLUSHED.clear()
+    rows_by_db = {}
+    for minute, entries in slots:
+        for (dbname, name), stats in entries.items():
+            rows_by_db.setdefault(dbname, []).append((minute, name, stats))
+    for dbname, rows in rows_by_db.items():
+        try:
+            with Registry(dbname).cursor() as cr:
+                cr.execute(
+                    """
+                    INSERT INTO realty_perf_sample
+                           (name, kind, worker_pid, period_start, count, wall_total, wall_max,
+                            sql_count, sql_time, cache_misses, buckets)
+                    SELECT r.name, r.kind, %s, to_timestamp(r.minute * 60) AT TIME ZONE 'UTC',
+                           r.count, r.wall_total, r.wall_max, r.sql_count, r.sql_time,
+                           r.cache_misses, r.buckets
+                      FROM jsonb_to_recordset(%s::jsonb) AS r(
+                           name varchar, kind varchar, minute bigint, count int,
+                           wall_total float, wall_max float, sql_count int, sql_time float,
+                           cache_misses int, buckets jsonb)
+                    """,
+                    (
+                        os.getpid(),
+                        json.dumps(
+                            [
+                                dict(stats, name=name, minute=minute)
+                                for minute, name, stats in rows
+                            ]
+                        ),
+                    ),
+                )
+        except Exception:
+            _logger.warning("Could not store realty perf samples for %s", dbname, exc_info=True)
+
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        _flush_completed_slots()
+
+
+def _ensure_flusher():
+    """Start this process' flusher thread: samples are written off the request path."""
+    pid = os.getpid()
+    if _FLUSHER_PID[0] == pid:
+        return
+    with _LOCK:
+        if _FLUSHER_PID[0] == pid:
+            return
+        _FLUSHER_PID[0] = pid
+    threading.Thread(target=_flush_loop, name="realty_perf_flusher", daemon=True).start()
+
+
+def instrument(name=None, kind="rpc"):
+    """
+    Record wall time, SQL queries (count and time) and ORM cache misses of each call
+    into this worker's rolling histogram. Works on model methods and controller routes.
+    Only in-memory counters are touched here; a flusher thread per process writes
+    the finished minutes to realty_perf_sample.
+    """
+
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            thread = threading.current_thread()
+            query_count = getattr(thread, "query_count", 0)
+            query_time = getattr(thread, "query_time", 0.0)
+            misses = _cache_misses()
+            start = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                wall = (time.perf_counter() - start) * 1000
+                dbname = getattr(thread, "dbname", None)
+                if dbname:
+                    _record(
+                        dbname,
+                        label,
+                        kind,
+                        wall,
+                        getattr(thread, "query_count", 0) - query_count,
+                        (getattr(thread, "query_time", 0.0) - query_time) * 1000,
+                        _cache_misses() - misses,
+                    )
+                    _ensure_flusher()
+
+        return wrapper
+
+    return decorator
+
+
+def worker_snapshot():
+    """This worker's rolling histogram merged over the last ROLLING_MINUTES, with percentiles."""
+    merged = {}
+    with _LOCK:
+        slots = list(_SLOTS)
+    for _minute, entries in slots:
+        for (dbname, name), stats in entries.items():
+            into = merged.setdefault((dbname, name), _new_stats(stats["kind"]))
+            _merge_stats(into, stats)
+    result = {}
+    for (dbname, name), stats in merged.items():
+        result.setdefault(dbname, {})[name] = dict(
+            stats,
+            wall_avg=stats["wall_total"] / stats["count"] if stats["count"] else 0,
+            p50=_percentile(stats["buckets"], 0.5),
+            p95=_percentile(stats["buckets"], 0.95),
+        )
+    return {
+        "pid": os.getpid(),
+        "window_minutes": ROLLING_MINUTES,
+        "buckets_ms": list(LATENCY_BUCKETS_MS),
+        "calls": result,
+    }
+
+
+class RealtyPerfSample(models.Model):
+    _name = "realty_perf_sample"
+    _description = "Latency and query statistics of realty calls"
+    _order = "period_start desc, wall_total desc"
+    _log_access = False
+
+    # Attributes
+    name = fields.Char(string="Call", required=True, index=True)
+    kind = fields.Selection(
+        [
+            ("rpc", "Model method"),
+            ("controller", "Controller"),
+        ],
+        string="Kind",
+        required=True,
+    )
+    worker_pid = fields.Integer(
+        string="Worker", help="0 once the cron merged the workers into an hourly sample"
+    )
+    period_start = fields.Datetime(string="Period Start", required=True, index=True)
+    count = fields.Integer(string="Calls")
+    wall_total = fields.Float(string="Total Time (ms)")
+    wall_max = fields.Float(string="Max Time (ms)")
+    sql_count = fields.Integer(string="SQL Queries")
+    sql_time = fields.Float(string="SQL Time (ms)")
+    cache_misses = fields.Integer(string="ORM Cache Misses")
+    buckets = fields.Json(string="Latency Histogram")
+
+    # Compute Attributes
+    wall_avg = fields.Float(string="Avg Time (ms)", compute="_compute_averages")
+    sql_avg = fields.Float(string="Avg SQL Queries", compute="_compute_averages")
+
+    @api.depends("count", "wall_total", "sql_count")
+    def _compute_averages(self):
+        for r in self:
+            r.wall_avg = r.wall_total / r.count if r.count else 0
+            r.sql_avg = r.sql_count / r.count if r.count else 0
+
+    # Model Method
+    @api.model
+    def _cron_collect_samples(self, retention_days=PERF_RETENTION_DAYS):
+        """
+        Merge the per-minute samples the worker flusher threads wrote for finished hours
+        into one hourly sample per call, then drop samples older than retention_days.
+        """
+        _flush_completed_slots()
+        cr = self.env.cr
+        self.flush_model()
+        cr.execute(
+            """
+            DELETE FROM realty_perf_sample
+             WHERE worker_pid <> 0
+               AND period_start < date_trunc('hour', now() AT TIME ZONE 'UTC')
+            RETURNING name, kind, date_trunc('hour', period_start), count, wall_total,
+                      wall_max, sql_count, sql_time, cache_misses, buckets
+            """
+        )
+        merged = {}
+        for name, kind, hour, *values in cr.fetchall():
+            count, wall_total, wall_max, sql_count, sql_time, cache_misses, buckets = values
+            into = merged.setdefault((name, kind, hour), _new_stats(kind))
+            _merge_stats(
+                into,
+                {
+                    "count": count,
+                    "wall_total": wall_total,
+                    "wall_max": wall_max,
+                    "sql_count": sql_count,
+                    "sql_time": sql_time,
+                    "cache_misses": cache_misses,
+                    "buckets": buckets or [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                },
+            )
+        self.invalidate_model()
+        self.create(
+            [
+                dict(stats, name=name, period_start=hour, worker_pid=0)
+                for (name, kind, hour), stats in merged.items()
+            ]
+        )
+        cr.execute(
+            "DELETE FROM realty_perf_sample WHERE period_start < (now() AT TIME ZONE 'UTC') - %s * interval '1 day'",
+            (retention_days,),
+        )
+        _logger.info("Realty perf samples: merged %s hourly samples", len(merged))
@@ -0,0 +1,147 @@
+from odoo import models, fields, api  # type: ignore
+import logging
+
+_logger = logging.getLogger(__name__)
+
+DISPLAY_REFRESH_BATCH_SIZE = 2000
+
+# Model shown on the listings -> (listing field pointing to it, display fields to recompute)
+DISPLAY_SOURCES = {
+    "unit_price": (
+        "unit_price_id",
+        ("absolute_price", "display_price", "price_per_sqm", "price_per_sqm_value"),
+    ),
+    "res.currency": ("currency_id", ("display_price",)),
+    "home_direction": ("home_direction_id", ("attributes",)),
+    "commune": ("commune_id", ("address",)),
+    "district": ("district_id", ("address",)),
+}
+
+
+class ProductDisplayRefresh(models.Model):
+    _name = "product_display_refresh"
+    _description = "Listings to refresh after a record shown in their display fields changed"
+    _order = "id asc"
+
+    # Attributes
+    res_model = fields.Selection(
+        [
+            ("unit_price", "Unit Price"),
+            ("res.currency", "Currency"),
+            ("home_direction", "Home Direction"),
+            ("commune", "Commune"),
+            ("district", "District"),
+        ],
+        string="Changed Model",
+        required=True,
+    )
+    res_id = fields.Integer(string="Changed Record ID", required=True)
+    state = fields.Selection(
+        [
+            ("pending", "Pending"),
+            ("done", "Done"),
+        ],
+        string="Status",
+        default="pending",
+        required=True,
+        index=True,
+    )
+    last_listing_id = fields.Integer(
+        string="Cursor", default=0, help="Highest listing id already refreshed"
+    )
+    refreshed_count = fields.Integer(string="Refreshed", default=0)
+
+    # Model Method
+    @api.model
+    def enqueue(self, records):
+        """
+        Schedule the listings showing these records for a refresh and wake up the worker.
+        A pending refresh of the same record starts over instead of being duplicated.
+        """
+        if not records:
+            return self.browse()
+        events = self.sudo().search(
+            [
+                ("res_model", "=", records._name),
+                ("res_id", "in", records.ids),
+                ("state", "=", "pending"),
+            ]
+        )
+        events.write({"last_listing_id": 0})
+        queued = set(events.mapped("res_id"))
+        events |= self.sudo().create(
+            [
+                {"res_model": records._name, "res_id": res_id}
+                for res_id in records.ids
+                if res_id not in queued
+            ]
+        )
+        cron = self.env.ref("realty_bds.ir_cron_product_display_refresh", raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+        return events
+
+    @api.model
+    def _cron_process_refreshes(self, batch_size=DISPLAY_REFRESH_BATCH_SIZE):
+        """Refresh pending listings batch by batch, committing after each batch."""
+        for event in self.sudo().search([("state", "=", "pending")]):
+            while event.state == "pending":
+                event._refresh_batch(batch_size)
+                self.env.cr.commit()
+        self.sudo().search(
+            [
+                ("state", "=", "done"),
+                ("write_date", "<", fields.Datetime.subtract(fields.Datetime.now(), days=7)),
+            ]
+        ).unlink()
+
+    # Helper method
+    def _listing_domain(self):
+        self.ensure_one()
+        field = DISPLAY_SOURCES[self.res_model][0]
+        if self.res_model == "res.currency":
+            # Listings without a currency show their company's one
+            return [
+                "|",
+                (field, "=", self.res_id),
+                "&",
+                (field, "=", False),
+                ("company_id.currency_id", "=", self.res_id),
+            ]
+        return [(field, "=", self.res_id)]
+
+    def _refresh_batch(self, batch_size=DISPLAY_REFRESH_BATCH_SIZE):
+        """
+        Recompute the display fields of the next batch of listings (by id).
+        :return: number of listings refreshed
+        """
+        self.ensure_one()
+        listings = (
+            self.env["product.template"]
+            .sudo()
+            .with_context(active_test=False)
+            .search(
+                self._listing_domain() + [("id", ">", self.last_listing_id)],
+                order="id",
+                limit=batch_size,
+            )
+        )
+        if not listings:
+            self.write({"state": "done"})
+            return 0
+        listings._refresh_display_fields(DISPLAY_SOURCES[self.res_model][1])
+        self.env.invalidate_all()
+        self.write(
+            {
+                "last_listing_id": listings[-1].id,
+                "refreshed_count": self.refreshed_count + len(listings),
+                "state": "done" if len(listings) < batch_size else "pending",
+            }
+        )
+        _logger.info(
+            "Display refresh %s %s: %s listings refreshed",
+            self.res_model,
+            self.res_id,
+            self.refreshed_count,
+        )
+        return len(listings)
@@ -0,0 +1,117 @@
+from odoo import models, fields, api  # type: ignore
+from odoo.exceptions import UserError  # type: ignore
+import logging
+
+_logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+JOB_BATCH_SIZE = 50
+
+
+class SignupJob(models.Model):
+    _name = "signup_job"
+    _description = "Post-signup processing job (evaluation, moderator, documents)"
+    _order = "id asc"
+
+    # Attributes
+    state = fields.Selection(
+        [
+            ("pending", "Pending"),
+            ("done", "Done"),
+            ("failed", "Failed"),
+        ],
+        string="Status",
+        default="pending",
+        required=True,
+        index=True,
+    )
+    payload = fields.Json(string="Signup Data", help="Evaluation fields of the signup form")
+    file_data = fields.Json(
+        string="Staged Documents",
+        help="Descriptors of identity documents already written to the filestore",
+    )
+    attempts = fields.Integer(string="Attempts", default=0)
+    last_error = fields.Text(string="Last Error")
+    documents_attached = fields.Boolean(string="Documents Attached", default=False)
+
+    # Relationship Attributes
+    user_id = fields.Many2one(
+        "res.users", string="User", required=True, ondelete="cascade"
+    )
+    evaluation_id = fields.Many2one(
+        "user_evaluation", string="User Evaluation", ondelete="set null"
+    )
+
+    # Model Method
+    @api.model
+    def enqueue(self, user, payload, file_data=None):
+        """Stage a signup for background processing and wake up the worker."""
+        job = self.sudo().create(
+            {
+                "user_id": user.id,
+                "payload": payload,
+                "file_data": file_data or [],
+            }
+        )
+        cron = self.env.ref("realty_bds.ir_cron_signup_job", raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+        return job
+
+    @api.model
+    def _cron_process_jobs(self, limit=JOB_BATCH_SIZE):
+        """Process pending jobs one by one; a failing job is retried on the next run."""
+        jobs = self.sudo().search([("state", "=", "pending")], limit=limit)
+        for job in jobs:
+            job._process()
+            # Keep finished jobs even if a later one breaks the worker
+            self.env.cr.commit()
+        if len(jobs) == limit:
+            self.env.ref("realty_bds.ir_cron_signup_job")._trigger()
+
+    # Helper method
+    def _process(self):
+        self.ensure_one()
+        try:
+            self._run_steps()
+            self.write({"state": "done", "last_error": False})
+        except Exception as e:
+            attempts = self.attempts + 1
+            _logger.exception(
+                "Signup job %s failed (attempt %s/%s)", self.id, attempts, MAX_ATTEMPTS
+            )
+            self.write(
+                {
+                    "attempts": attempts,
+                    "last_error": str(e),
+                    "state": "failed" if attempts >= MAX_ATTEMPTS else "pending",
+                }
+            )
+
+    def _run_steps(self):
+        """
+        Each step runs in its own savepoint and records its result there: a failing step
+        only rolls back itself, so a retry resumes where the last attempt stopped.
+        """
+        user = self.user_id.sudo()
+        if not user.exists():
+            raise UserError(f"User of signup job {self.id} no longer exists.")
+
+        if not self.evaluation_id:
+            with self.env.cr.savepoint():
+                user_eval = user.notify_signup_moderator(user_data=dict(self.payload or {}))
+                if not user_eval:
+                    raise UserError(f"No user evaluation created for user {user.id}.")
+                self.evaluation_id = user_eval
+
+        if self.file_data and not self.documents_attached:
+            with self.env.cr.savepoint():
+                self.env["ir.attachment"].sudo().attach_signup_documents(
+                    self.evaluation_id, self.file_data
+                )
+                self.documents_attached = True
+
+    # Action
+    def action_retry(self):
+        self.sudo().write({"state": "pending", "attempts": 0})
+        self.env.ref("realty_bds.ir_cron_signup_job")._trigger()
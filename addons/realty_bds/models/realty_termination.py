@@ -0,0 +1,94 @@
+from odoo import models, api  # type: ignore
+from odoo.exceptions import UserError  # type: ignore
+import logging
+
+_logger = logging.getLogger(__name__)
+
+TERMINATION_CHUNK_SIZE = 200
+
+
+class AccountTermination(models.AbstractModel):
+    _name = "account_termination"
+    _description = "Delete employees, their users and orphaned partners in bulk"
+
+    # Helper method
+    @api.model
+    def _unlink_in_chunks(self, records, label, chunk_size=TERMINATION_CHUNK_SIZE):
+        """
+        Unlink records chunk by chunk, each one in its own savepoint.
+        A failing chunk is logged and skipped so a cron transaction is never aborted.
+        :return: ids that could not be deleted
+        """
+        failed_ids = []
+        total = len(records)
+        for start in range(0, total, chunk_size):
+            chunk = records[start:start + chunk_size]
+            try:
+                with self.env.cr.savepoint():
+                    chunk.unlink()
+            except Exception as e:
+                _logger.exception("Failed to delete %s %s: %s", label, chunk.ids, e)
+                failed_ids += chunk.ids
+                continue
+            _logger.info(
+                "Termination: deleted %s %s/%s", label, min(start + chunk_size, total), total
+            )
+        return failed_ids
+
+    @api.model
+    def _get_orphaned_partner_ids(self, partner_ids):
+        """Return the partners of partner_ids that no user nor employee references anymore."""
+        if not partner_ids:
+            return []
+        self.env["res.users"].flush_model(["partner_id"])
+        self.env["hr.employee"].flush_model(["work_contact_id"])
+        self.env.cr.execute(
+            """
+            SELECT p.id
+              FROM res_partner p
+             WHERE p.id = ANY(%s)
+               AND NOT EXISTS (SELECT 1 FROM res_users u WHERE u.partner_id = p.id)
+               AND NOT EXISTS (SELECT 1 FROM hr_employee e WHERE e.work_contact_id = p.id)
+            """,
+            (list(partner_ids),),
+        )
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.model
+    def _terminate(self, employees=None, users=None):
+        """
+        Delete employees, their users (active or archived) and the partners left orphaned.
+        Safe to run from the recycle cron: no commit, one savepoint per chunk.
+        Employees and users are deleted with the access rights of this environment,
+        callers check their own (HrEmployee._check_termination_access); only the
+        orphaned partners are deleted as superuser.
+        :param employees: hr.employee records to terminate
+        :param users: res.users records to terminate along with their employees
+        """
+        Employee = self.env["hr.employee"].with_context(active_test=False)
+        Users = self.env["res.users"].with_context(active_test=False)
+        Partner = self.env["res.partner"].sudo().with_context(active_test=False)
+
+        employees = Employee.browse(employees.ids if employees else [])
+        users = Users.browse(users.ids if users else []).exists()
+        users |= employees.user_id
+        if users:
+            employees |= Employee.search([("user_id", "in", users.ids)])
+        if not (employees or users):
+            return
+
+        # Collect partners before deleting users
+        partner_ids = set(users.sudo().partner_id.ids)
+
+        # 1) Delete employees first
+        failed_ids = self._unlink_in_chunks(employees, "employees")
+        if failed_ids:
+            raise UserError(f"Failed to terminate employees: {failed_ids}")
+
+        # 2) Delete associated users (active and archived)
+        self._unlink_in_chunks(users, "users")
+
+        # 3) Delete partners no user or employee references anymore
+        orphan_ids = self._get_orphaned_partner_ids(partner_ids)
+        if orphan_ids:
+            self._unlink_in_chunks(Partner.browse(orphan_ids), "orphaned partners")
@@ -276,7 +276,7 @@ class UserEvaluation(models.Model):
     def _unlink_users(self):
         """Delete related hr.employee, res.users, and res.partner records when evaluation is deleted.
 
-        Delegates to hr.employee's terminate_employee method for proper cleanup.
+        Delegates to the shared account_termination service.
         Only processes rejected evaluations.
         Handles both active and archived users.
         """
@@ -288,55 +288,18 @@ class UserEvaluation(models.Model):
         if not rejected_evals:
             return
 
-        HrEmployee = self.env["hr.employee"].sudo()
-        ResUsers = self.env["res.users"].sudo()
-
         # Collect all user IDs from rejected evaluations
         user_ids = rejected_evals.mapped("user_id").filtered(lambda u: u.exists())
         if not user_ids:
             return
 
-        # Find all employees associated with these users (including archived)
-        employees = HrEmployee.with_context(active_test=False).search(
-            [("user_id", "in", user_ids.ids)]
-        )
-
-        if employees:
-            try:
-                # Delegate to hr.employee's termination method
-                employees.terminate_employee()
-            except Exception as e:
-                _logger.exception(
-                    "Failed to terminate employees during evaluation deletion: %s", e
-                )
-        else:
-            # No employees found, but still need to clean up users and partners
-            ResPartner = self.env["res.partner"].sudo()
-            partners = user_ids.mapped("partner_id").filtered(lambda p: p.exists())
-
-            # Delete users
-            try:
-                user_ids.unlink()
-            except Exception as e:
-                _logger.exception("Failed to delete users: %s", e)
-                return
-
-            # Check and delete orphaned partners
-            if partners:
-                partners_to_delete = ResPartner.browse()
-                for partner in partners:
-                    if partner.exists():
-                        remaining_users = ResUsers.with_context(
-                            active_test=False
-                        ).search([("partner_id", "=", partner.id)], limit=1)
-                        if not remaining_users:
-                            partners_to_delete |= partner
-
-                if partners_to_delete:
-                    try:
-                        partners_to_delete.unlink()
-                    except Exception as e:
-                        _logger.exception("Failed to delete orphaned partners: %s", e)
+        try:
+            # Deleting an evaluation already required its unlink right: clean up as superuser
+            self.env["account_termination"].sudo()._terminate(users=user_ids.sudo())
+        except Exception as e:
+            _logger.exception(
+                "Failed to terminate users during evaluation deletion: %s", e
+            )
 
     # Restraint
     @api.constrains("note")
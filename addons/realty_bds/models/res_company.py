@@ -25,17 +25,20 @@ class ResCompany(models.Model):
     # Constrain
     @api.constrains("province_id", "district_id", "commune_id")
     def _check_location_consistency1(self):
+        hierarchy = self.env["administrative_hierarchy"]
         for record in self:
             if (
                 record.district_id
-                and record.district_id.province_id != record.province_id
+                and hierarchy.province_of_district(record.district_id.id)
+                != record.province_id.id
             ):
                 raise ValidationError(
                     "❌ District does not match the selected province!"
                 )
             if (
                 record.commune_id
-                and record.commune_id.district_id != record.district_id
+                and hierarchy.district_of_commune(record.commune_id.id)
+                != record.district_id.id
             ):
                 raise ValidationError(
                     "❌ Commune does not match the selected district!"
@@ -45,12 +48,14 @@ class ResCompany(models.Model):
     @api.onchange("province_id")
     def _onchange_province_id(self):
         """Reset district and commune when province changes"""
+        hierarchy = self.env["administrative_hierarchy"]
         for record in self:
             if record.province_id:
                 # Check if current district belongs to new province
                 if (
                     record.district_id
-                    and record.district_id.province_id != record.province_id
+                    and hierarchy.province_of_district(record.district_id.id)
+                    != record.province_id.id
                 ):
                     record.district_id = False
                 # Always reset commune when province changes
@@ -63,12 +68,14 @@ class ResCompany(models.Model):
     @api.onchange("district_id")
     def _onchange_district_id(self):
         """Reset commune when district changes"""
+        hierarchy = self.env["administrative_hierarchy"]
         for record in self:
             if record.district_id:
                 # Check if current commune belongs to new district
                 if (
                     record.commune_id
-                    and record.commune_id.district_id != record.district_id
+                    and hierarchy.district_of_commune(record.commune_id.id)
+                    != record.district_id.id
                 ):
                     record.commune_id = False
             else:
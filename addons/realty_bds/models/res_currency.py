@@ -0,0 +1,12 @@
+from odoo import models  # type: ignore
+
+
+class ResCurrency(models.Model):
+    _inherit = "res.currency"
+
+    # Model Method
+    def write(self, vals):
+        res = super().write(vals)
+        if {"symbol", "position"} & set(vals):
+            self.env["product_display_refresh"].enqueue(self)
+        return res
@@ -58,6 +58,16 @@ class ResPartner(models.Model):
         string="Subscribers",
     )
     moderator_id = fields.Many2one("res.users", string="Moderator")
+    notification_digest = fields.Selection(
+        [
+            ("off", "Immediately"),
+            ("hourly", "Hourly digest"),
+            ("daily", "Daily digest"),
+        ],
+        string="Notifications",
+        default="off",
+        help="Receive realty notifications one by one, or rolled up into one message per hour or day",
+    )
     document_id = fields.One2many(
         "ir.attachment",
         "res_id",
@@ -98,6 +108,7 @@ class ResPartner(models.Model):
 
     @api.constrains("province_id", "district_id", "commune_id")
     def _check_location_consistency1(self):
+        hierarchy = self.env["administrative_hierarchy"]
         for record in self:
             if (
                 record.is_company or not record.user_ids
@@ -105,14 +116,16 @@ class ResPartner(models.Model):
                 continue
             if (
                 record.district_id
-                and record.district_id.province_id != record.province_id
+                and hierarchy.province_of_district(record.district_id.id)
+                != record.province_id.id
             ):
                 raise ValidationError(
                     "❌ District does not match the selected province!"
                 )
             if (
                 record.commune_id
-                and record.commune_id.district_id != record.district_id
+                and hierarchy.district_of_commune(record.commune_id.id)
+                != record.district_id.id
             ):
                 raise ValidationError(
                     "❌ Commune does not match the selected district!"
@@ -122,6 +135,7 @@ class ResPartner(models.Model):
         "province_resident_id", "district_resident_id", "commune_resident_id"
     )
     def _check_location_consistency2(self):
+        hierarchy = self.env["administrative_hierarchy"]
         for record in self:
             if (
                 record.is_company or not record.user_ids
@@ -129,16 +143,16 @@ class ResPartner(models.Model):
                 continue
             if (
                 record.district_resident_id
-                and record.district_resident_id.province_id
-                != record.province_resident_id
+                and hierarchy.province_of_district(record.district_resident_id.id)
+                != record.province_resident_id.id
             ):
                 raise ValidationError(
                     "❌ District does not match the selected province!"
                 )
             if (
                 record.commune_resident_id
-                and record.commune_resident_id.district_id
-                != record.district_resident_id
+                and hierarchy.district_of_commune(record.commune_resident_id.id)
+                != record.district_resident_id.id
             ):
                 raise ValidationError(
                     "❌ Commune does not match the selected district!"
@@ -148,12 +162,14 @@ class ResPartner(models.Model):
     @api.onchange("province_id")
     def _onchange_province_id(self):
         """Reset district and commune when province changes"""
+        hierarchy = self.env["administrative_hierarchy"]
         for record in self:
             if record.province_id:
                 # Check if current district belongs to new province
                 if (
                     record.district_id
-                    and record.district_id.province_id != record.province_id
+                    and hierarchy.province_of_district(record.district_id.id)
+                    != record.province_id.id
                 ):
                     record.district_id = False
                 # Always reset commune when province changes
@@ -166,12 +182,14 @@ class ResPartner(models.Model):
     @api.onchange("district_id")
     def _onchange_district_id(self):
         """Reset commune when district changes"""
+        hierarchy = self.env["administrative_hierarchy"]
         for record in self:
             if record.district_id:
                 # Check if current commune belongs to new district
                 if (
                     record.commune_id
-                    and record.commune_id.district_id != record.district_id
+                    and hierarchy.district_of_commune(record.commune_id.id)
+                    != record.district_id.id
                 ):
                     record.commune_id = False
             else:
@@ -181,13 +199,14 @@ class ResPartner(models.Model):
     @api.onchange("province_resident_id")
     def _onchange_province_resident_id(self):
         """Reset resident district and commune when resident province changes"""
+        hierarchy = self.env["administrative_hierarchy"]
         for record in self:
             if record.province_resident_id:
                 # Check if current resident district belongs to new resident province
                 if (
                     record.district_resident_id
-                    and record.district_resident_id.province_id
-                    != record.province_resident_id
+                    and hierarchy.province_of_district(record.district_resident_id.id)
+                    != record.province_resident_id.id
                 ):
                     record.district_resident_id = False
                 # Always reset resident commune when resident province changes
@@ -200,13 +219,14 @@ class ResPartner(models.Model):
     @api.onchange("district_resident_id")
     def _onchange_district_resident_id(self):
         """Reset resident commune when resident district changes"""
+        hierarchy = self.env["administrative_hierarchy"]
         for record in self:
             if record.district_resident_id:
                 # Check if current resident commune belongs to new resident district
                 if (
                     record.commune_resident_id
-                    and record.commune_resident_id.district_id
-                    != record.district_resident_id
+                    and hierarchy.district_of_commune(record.commune_resident_id.id)
+                    != record.district_resident_id.id
                 ):
                     record.commune_resident_id = False
             else:
@@ -310,10 +330,4 @@ class ResPartner(models.Model):
     # Method
     @api.ondelete(at_uninstall=False)
     def _unlink_partner_documents(self):
-        IrAttachment = self.env["ir.attachment"]
-
-        for post in self:
-            all_attachments = post.document_id
-            if all_attachments:
-                attachment_ids = all_attachments.ids
-                IrAttachment.mark_orphaned(attachment_ids, self._name, post.id)
+        self.env["ir.attachment"].mark_records_orphaned(self, ["document_id"])
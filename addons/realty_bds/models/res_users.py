@@ -1,11 +1,12 @@
-from odoo import models, fields, api  # type: ignore
+from odoo import models, fields, api, tools  # type: ignore
 from odoo.exceptions import ValidationError, UserError  # type: ignore
-from markupsafe import Markup  # type: ignore
-import html
 import logging
+from .realty_perf import instrument
 
 _logger = logging.getLogger(__name__)
 
+PROVISION_BATCH_SIZE = 500
+
 
 class ResUsers(models.Model):
     _inherit = "res.users"
@@ -28,27 +29,124 @@ class ResUsers(models.Model):
         "hr.group_hr_user",
     ]
 
-    def _sync_groups_from_job_title(self):
-        # Get all blocked groups
-        blocked_groups = self.env["res.groups"]
+    @api.model
+    @tools.ormcache(cache="groups")
+    def _get_blocked_group_ids(self):
+        """Resolve BLOCKED_GROUP_XML_IDS to group ids; cached until groups change."""
+        group_ids = []
         for xmlid in self.BLOCKED_GROUP_XML_IDS:
             group = self.env.ref(xmlid, raise_if_not_found=False)
             if group:
-                blocked_groups |= group
-
-        for user in self:
-            if user.hr_job_id:
-                # Get job's groups minus blocked ones
-                job_groups = user.hr_job_id.implied_ids - blocked_groups
+                group_ids.append(group.id)
+        return frozenset(group_ids)
+
+    @api.model
+    @tools.ormcache("job_id", cache="groups")
+    def _get_job_group_ids(self, job_id):
+        """
+        Effective groups granted by a job title: its rights minus the blocked groups,
+        closed over implied groups. Cached until groups or job rights change.
+        """
+        job = self.env["hr.job"].sudo().browse(job_id)
+        if not job_id or not job.exists():
+            return frozenset()
+        groups = job.implied_ids.filtered(
+            lambda group: group.id not in self._get_blocked_group_ids()
+        )
+        return frozenset((groups | groups.trans_implied_ids).ids)
 
-                # Get current non-blocked groups
-                current_groups = user.groups_id - blocked_groups
+    def _sync_groups_from_job_title(self):
+        blocked_group_ids = self._get_blocked_group_ids()
+        remove_blocked = [(3, group_id) for group_id in blocked_group_ids]
 
-                # Merge and set groups
-                user.groups_id = current_groups | job_groups
-            else:
+        # One write per job: drop blocked groups and add the job's remaining groups
+        for job, users in self.grouped("hr_job_id").items():
+            if job:
+                users.write(
+                    {
+                        "groups_id": remove_blocked
+                        + [(4, group_id) for group_id in self._get_job_group_ids(job.id)]
+                    }
+                )
+            elif remove_blocked:
                 # Just remove blocked groups (keep others)
-                user.groups_id = [(3, group.id) for group in blocked_groups]
+                users.write({"groups_id": remove_blocked})
+
+    @api.model
+    def _apply_job_group_diff(self, old_group_ids_by_job):
+        """
+        Re-sync every user of the given jobs after their rights changed, in SQL.
+        Inserts the missing (group, user) pairs, then deletes the groups the job no longer
+        grants plus the blocked ones, except those still implied by a group the user keeps
+        (the closure Odoo maintains on write). Clears the access caches once.
+        :param old_group_ids_by_job: {job_id: effective group ids before the change}
+        """
+        field = self._fields["groups_id"]
+        relation, group_col, user_col = field.relation, field.column2, field.column1
+        implied = self.env["res.groups"]._fields["implied_ids"]
+        user_type_ids = set(
+            self.env["res.groups"]
+            .sudo()
+            .search([("category_id", "=", self.env.ref("base.module_category_user_type").id)])
+            .ids
+        )
+        blocked_group_ids = self._get_blocked_group_ids()
+        self.flush_model(["hr_job_id", "groups_id"])
+        self.env["res.groups"].flush_model(["implied_ids"])
+        cr = self.env.cr
+        changed = 0
+        for job_id, old_group_ids in old_group_ids_by_job.items():
+            new_group_ids = self._get_job_group_ids(job_id)
+            if new_group_ids:
+                cr.execute(
+                    f"""
+                    INSERT INTO {relation} ({group_col}, {user_col})
+                    SELECT g.id, u.id
+                      FROM res_users u
+                     CROSS JOIN unnest(%s::int[]) AS g(id)
+                     WHERE u.hr_job_id = %s
+                    ON CONFLICT DO NOTHING
+                    """,
+                    (list(new_group_ids), job_id),
+                )
+                changed += cr.rowcount
+            # User type groups decide internal/portal/public and are never taken away here
+            removed = (
+                (set(old_group_ids) | blocked_group_ids) - new_group_ids - user_type_ids
+            )
+            if removed:
+                cr.execute(
+                    f"""
+                    WITH RECURSIVE closure (gid, hid) AS (
+                        SELECT {implied.column1}, {implied.column2} FROM {implied.relation}
+                         UNION
+                        SELECT c.gid, i.{implied.column2}
+                          FROM closure c
+                          JOIN {implied.relation} i ON i.{implied.column1} = c.hid
+                    )
+                    DELETE FROM {relation} r
+                     USING res_users u
+                     WHERE u.hr_job_id = %(job_id)s
+                       AND r.{user_col} = u.id
+                       AND r.{group_col} = ANY(%(removed)s)
+                       AND NOT EXISTS (
+                           SELECT 1
+                             FROM {relation} k
+                             JOIN closure c ON c.gid = k.{group_col}
+                            WHERE k.{user_col} = u.id
+                              AND c.hid = r.{group_col}
+                              AND k.{group_col} <> ALL(%(removed)s)
+                       )
+                    """,
+                    {"job_id": job_id, "removed": list(removed)},
+                )
+                changed += cr.rowcount
+        if changed:
+            self.invalidate_model(["groups_id"])
+            self.env["res.groups"].invalidate_model(["users"])
+            self.env["ir.model.access"].call_cache_clearing_methods()
+            self.env.registry.clear_cache("groups")
+        return changed
 
     def notify_signup_moderator(self, user_data):
         """Called after signup to create user_evaluation and notify the assigned moderator."""
@@ -78,32 +176,16 @@ class ResUsers(models.Model):
             _logger.exception("Failed to create user_evaluation record: %s", e)
             return
 
-        # Build a compact HTML body (escape dynamic values)
-        html_body = f"""
-            <div style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-              <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; text-align: center; color: white;">
-                <h2 style="margin: 0; font-size: 20px;">🎉 New user signup</h2>
-              </div>
-              <div style="padding: 20px; background: #f9f9f9;">
-                <div style="background: white; border-radius: 8px; padding: 16px; box-shadow: 0 2px 4px rgba(0,0,0,0.06);">
-                  <p style="font-size: 14px; margin-bottom: 8px;">
-                    <strong>{html.escape(self.name or '')}</strong> has just created an account.
-                  </p>
-                  <p style="font-size: 13px; color: #555; margin: 0;">
-                    <strong>Email:</strong> {html.escape(str(self.login or self.email or ''))}
-                  </p>
-                </div>
-              </div>
-            </div>
-            """
+        NotifyTemplate = self.env["notify_template"]
+        payload = {
+            "name": self.name or "",
+            "email": str(self.login or self.email or ""),
+            "user_id": self.id,
+        }
 
         # Post message to the created user_evaluation record (preferred)
         try:
-            msg = user_eval.sudo().message_post(
-                body=Markup(html_body),
-                subject="New user signup",
-                subtype_xmlid="mail.mt_note",
-            )
+            msg = NotifyTemplate.post(user_eval, "user_signup", payload)
         except Exception as e:
             _logger.warning("message_post on user_evaluation failed: %s", e)
             msg = None
@@ -111,14 +193,13 @@ class ResUsers(models.Model):
         # Fallback: create mail.message if message_post failed
         if not msg:
             try:
-                msg_vals = {
-                    "model": user_eval._name,
-                    "res_id": user_eval.id,
-                    "body": Markup(html_body),
-                    "subject": "New user signup",
-                    "message_type": "notification",
-                    "partner_ids": [(4, target_partner_id)],
-                }
+                msg_vals = dict(
+                    NotifyTemplate.message_values("user_signup", payload),
+                    model=user_eval._name,
+                    res_id=user_eval.id,
+                    message_type="notification",
+                    partner_ids=[(4, target_partner_id)],
+                )
                 msg = self.env["mail.message"].sudo().create(msg_vals)
             except Exception as e:
                 _logger.error("Failed to create mail.message fallback: %s", e)
@@ -127,19 +208,13 @@ class ResUsers(models.Model):
         # Finally, add a mail.notification for the moderator partner (inbox)
         try:
             if msg and msg.exists():
-                self.env["mail.notification"].sudo().create(
-                    {
-                        "res_partner_id": target_partner_id,
-                        "notification_type": "inbox",
-                        "mail_message_id": msg.id,
-                        "is_read": False,
-                    }
-                )
+                self.env["notify_digest"].deliver(msg, [target_partner_id])
         except Exception as e:
             _logger.warning("Failed to create mail.notification for moderator: %s", e)
 
         return user_eval
 
+    @instrument()
     def _assign_moderator(self):
         """Assign a moderator using round-robin distribution"""
         company_id = self.company_id.id
@@ -205,84 +280,94 @@ class ResUsers(models.Model):
         # Create users
         users = super().create(vals_list)
 
-        # Remove unwanted groups
-        xml_ids_to_remove = [
-            "product.group_product_manager",
-            "base.group_sanitize_override",
-            "website.group_website_designer",
-            "hr.group_hr_manager",
-            "website.group_website_restricted_editor",
-            "hr.group_hr_user",
-        ]
-        group_ids_to_remove = []
-        for xmlid in xml_ids_to_remove:
-            grp = self.env.ref(xmlid, raise_if_not_found=False)
-            if grp:
-                group_ids_to_remove.append(grp.id)
+        # Remove unwanted groups and apply job title groups
+        users._sync_groups_from_job_title()
 
-        if group_ids_to_remove:
-            users.write({"groups_id": [(3, g) for g in group_ids_to_remove]})
+        # Create missing employee records in one batch
+        Employee = self.env["hr.employee"]
+        users_with_employee = set(
+            Employee.with_context(active_test=False)
+            .search([("user_id", "in", users.ids)])
+            .mapped("user_id")
+            .ids
+        )
+        employee_vals_list = [
+            {
+                "name": user.name or user.login,
+                "work_email": user.email or user.login,
+                "user_id": user.id,
+                "job_id": user.hr_job_id.id if user.hr_job_id else False,
+            }
+            for user in users
+            if user.id not in users_with_employee
+        ]
+        if employee_vals_list:
+            Employee.create(employee_vals_list)
 
         # Auto-subscribe to target user
         target_user = self.env["res.users"].browse(2)
         target_partner = target_user.partner_id if target_user.exists() else False
-
-        for user, vals in zip(users, vals_list):
-            # Sync groups from job title
-            if vals.get("hr_job_id"):
-                user._sync_groups_from_job_title()
-
-            # Create employee record
-            if not self.env["hr.employee"].search([("user_id", "=", user.id)], limit=1):
-                self.env["hr.employee"].create(
-                    {
-                        "name": user.name or user.login,
-                        "work_email": user.email or user.login,
-                        "user_id": user.id,
-                        "job_id": user.hr_job_id.id if user.hr_job_id else False,
-                    }
-                )
-
-            # Auto-subscribe to target partner
-            if target_partner and user.partner_id:
+        if target_partner:
+            partner_ids = users.partner_id.ids
+            if partner_ids:
                 target_partner.sudo().write(
-                    {"subscriber_partner_ids": [(4, user.partner_id.id)]}
+                    {"subscriber_partner_ids": [(4, pid) for pid in partner_ids]}
                 )
 
         return users
 
+    @api.model
+    def provision_users(self, vals_list, batch_size=PROVISION_BATCH_SIZE):
+        """
+        Bulk onboarding: create users in batches so groups, employees and subscriptions
+        are handled once per batch instead of once per user.
+        :param vals_list: list of res.users values
+        :param batch_size: number of users created per batch
+        :return: created users
+        """
+        users = self.browse()
+        total = len(vals_list)
+        for start in range(0, total, batch_size):
+            users |= self.create(vals_list[start:start + batch_size])
+            _logger.info(
+                "User provisioning: %s/%s users created", min(start + batch_size, total), total
+            )
+        return users
+
     def write(self, vals):
         res = super(ResUsers, self).write(vals)
 
         if "hr_job_id" in vals:
             self._sync_groups_from_job_title()
 
-        # Sync hr.employee
-        for user in self:
-            employee = self.env["hr.employee"].search(
-                [("user_id", "=", user.id)], limit=1
+        # Values are the same for every user, so each sync is a single write
+        employee_vals = {}
+        if "name" in vals:
+            employee_vals["name"] = vals["name"]
+        if "email" in vals or "login" in vals:
+            employee_vals["work_email"] = vals.get("email") or vals.get("login")
+        if "hr_job_id" in vals:
+            employee_vals["job_id"] = vals["hr_job_id"]
+
+        if employee_vals or "active" in vals:
+            # Fetch the employees of all users at once (archived ones too, to unarchive them)
+            employees = (
+                self.env["hr.employee"]
+                .with_context(active_test=False)
+                .search([("user_id", "in", self.ids)])
             )
-            if employee:
-                employee_vals = {}
-                if "name" in vals:
-                    employee_vals["name"] = vals["name"]
-                if "email" in vals or "login" in vals:
-                    employee_vals["work_email"] = vals.get("email") or vals.get("login")
-                if "hr_job_id" in vals:
-                    employee_vals["job_id"] = vals["hr_job_id"]
-                if employee_vals:
-                    employee.write(employee_vals)
-
-        # Archive or unarchive for employee & partner
-        if "active" in vals:
-            for user in self:
-                employee = self.env["hr.employee"].search(
-                    [("user_id", "=", user.id)], limit=1
+
+            # Sync hr.employee
+            if employee_vals and employees:
+                employees.write(employee_vals)
+
+            # Archive or unarchive for employee & partner
+            if "active" in vals:
+                active = bool(vals["active"])
+                employees.filtered(lambda e: e.active != active).write({"active": active})
+                self.partner_id.filtered(lambda p: p.active != active).write(
+                    {"active": active}
                 )
-                if employee and employee.active != vals["active"]:
-                    employee.active = vals["active"]
-                if user.partner_id and user.partner_id.active != vals["active"]:
-                    user.partner_id.active = vals["active"]
         return res
 
     # Constrains
@@ -311,19 +396,22 @@ class ResUsers(models.Model):
 
     @api.constrains("province_id", "district_id", "commune_id")
     def _check_location_consistency1(self):
+        hierarchy = self.env["administrative_hierarchy"]
         for record in self:
             if record.is_company or not record.user_ids:
                 continue
             if (
                 record.district_id
-                and record.district_id.province_id != record.province_id
+                and hierarchy.province_of_district(record.district_id.id)
+                != record.province_id.id
             ):
                 raise ValidationError(
                     "❌ District does not match the selected province!"
                 )
             if (
                 record.commune_id
-                and record.commune_id.district_id != record.district_id
+                and hierarchy.district_of_commune(record.commune_id.id)
+                != record.district_id.id
             ):
                 raise ValidationError(
                     "❌ Commune does not match the selected district!"
@@ -333,21 +421,22 @@ class ResUsers(models.Model):
         "province_resident_id", "district_resident_id", "commune_resident_id"
     )
     def _check_location_consistency2(self):
+        hierarchy = self.env["administrative_hierarchy"]
         for record in self:
             if record.is_company or not record.user_ids:
                 continue
             if (
                 record.district_resident_id
-                and record.district_resident_id.province_id
-                != record.province_resident_id
+                and hierarchy.province_of_district(record.district_resident_id.id)
+                != record.province_resident_id.id
             ):
                 raise ValidationError(
                     "❌ District does not match the selected province!"
                 )
             if (
                 record.commune_resident_id
-                and record.commune_resident_id.district_id
-                != record.district_resident_id
+                and hierarchy.district_of_commune(record.commune_resident_id.id)
+                != record.district_resident_id.id
             ):
                 raise ValidationError(
                     "❌ Commune does not match the selected district!"
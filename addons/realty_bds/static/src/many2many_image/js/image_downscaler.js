@@ -0,0 +1,85 @@
+const WORKER_URL = "/realty_bds/static/src/many2many_image/worker/image_resize_worker.js";
+
+const EXTENSIONS = {
+	"image/webp": "webp",
+	"image/jpeg": "jpg",
+};
+
+/**
+ * Runs image_resize_worker.js and turns its answers back into File objects.
+ * Without Worker/OffscreenCanvas support (or on any error) files are returned untouched.
+ */
+export class ImageDownscaler {
+	constructor({ maxEdge = 1920, quality = 0.82 } = {}) {
+		this.maxEdge = maxEdge;
+		this.quality = quality;
+		this.worker = null;
+		this.pending = new Map();
+		this.nextId = 1;
+	}
+
+	get isSupported() {
+		return (
+			typeof Worker !== "undefined" &&
+			typeof OffscreenCanvas !== "undefined" &&
+			typeof createImageBitmap !== "undefined"
+		);
+	}
+
+	getWorker() {
+		if (!this.worker) {
+			this.worker = new Worker(WORKER_URL);
+			this.worker.onmessage = ({ data }) => {
+				const resolve = this.pending.get(data.id);
+				this.pending.delete(data.id);
+				resolve?.(data);
+			};
+			this.worker.onerror = (error) => {
+				console.warn("Image worker failed, uploading originals:", error);
+				for (const resolve of this.pending.values()) {
+					resolve({ error: error.message });
+				}
+				this.pending.clear();
+				this.destroy();
+			};
+		}
+		return this.worker;
+	}
+
+	renameFile(name, mimetype) {
+		const extension = EXTENSIONS[mimetype];
+		if (!extension) {
+			return name;
+		}
+		const dot = name.lastIndexOf(".");
+		return `${dot > 0 ? name.slice(0, dot) : name}.${extension}`;
+	}
+
+	async process(file) {
+		if (!this.isSupported || !file.type.startsWith("image/")) {
+			return file;
+		}
+		const id = this.nextId++;
+		const result = await new Promise((resolve) => {
+			this.pending.set(id, resolve);
+			this.getWorker().postMessage({
+				id,
+				file,
+				maxEdge: this.maxEdge,
+				quality: this.quality,
+			});
+		});
+		if (result.error || !result.resized) {
+			return file;
+		}
+		return new File([result.blob], this.renameFile(file.name, result.mimetype), {
+			type: result.mimetype,
+			lastModified: file.lastModified,
+		});
+	}
+
+	destroy() {
+		this.worker?.terminate();
+		this.worker = null;
+	}
+}
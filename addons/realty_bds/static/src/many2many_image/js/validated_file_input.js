@@ -1,5 +1,9 @@
-import { Component, onMounted, useRef, useState } from "@odoo/owl";
+import { Component, onMounted, onWillUnmount, useRef, useState } from "@odoo/owl";
 import { useFileUploader } from "@web/core/utils/files";
+import { rpc } from "@web/core/network/rpc";
+import { ImageDownscaler } from "./image_downscaler";
+
+const CHUNK_RETRIES = 5;
 
 export class ValidatedFileInput extends Component {
 	static template = "web.FileInput";
@@ -9,10 +13,15 @@ export class ValidatedFileInput extends Component {
 		multiUpload: false,
 		onUpload: () => {},
 		onValidationError: () => {},
-		route: "/web/binary/upload_attachment",
+		route: "/realty/attachment/upload",
+		claimRoute: "/realty/attachment/claim",
+		chunkRoute: "/realty/attachment/chunk",
 		beforeOpen: async () => true,
 		maxFiles: null,
 		maxFileSize: null,
+		downscaleImages: true,
+		maxImageEdge: 1920,
+		imageQuality: 0.82,
 	};
 	static props = {
 		onMounted: { type: Function, optional: true },
@@ -26,8 +35,13 @@ export class ValidatedFileInput extends Component {
 		resId: { type: Number, optional: true },
 		resModel: { type: String, optional: true },
 		route: { type: String, optional: true },
+		claimRoute: { type: String, optional: true },
+		chunkRoute: { type: String, optional: true },
 		maxFiles: { type: Number, optional: true },
 		maxFileSize: { type: Number, optional: true },
+		downscaleImages: { type: Boolean, optional: true },
+		maxImageEdge: { type: Number, optional: true },
+		imageQuality: { type: Number, optional: true },
 		"*": true,
 	};
 
@@ -37,6 +51,14 @@ export class ValidatedFileInput extends Component {
 		this.state = useState({
 			isDisable: false,
 		});
+		this.downscaler = new ImageDownscaler({
+			maxEdge: this.props.maxImageEdge,
+			quality: this.props.imageQuality,
+		});
+		this.savedBytes = 0;
+		// Size before downscaling of each file to upload, for the per-file chunked report
+		this.originalSizes = new WeakMap();
+		onWillUnmount(() => this.downscaler.destroy());
 
 		onMounted(() => {
 			if (this.props.autoOpen) {
@@ -62,9 +84,99 @@ export class ValidatedFileInput extends Component {
 		if (resId !== undefined) {
 			params.id = resId;
 		}
+		// Reported in the server upload log next to its own processing time
+		params.saved_bytes = this.savedBytes;
 		return params;
 	}
 
+	// SHA-1 of the file bytes, the checksum the server stores (null if unavailable)
+	async computeChecksum(file) {
+		if (!window.crypto?.subtle) {
+			return null;
+		}
+		const digest = await window.crypto.subtle.digest("SHA-1", await file.arrayBuffer());
+		return Array.from(new Uint8Array(digest))
+			.map((byte) => byte.toString(16).padStart(2, "0"))
+			.join("");
+	}
+
+	// Ask the server to reuse images it already stores; returns the files still to upload
+	async claimExistingFiles(files, checksums) {
+		const { resId, resModel } = this.props;
+		const all = files.map((file, index) => ({ file, checksum: checksums[index] }));
+		const withChecksum = all.filter(({ checksum }) => checksum);
+		if (!resModel || !this.props.claimRoute || !withChecksum.length) {
+			return { claimed: [], toUpload: all };
+		}
+		try {
+			const { claimed, missing } = await rpc(this.props.claimRoute, {
+				model: resModel,
+				id: resId || 0,
+				files: withChecksum.map(({ file, checksum }) => ({
+					checksum,
+					filename: file.name,
+				})),
+			});
+			const missingSet = new Set(missing);
+			const toUpload = all.filter(({ checksum }) => !checksum || missingSet.has(checksum));
+			return { claimed, toUpload };
+		} catch (error) {
+			console.warn("Checksum claim failed, uploading everything:", error);
+			return { claimed: [], toUpload: all };
+		}
+	}
+
+	// Send one chunk, retrying with a growing delay on network errors
+	async sendChunk(checksum, index, chunk) {
+		const chunkChecksum = await this.computeChecksum(chunk);
+		for (let attempt = 1; ; attempt++) {
+			const body = new FormData();
+			body.append("csrf_token", odoo.csrf_token);
+			body.append("checksum", checksum);
+			body.append("index", index);
+			body.append("chunk_checksum", chunkChecksum);
+			body.append("chunk", chunk);
+			try {
+				const response = await fetch(this.props.chunkRoute, { method: "POST", body });
+				const result = await response.json();
+				if (result.error) {
+					throw new Error(result.error);
+				}
+				return result.index;
+			} catch (error) {
+				if (attempt >= CHUNK_RETRIES) {
+					throw error;
+				}
+				await new Promise((resolve) => setTimeout(resolve, 1000 * 2 ** attempt));
+			}
+		}
+	}
+
+	// Resumable upload: the server keeps acknowledged chunks under the file checksum,
+	// so a retry (even after a reload) only sends what is missing
+	async uploadChunked(file, checksum) {
+		const { resId, resModel } = this.props;
+		const { chunk_size, received } = await rpc(`${this.props.chunkRoute}/status`, {
+			checksum,
+		});
+		const count = Math.max(1, Math.ceil(file.size / chunk_size));
+		const acknowledged = new Set(received);
+		for (let index = 0; index < count; index++) {
+			if (!acknowledged.has(index)) {
+				const start = index * chunk_size;
+				await this.sendChunk(checksum, index, file.slice(start, start + chunk_size));
+			}
+		}
+		return rpc(`${this.props.chunkRoute}/finish`, {
+			checksum,
+			count,
+			filename: file.name,
+			model: resModel,
+			id: resId || 0,
+			saved_bytes: (this.originalSizes.get(file) ?? file.size) - file.size,
+		});
+	}
+
 	// Format bytes to human-readable format
 	formatFileSize(bytes) {
 		if (bytes === 0) return "0 Bytes";
@@ -109,13 +221,15 @@ export class ValidatedFileInput extends Component {
 		const allFiles = Array.from(fileList);
 		const errors = [];
 		const validFiles = [];
+		let originalBytes = 0;
+		let uploadBytes = 0;
 
 		// Process files in order
-		for (const file of allFiles) {
+		for (const selectedFile of allFiles) {
 			// Check if we've reached max files limit
 			if (this.props.maxFiles && validFiles.length >= this.props.maxFiles) {
 				errors.push({
-					file,
+					file: selectedFile,
 					error: new Error(
 						`Skipped - Only ${this.props.maxFiles} file(s) allowed`
 					),
@@ -123,6 +237,11 @@ export class ValidatedFileInput extends Component {
 				continue;
 			}
 
+			// Downscale before the size check: a 10 MB phone photo usually fits once resized
+			const file = this.props.downscaleImages
+				? await this.downscaler.process(selectedFile)
+				: selectedFile;
+
 			// Check file size
 			if (this.props.maxFileSize && file.size > this.props.maxFileSize) {
 				errors.push({
@@ -138,6 +257,18 @@ export class ValidatedFileInput extends Component {
 
 			// All checks passed
 			validFiles.push(file);
+			this.originalSizes.set(file, selectedFile.size);
+			originalBytes += selectedFile.size;
+			uploadBytes += file.size;
+		}
+
+		this.savedBytes = originalBytes - uploadBytes;
+		if (this.savedBytes > 0) {
+			console.info(
+				`Images downscaled before upload: ${this.formatFileSize(
+					originalBytes
+				)} -> ${this.formatFileSize(uploadBytes)}`
+			);
 		}
 
 		// Report validation errors
@@ -148,14 +279,28 @@ export class ValidatedFileInput extends Component {
 		try {
 			// Upload valid files if any
 			if (validFiles.length > 0) {
-				const httpParams = this.getHttpParams(validFiles);
-				const parsedFileData = await this.uploadFiles(
-					this.props.route,
-					httpParams
+				const checksums = await Promise.all(
+					validFiles.map((file) => this.computeChecksum(file))
 				);
+				// Images already on the server are attached without sending their bytes
+				const { claimed, toUpload } = await this.claimExistingFiles(validFiles, checksums);
+
+				// Chunked when the file can be identified by its checksum, one multipart post otherwise
+				const canChunk = ({ checksum }) =>
+					checksum && this.props.chunkRoute && this.props.resModel;
+				const uploaded = [];
+				for (const { file, checksum } of toUpload.filter(canChunk)) {
+					uploaded.push(await this.uploadChunked(file, checksum));
+				}
+				const plainFiles = toUpload.filter((item) => !canChunk(item)).map(({ file }) => file);
+				let parsedFileData = [];
+				if (plainFiles.length > 0) {
+					const httpParams = this.getHttpParams(plainFiles);
+					parsedFileData = await this.uploadFiles(this.props.route, httpParams);
+				}
 
 				if (parsedFileData) {
-					this.props.onUpload(parsedFileData, validFiles);
+					this.props.onUpload([...claimed, ...uploaded, ...parsedFileData], validFiles);
 				}
 			}
 		} catch (uploadError) {
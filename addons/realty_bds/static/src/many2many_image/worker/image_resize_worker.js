@@ -0,0 +1,51 @@
+/* Web Worker: downscale and re-encode gallery images off the main thread.
+ * Loaded by URL (not bundled): plain script, no module imports.
+ *
+ * Message in:  { id, file: Blob, maxEdge, quality }
+ * Message out: { id, blob, mimetype, width, height, resized } or { id, error }
+ */
+
+// Formats that decode to a single still frame (GIF may be animated: never touched)
+const RESIZABLE_MIMETYPES = ["image/jpeg", "image/png", "image/webp", "image/bmp"];
+
+async function encode(canvas, mimetype, quality) {
+	const blob = await canvas.convertToBlob({ type: mimetype, quality });
+	// Browsers without an encoder for the type silently return PNG
+	return blob.type === mimetype ? blob : null;
+}
+
+async function downscale({ file, maxEdge, quality }) {
+	if (!RESIZABLE_MIMETYPES.includes(file.type)) {
+		return { blob: file, mimetype: file.type, resized: false };
+	}
+	const bitmap = await createImageBitmap(file);
+	const ratio = Math.min(1, maxEdge / Math.max(bitmap.width, bitmap.height));
+	const width = Math.round(bitmap.width * ratio);
+	const height = Math.round(bitmap.height * ratio);
+
+	const canvas = new OffscreenCanvas(width, height);
+	const context = canvas.getContext("2d");
+	context.imageSmoothingQuality = "high";
+	context.drawImage(bitmap, 0, 0, width, height);
+	bitmap.close();
+
+	// WebP keeps PNG transparency; JPEG is only a fallback for opaque formats
+	let blob = await encode(canvas, "image/webp", quality);
+	if (!blob && file.type !== "image/png") {
+		blob = await encode(canvas, "image/jpeg", quality);
+	}
+	// Keep the original when re-encoding does not pay off
+	if (!blob || (ratio === 1 && blob.size >= file.size)) {
+		return { blob: file, mimetype: file.type, width, height, resized: false };
+	}
+	return { blob, mimetype: blob.type, width, height, resized: true };
+}
+
+self.onmessage = async (event) => {
+	const { id } = event.data;
+	try {
+		self.postMessage({ id, ...(await downscale(event.data)) });
+	} catch (error) {
+		self.postMessage({ id, error: error.message || String(error) });
+	}
+};
@@ -0,0 +1,23 @@
+import { registry } from "@web/core/registry";
+
+/**
+ * Inbox pings of the notification fan-out (notify_fanout): the payload only names the
+ * message, so open inboxes fetch it themselves instead of the server formatting it
+ * for every subscriber.
+ */
+export const realtyNotifyInboxService = {
+	dependencies: ["bus_service", "mail.store"],
+	start(env, { bus_service: busService, "mail.store": store }) {
+		busService.subscribe("realty_notify/inbox", (payload, { id: notifId }) => {
+			const inbox = store.inbox;
+			if (notifId > inbox.counter_bus_id) {
+				inbox.counter++;
+			}
+			if (inbox.isLoaded) {
+				inbox.fetchNewMessages();
+			}
+		});
+	},
+};
+
+registry.category("services").add("realty_notify_inbox", realtyNotifyInboxService);
@@ -0,0 +1,2 @@
+from . import test_benchmark_hot_paths
+from . import test_display_price
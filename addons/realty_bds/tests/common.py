@@ -0,0 +1,135 @@
+import json
+import logging
+import os
+import subprocess
+import time
+
+from odoo.tests.common import TransactionCase  # type: ignore
+from odoo.tools import config  # type: ignore
+
+_logger = logging.getLogger(__name__)
+
+# Production-like volumes, multiplied by REALTY_BENCH_SCALE (e.g. 0.01 for a quick local run)
+BENCH_VOLUMES = {
+    "listings": 200000,
+    "comments": 1000000,
+    "users": 50000,
+    "communes": 10000,
+    "attachments": 500000,
+}
+
+
+def percentile(values, ratio):
+    ordered = sorted(values)
+    if not ordered:
+        return 0
+    return ordered[min(len(ordered) - 1, int(round(ratio * (len(ordered) - 1))))]
+
+
+class RealtyBenchmarkCase(TransactionCase):
+    """
+    Seeds production-like volumes with the realty_data_generator (rolled back with the test class)
+    and records p50/p95 timings and query counts of the measured calls into a JSON file.
+    Output: REALTY_BENCH_OUTPUT, or <data_dir>/realty_benchmark/<label>.json
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.scale = float(os.environ.get("REALTY_BENCH_SCALE", "1"))
+        cls.volumes = {
+            key: max(1, int(value * cls.scale)) for key, value in BENCH_VOLUMES.items()
+        }
+        cls.results = {}
+        start = time.perf_counter()
+        cls._seed()
+        cls.env.invalidate_all()
+        cls.seed_seconds = round(time.perf_counter() - start, 1)
+        _logger.info("Realty benchmark seeded %s in %ss", cls.volumes, cls.seed_seconds)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._write_results()
+        super().tearDownClass()
+
+    # Seeding
+    @classmethod
+    def _seed(cls):
+        data = cls.env["realty_data_generator"].generate(volumes=cls.volumes, prefix="Bench")
+        cls.agent = data["owner"]
+        cls.listing = data["listing"]
+        for key in (
+            "user_ids",
+            "district_ids",
+            "commune_ids",
+            "listing_ids",
+            "attachment_ids",
+            "top_comment_ids",
+        ):
+            setattr(cls, key, data[key])
+
+    # Measurement
+    def measure(self, name, func, runs=20, warmup=2):
+        """
+        Call func(run_index) runs times after warmup calls, each with an empty ORM cache,
+        and record p50/p95 wall time (ms) and SQL query counts under name.
+        """
+        cr = self.env.cr
+        for run in range(warmup):
+            func(run)
+        timings, queries = [], []
+        for run in range(runs):
+            self.env.invalidate_all()
+            query_count = cr.sql_log_count
+            start = time.perf_counter()
+            func(run)
+            timings.append((time.perf_counter() - start) * 1000)
+            queries.append(cr.sql_log_count - query_count)
+        result = {
+            "runs": runs,
+            "p50_ms": round(percentile(timings, 0.5), 3),
+            "p95_ms": round(percentile(timings, 0.95), 3),
+            "max_ms": round(max(timings), 3),
+            "queries_p50": percentile(queries, 0.5),
+            "queries_max": max(queries),
+        }
+        type(self).results[name] = result
+        _logger.info("Realty benchmark %s: %s", name, result)
+        return result
+
+    @classmethod
+    def _write_results(cls):
+        label = os.environ.get("REALTY_BENCH_LABEL") or cls._git_revision() or time.strftime(
+            "%Y%m%d-%H%M%S"
+        )
+        path = os.environ.get("REALTY_BENCH_OUTPUT") or os.path.join(
+            config["data_dir"], "realty_benchmark", f"{label}.json"
+        )
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as output:
+            json.dump(
+                {
+                    "label": label,
+                    "database": cls.env.cr.dbname,
+                    "scale": cls.scale,
+                    "volumes": cls.volumes,
+                    "seed_seconds": cls.seed_seconds,
+                    "results": cls.results,
+                },
+                output,
+                indent=2,
+                sort_keys=True,
+            )
+        _logger.info("Realty benchmark results written to %s", path)
+
+    @staticmethod
+    def _git_revision():
+        try:
+            return subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=os.path.dirname(__file__),
+                stderr=subprocess.DEVNULL,
+                text=True,
+            ).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
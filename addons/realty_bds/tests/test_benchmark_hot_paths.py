@@ -0,0 +1,128 @@
+import random
+from unittest.mock import patch
+
+from odoo.tests import tagged  # type: ignore
+from odoo.addons.realty_bds.controllers.realtycontroller_binary import (  # type: ignore
+    AttachmentSecurityService,
+)
+
+from .common import RealtyBenchmarkCase
+
+
+@tagged("-standard", "-at_install", "post_install", "realty_benchmark")
+class TestRealtyBenchmark(RealtyBenchmarkCase):
+    """
+    Hot paths of realty_bds at production volumes. Not part of the standard run:
+        odoo-bin -d <db> -i realty_bds --test-tags realty_benchmark --stop-after-init
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.rng = random.Random(42)
+        self.agent_env = self.env(user=self.agent)
+
+    def test_product_filter_search(self):
+        Product = self.agent_env["product.template"]
+
+        def run(index):
+            district_id = self.district_ids[index % len(self.district_ids)]
+            Product.search_read(
+                [
+                    ("approval", "=", "approved"),
+                    ("district_id", "=", district_id),
+                    ("list_price", ">=", 5),
+                    ("list_price", "<=", 40),
+                ],
+                ["name", "display_price", "price_per_sqm", "attributes", "address"],
+                limit=80,
+                order="absolute_price desc",
+            )
+
+        self.measure("product_filter_search", run)
+
+    def test_product_card_feed(self):
+        Product = self.agent_env["product.template"]
+
+        def run(index):
+            district_id = self.district_ids[index % len(self.district_ids)]
+            Product.get_card_feed(
+                [("approval", "=", "approved"), ("district_id", "=", district_id)],
+                limit=80,
+                order="absolute_price desc",
+            )
+
+        self.measure("product_card_feed", run)
+
+    def test_comment_paging(self):
+        Comment = self.agent_env["realty_comment"]
+        hot_listing = self.listing.id
+
+        def run(index):
+            Comment.get_top_level_page("product.template", hot_listing, limit=10, offset=index * 10)
+
+        self.measure("comment_paging_first_pages", run)
+        self.measure(
+            "comment_paging_deep",
+            lambda index: Comment.get_top_level_page(
+                "product.template", hot_listing, limit=10, offset=10000 + index * 10
+            ),
+        )
+
+    def test_like_toggle(self):
+        Comment = self.agent_env["realty_comment"]
+        comment_ids = self.top_comment_ids[:10]
+        self.measure(
+            "comment_like_toggle",
+            lambda index: Comment.action_toggle_like(comment_ids[index % len(comment_ids)]),
+        )
+
+    def test_protected_image_access(self):
+        attachment_ids = self.attachment_ids
+
+        def run(index):
+            attachment_id = attachment_ids[self.rng.randrange(len(attachment_ids))]
+            AttachmentSecurityService.check_fast_path_access(
+                self.agent_env, attachment_id, "product.template", "img_ids"
+            )
+
+        self.measure("protected_image_access_check", run, runs=50)
+
+    def test_moderator_assignment(self):
+        # Sequential: the lock and sequence cost per submission. Contention between
+        # concurrent transactions needs committed data, outside of a TransactionCase.
+        listing = self.listing.with_env(self.agent_env)
+        self.measure("moderator_assignment", lambda index: listing._assign_moderator())
+
+    def test_provision_users(self):
+        Users = self.env["res.users"].with_context(no_reset_password=True)
+        batch_size = 50
+
+        def run(index):
+            Users.provision_users(
+                [
+                    {
+                        "name": f"Bench signup {index}-{n}",
+                        "login": f"bench_signup_{index}_{n}",
+                        "citizen_id": f"97{index:05d}{n:05d}",
+                    }
+                    for n in range(batch_size)
+                ],
+                batch_size=batch_size,
+            )
+
+        self.measure("signup_provision_50_users", run, runs=5, warmup=1)
+
+    def test_attachment_recycle(self):
+        # The garbage collector replaced the data_recycle rules; its batch commits
+        # are neutralized so the run stays inside the test transaction, and the blobs
+        # of the rolled back rows are only marked, never removed from the filestore.
+        Attachment = self.env["ir.attachment"]
+        with patch.object(self.env.cr, "commit", lambda: None):
+            self.measure(
+                "attachment_gc",
+                lambda index: Attachment._gc_realty_attachments(
+                    batch_size=5000, collect_files=False
+                ),
+                runs=1,
+                warmup=0,
+            )
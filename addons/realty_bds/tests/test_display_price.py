@@ -0,0 +1,26 @@
+from odoo.tests.common import TransactionCase  # type: ignore
+
+
+class TestDisplayPrice(TransactionCase):
+    """Formatting of the stored product.template display_price."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.unit_price = cls.env["unit_price"].create({"name": "Billion", "multiplier": 1000000000})
+
+    def _display_price(self, list_price, position):
+        # Codes outside ISO 4217, so they never clash with the base currencies
+        currency = self.env["res.currency"].create(
+            {"name": f"XR{position[0].upper()}", "symbol": "¤", "position": position}
+        )
+        listing = self.env["product.template"].new(
+            {"list_price": list_price, "currency_id": currency.id, "unit_price_id": self.unit_price.id}
+        )
+        return listing.display_price
+
+    def test_symbol_before(self):
+        self.assertEqual(self._display_price(5, "before"), "¤ 5 billion")
+
+    def test_symbol_after(self):
+        self.assertEqual(self._display_price(2.5, "after"), "2.5 billion ¤")